@@ -78,6 +78,10 @@ def main():
                         help="Don't render the image (default: False)")
     parser.add_argument('--save', '-s', default='', type=str, metavar='',
                         help="Save .blend file [ex: molecule.blend] (default: don't save)")
+    parser.add_argument('--workers', '-w', default=1, type=int, metavar='',
+                        help="Number of Blender processes for video rendering (default: 1)")
+    parser.add_argument('--cache', default=None, type=str, metavar='',
+                        help="Render cache directory to reuse rendered images (default: no cache)")
     parser.add_argument('--verbose', '-v', action='store_true', default=False,
                         help="Verbosity  (default: False)")
 
@@ -110,13 +114,13 @@ def main():
             traj = rotation(mol, args.rotate[4], args.rotate[0], rot_axis, interpolation='linear')
         else:
             traj = Trajectory(read=args.molecule)
-        render(traj, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose)
+        render(traj, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose, workers=args.workers, cache=args.cache)
     else:
         if os.path.splitext(args.molecule)[1] == '.pdb':
             blend.run()
         elif os.path.splitext(args.molecule)[1] == '.xyz':
             mol = Molecule(read=args.molecule)
-            render(mol, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose)
+            render(mol, os.path.splitext(args.molecule)[0], renderer=blend, verbose=args.verbose, cache=args.cache)
         else:
             print('File format not supported for -> %s' % args.molecule)
 
@@ -7,7 +7,7 @@ import shutil
 import numpy as np
 
 from angstrom import Trajectory
-from angstrom.geometry import Quaternion
+from angstrom.geometry import rotate
 
 
 
@@ -22,12 +22,11 @@ def rotation(mol, n_frames, rot_angle, rot_axis, interpolation='linear'):
         x = np.arange(-np.pi / 2, np.pi / 2, np.pi / n_frames)
         angles = a * np.pi / 2 * np.sin(x) + (np.pi / 2) * a
     n_atoms = len(mol.atoms)
-    motion = np.zeros((n_frames + 1, n_atoms, 3))
-    Q = Quaternion([0, 1, 1, 1])
+    motion = np.zeros((n_frames, n_atoms, 3))
+    coordinates = np.asarray(mol.coordinates, dtype=float)
     for d_angle, frame in zip(angles, range(n_frames)):
-        motion[frame] = np.array([Q.rotation(coor, rot_axis, d_angle).np() for coor in mol.coordinates])
-    traj = Trajectory(atoms=np.tile(mol.atoms, n_frames).reshape((n_frames, n_atoms)),
-                  coordinates=motion)
+        rotate(coordinates, rot_axis, d_angle, out=motion[frame])
+    traj = Trajectory(atoms=mol.atoms, coordinates=motion)
     return traj
 
 
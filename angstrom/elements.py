@@ -0,0 +1,105 @@
+"""
+--- Ångström ---
+Element property table for Ångström Python package.
+Element properties are stored in arrays indexed by atomic number so that properties
+of many atoms can be looked up at once with integer atom codes (ex: np.take(MASSES, codes)).
+Index 0 is a placeholder for unknown elements.
+"""
+import numpy as np
+
+
+# Element symbols ordered by atomic number
+SYMBOLS = ['X', 'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne', 'Na', 'Mg', 'Al', 'Si', 'P',
+           'S', 'Cl', 'Ar', 'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn',
+           'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr', 'Nb', 'Mo', 'Tc', 'Ru', 'Rh',
+           'Pd', 'Ag', 'Cd', 'In', 'Sn', 'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd',
+           'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu', 'Hf', 'Ta', 'W', 'Re',
+           'Os', 'Ir', 'Pt', 'Au', 'Hg', 'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th',
+           'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr', 'Rf', 'Db',
+           'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og']
+
+# Standard atomic weights (same values as the periodictable package)
+MASSES = np.array([0.0, 1.008, 4.002602, 6.94, 9.0121831, 10.81, 12.011, 14.007, 15.999,
+                   18.998403162, 20.1797, 22.98976928, 24.305, 26.9815384, 28.085, 30.973761998,
+                   32.06, 35.45, 39.95, 39.0983, 40.078, 44.955907, 47.867, 50.9415, 51.9961,
+                   54.938043, 55.845, 58.933194, 58.6934, 63.546, 65.38, 69.723, 72.63, 74.921595,
+                   78.971, 79.904, 83.798, 85.4678, 87.62, 88.905838, 91.224, 92.90637, 95.95, 98.0,
+                   101.07, 102.90549, 106.42, 107.8682, 112.414, 114.818, 118.71, 121.76, 127.6,
+                   126.90447, 131.293, 132.90545196, 137.327, 138.90547, 140.116, 140.90766,
+                   144.242, 145.0, 150.36, 151.964, 157.25, 158.925354, 162.5, 164.930329, 167.259,
+                   168.934219, 173.045, 174.9668, 178.486, 180.94788, 183.84, 186.207, 190.23,
+                   192.217, 195.084, 196.96657, 200.592, 204.38, 207.2, 208.9804, 209.0, 210.0,
+                   222.0, 223.0, 226.0, 227.0, 232.0377, 231.03588, 238.02891, 237.0, 244.0, 243.0,
+                   247.0, 247.0, 251.0, 252.0, 257.0, 258.0, 259.0, 262.0, 261.0, 262.0, 266.0,
+                   264.0, 277.0, 268.0, 281.0, 272.0, 285.0, 286.0, 289.0, 289.0, 293.0, 294.0,
+                   294.0])
+
+# Molecular Single-Bond Covalent Radii for Elements 1-118 by Pyykko et al. doi: 10.1002/chem.200800987
+rcov = {'H': 0.32, 'He': 0.46, 'Li': 1.33, 'Be': 1.02, 'B': 0.85, 'C': 0.75, 'N': 0.71,
+        'O': 0.63, 'F': 0.64, 'Ne': 0.67, 'Na': 1.55, 'Mg': 1.39, 'Al': 1.26, 'Si': 1.16,
+        'P': 1.11, 'S': 1.03, 'Cl': 0.99, 'Ar': 0.96, 'K': 1.96, 'Ca': 1.71, 'Sc': 1.48,
+        'Ti': 1.36, 'V': 1.34, 'Cr': 1.22, 'Mn': 1.19, 'Fe': 1.16, 'Co': 1.11, 'Ni': 1.10,
+        'Cu': 1.12, 'Zn': 1.18, 'Ga': 1.24, 'Ge': 1.21, 'As': 1.21, 'Se': 1.16, 'Br': 1.14,
+        'Kr': 1.17, 'Rb': 2.10, 'Sr': 1.85, 'Y': 1.63, 'Zr': 1.54, 'Nb': 1.47, 'Mo': 1.38,
+        'Tc': 1.28, 'Ru': 1.25, 'Rh': 1.25, 'Pd': 1.20, 'Ag': 1.28, 'Cd': 1.36, 'In': 1.42,
+        'Sn': 1.40, 'Sb': 1.40, 'Te': 1.36, 'I': 1.33, 'Xe': 1.31, 'Cs': 2.32, 'Ba': 1.96,
+        'Hf': 1.52, 'Ta': 1.46, 'W': 1.37, 'Re': 1.31, 'Os': 1.29, 'Ir': 1.22, 'Pt': 1.23,
+        'Au': 1.24, 'Hg': 1.33, 'Tl': 1.44, 'Pb': 1.44, 'Bi': 1.51, 'Po': 1.45, 'At': 1.47,
+        'Ru': 1.42, 'Fr': 2.23, 'Ra': 2.01, 'Rf': 1.57, 'Db': 1.49, 'Sg': 1.43, 'Bh': 1.41,
+        'Hs': 1.34, 'Mt': 1.29, 'Ds': 1.28, 'Rg': 1.21, 'La': 1.80, 'Ce': 1.63, 'Pr': 1.76,
+        'Nd': 1.74, 'Pm': 1.73, 'Sm': 1.72, 'Eu': 1.68, 'Gd': 1.69, 'Tb': 1.68, 'Dy': 1.67,
+        'Ho': 1.66, 'Er': 1.65, 'Tm': 1.64, 'Yb': 1.70, 'Lu': 1.62, 'Ac': 1.86, 'Th': 1.75,
+        'Pa': 1.69, 'U': 1.70, 'Np': 1.17, 'Pu': 1.72, 'Am': 1.66, 'Cm': 1.66, 'Bk': 1.68,
+        'Cf': 1.68, 'Es': 1.65, 'Fm': 1.67, 'Md': 1.73, 'No': 1.76, 'Lr': 1.61}
+
+# Atomic number of each element symbol
+ATOMIC_NUMBERS = {symbol: number for number, symbol in enumerate(SYMBOLS) if number > 0}
+
+# Covalent radii ordered by atomic number (NaN for elements without a covalent radius)
+RADII = np.array([rcov.get(symbol, np.nan) for symbol in SYMBOLS])
+
+
+def atom_codes(atoms):
+    """
+    Convert element symbols to integer atom codes (atomic numbers).
+    Each unique symbol is looked up only once.
+
+    Parameters
+    ----------
+    atoms : list
+        List of element symbols.
+
+    Returns
+    -------
+    ndarray
+        Atomic number of each atom (int16) with shape (N,).
+
+    """
+    symbols, inverse = np.unique(np.asarray(atoms, dtype=str), return_inverse=True)
+    unknown = [s for s in symbols if s not in ATOMIC_NUMBERS]
+    if len(unknown) > 0:
+        raise Exception('Unknown element(s): %s' % ', '.join(unknown))
+    codes = np.array([ATOMIC_NUMBERS[s] for s in symbols], dtype=np.int16)
+    return codes[inverse.reshape(-1)]
+
+
+def get_masses(atoms=None, codes=None):
+    """
+    Get atomic masses for given element symbols or atom codes.
+
+    Parameters
+    ----------
+    atoms : list or None
+        List of element symbols.
+    codes : ndarray or None
+        Integer atom codes (used instead of atoms if given).
+
+    Returns
+    -------
+    ndarray
+        Atomic masses with shape (N,).
+
+    """
+    if codes is None:
+        codes = atom_codes(atoms)
+    return np.take(MASSES, codes)
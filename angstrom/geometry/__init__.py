@@ -3,5 +3,7 @@
 Geometric operations for Ångström Python package.
 """
 from .geometry import get_molecule_center, align_vectors
-from .quaternion import Quaternion
+from .quaternion import Quaternion, QuaternionArray
 from .plane import Plane
+from .rotation import rotate, rotation_matrix
+from .descriptors import center_of_mass, radius_of_gyration, inertia_tensor, principal_axes, bounding_box, get_descriptors
@@ -0,0 +1,198 @@
+"""
+--- Ångström ---
+Batched geometric descriptors for Ångström Python package.
+Descriptors are calculated for all frames of a (F, N, 3) coordinate block at once.
+Frames are processed in chunks so memory-mapped or lazily read trajectories are never loaded at once.
+"""
+import numpy as np
+
+
+# Maximum number of coordinate values (F * N * 3) processed at once
+CHUNK_SIZE = 2**22
+
+# Descriptor names and their shape for a single frame
+DESCRIPTORS = ['center', 'radius_of_gyration', 'inertia_tensor', 'principal_moments', 'principal_axes', 'bounding_box']
+SHAPES = {'center': (3,), 'radius_of_gyration': (), 'inertia_tensor': (3, 3),
+          'principal_moments': (3,), 'principal_axes': (3, 3), 'bounding_box': (2, 3)}
+
+
+def center_of_mass(coordinates, masses=None, chunk=None):
+    """
+    Calculate center of mass (or geometric center) for each frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    masses : ndarray or None
+        Atomic masses with shape (N,). If None geometric center is calculated.
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    ndarray
+        Center coordinates with shape (3,) or (F, 3).
+
+    """
+    return _calculate(coordinates, masses, chunk, ['center'])['center']
+
+
+def radius_of_gyration(coordinates, masses=None, chunk=None):
+    """
+    Calculate radius of gyration for each frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    masses : ndarray or None
+        Atomic masses with shape (N,). If None all atoms have the same weight.
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    float or ndarray
+        Radius of gyration or radius of gyration for each frame with shape (F,).
+
+    """
+    return _calculate(coordinates, masses, chunk, ['radius_of_gyration'])['radius_of_gyration']
+
+
+def inertia_tensor(coordinates, masses=None, chunk=None):
+    """
+    Calculate moment of inertia tensor around the center of mass for each frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    masses : ndarray or None
+        Atomic masses with shape (N,). If None all atoms have unit mass.
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    ndarray
+        Inertia tensor with shape (3, 3) or (F, 3, 3).
+
+    """
+    return _calculate(coordinates, masses, chunk, ['inertia_tensor'])['inertia_tensor']
+
+
+def principal_axes(coordinates, masses=None, chunk=None):
+    """
+    Calculate principal moments of inertia and principal axes for each frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    masses : ndarray or None
+        Atomic masses with shape (N,). If None all atoms have unit mass.
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    tuple
+        Principal moments in ascending order with shape (3,) or (F, 3) and
+        principal axes (one axis per row) with shape (3, 3) or (F, 3, 3).
+
+    """
+    results = _calculate(coordinates, masses, chunk, ['principal_moments', 'principal_axes'])
+    return results['principal_moments'], results['principal_axes']
+
+
+def bounding_box(coordinates, chunk=None):
+    """
+    Calculate axis aligned bounding box for each frame.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    ndarray
+        Minimum and maximum coordinates with shape (2, 3) or (F, 2, 3).
+
+    """
+    return _calculate(coordinates, None, chunk, ['bounding_box'])['bounding_box']
+
+
+def get_descriptors(coordinates, masses=None, chunk=None):
+    """
+    Calculate all geometric descriptors in a single pass over the coordinates.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    masses : ndarray or None
+        Atomic masses with shape (N,). If None all atoms have unit mass.
+    chunk : int or None
+        Number of frames processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    dict
+        Descriptors with 'center', 'radius_of_gyration', 'inertia_tensor', 'principal_moments',
+        'principal_axes' and 'bounding_box' keys.
+
+    """
+    return _calculate(coordinates, masses, chunk, DESCRIPTORS)
+
+
+def _calculate(coordinates, masses, chunk, descriptors):
+    """
+    Calculate given descriptors chunk by chunk.
+
+    """
+    # np.ndim would load lazily read trajectories (array-likes with a shape) into memory
+    single = len(np.shape(coordinates)) == 2
+    if single:
+        coordinates = np.asarray(coordinates, dtype=float)[None]
+    n_frames, n_atoms = len(coordinates), coordinates.shape[1]
+    if chunk is None:
+        chunk = max(1, CHUNK_SIZE // max(3 * n_atoms, 1))
+    masses = np.ones(n_atoms) if masses is None else np.asarray(masses, dtype=float)
+    total_mass = masses.sum()
+    mass_weighted = any(d != 'bounding_box' for d in descriptors)
+    inertia = any(d in descriptors for d in ['inertia_tensor', 'principal_moments', 'principal_axes'])
+    results = {d: np.empty((n_frames,) + SHAPES[d]) for d in descriptors}
+    for start in range(0, n_frames, chunk):
+        block = np.asarray(coordinates[start:start + chunk], dtype=float)
+        frames = slice(start, start + len(block))
+        if 'bounding_box' in results:
+            results['bounding_box'][frames, 0] = block.min(axis=1)
+            results['bounding_box'][frames, 1] = block.max(axis=1)
+        if not mass_weighted:
+            continue
+        center = np.matmul(masses, block) / total_mass
+        if 'center' in results:
+            results['center'][frames] = center
+        block = block - center[:, None, :]
+        if 'radius_of_gyration' in results:
+            squared_distances = np.einsum('fni,fni->fn', block, block)
+            results['radius_of_gyration'][frames] = np.sqrt(np.matmul(squared_distances, masses) / total_mass)
+        if inertia:
+            # Inertia tensor -> I = sum(m * (|r|^2 * E - r x r))
+            second_moment = np.matmul(block.transpose(0, 2, 1) * masses, block)
+            tensor = np.trace(second_moment, axis1=1, axis2=2)[:, None, None] * np.eye(3) - second_moment
+            if 'inertia_tensor' in results:
+                results['inertia_tensor'][frames] = tensor
+            if 'principal_moments' in results or 'principal_axes' in results:
+                moments, axes = np.linalg.eigh(tensor)
+                if 'principal_moments' in results:
+                    results['principal_moments'][frames] = moments
+                if 'principal_axes' in results:
+                    results['principal_axes'][frames] = axes.transpose(0, 2, 1)
+    if single:
+        results = {d: r[0] for d, r in results.items()}
+    return results
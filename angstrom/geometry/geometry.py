@@ -4,10 +4,10 @@ Geometric operations for Ångström Python package.
 """
 import warnings
 import numpy as np
-import periodictable
+from angstrom.elements import get_masses
 
 
-def get_molecule_center(atoms, coordinates, mass=True):
+def get_molecule_center(atoms, coordinates, mass=True, codes=None):
     """
     Calculate center of mass or geometric center for given coordinates and atom names of a molecule.
 
@@ -19,6 +19,8 @@ def get_molecule_center(atoms, coordinates, mass=True):
         List of coordinates (2D list).
     mass: bool
         Use atomic masses (True) or calculate geometric center (False).
+    codes: ndarray or None
+        Integer atom codes (atomic numbers) used to look up atomic masses instead of element names.
 
     Returns
     -------
@@ -27,14 +29,10 @@ def get_molecule_center(atoms, coordinates, mass=True):
 
     """
     if mass:
-        masses = np.array([periodictable.elements.symbol(atom).mass for atom in atoms])
+        masses = get_masses(atoms, codes=codes)
     else:
         masses = np.ones(len(atoms))
-    total_mass = masses.sum()
-    x_cm = (masses * coordinates[:, 0]).sum() / total_mass
-    y_cm = (masses * coordinates[:, 1]).sum() / total_mass
-    z_cm = (masses * coordinates[:, 2]).sum() / total_mass
-    return np.array([x_cm, y_cm, z_cm])
+    return np.dot(masses, coordinates) / masses.sum()
 
 
 def align_vectors(v1, v2, norm=True):
@@ -46,29 +46,54 @@ class Plane:
         self.d = np.dot(cp, p3)
         self.p1, self.p2, self.p3 = p1, p2, p3
 
-    def reflect(self, point):
+    @classmethod
+    def from_args(cls, plane):
         """
-        Get mirror image of a point through the plane of reflection.
+        Create a Plane object from a Plane object, 3 points or a string (ex: 'xy') for main planes.
 
         Parameters
         ----------
-        point: list
-            3D point to be reflected.
+        plane: Plane or list or string
+            Plane object (returned as is), 3 points or a string.
 
         Returns
         -------
-        ndarray
-            Mirror image of the point.
+        Plane
+            Plane object.
+
+        """
+        if isinstance(plane, cls):
+            return plane
+        if isinstance(plane, str):
+            return cls(plane)
+        return cls(*plane)
 
+    def reflect(self, points, out=None):
         """
-        s0 = (self.a * point[0] + self.b * point[1] + self.c * point[2] - self.d)
-        s0 /= (self.a**2 + self.b**2 + self.c**2)
+        Get mirror image of points through the plane of reflection.
+
+        Parameters
+        ----------
+        points: ndarray
+            3D point or points with shape (..., 3) to be reflected, ex: (N, 3) or (F, N, 3).
+        out: ndarray or None
+            Output array with the same shape as points (can be the points array itself).
 
-        x = point[0] - 2 * s0 * self.a
-        y = point[1] - 2 * s0 * self.b
-        z = point[2] - 2 * s0 * self.c
+        Returns
+        -------
+        ndarray
+            Mirror image of the points.
 
-        return np.array([x, y, z])
+        """
+        points = np.asarray(points, dtype=float) if out is not points else points
+        normal = np.array([self.a, self.b, self.c], dtype=float)
+        # Signed distance to the plane (scaled by the normal vector length) times two
+        s0 = (np.dot(points, normal) - self.d) * (2 / np.dot(normal, normal))
+        if out is None:
+            out = np.empty(np.shape(points))
+        for i in range(3):
+            np.subtract(points[..., i], s0 * normal[i], out=out[..., i])
+        return out
 
     def grid(self, size, space=1):
         """
@@ -92,17 +117,13 @@ class Plane:
         Returns
         -------
         ndarray
-            Grid points.
+            Grid points (m is the outer and n is the inner loop index).
 
         """
-        grid_points = []
-        for m in np.arange(0, size + space, space):
-            for n in np.arange(0, size + space, space):
-                x = (size - n) * self.p1[0] + (n - m) * self.p2[0] + m * self.p3[0]
-                y = (size - n) * self.p1[1] + (n - m) * self.p2[1] + m * self.p3[1]
-                z = (size - n) * self.p1[2] + (n - m) * self.p2[2] + m * self.p3[2]
-                grid_points.append([x, y, z])
-        return np.array(grid_points)
+        steps = np.arange(0, size + space, space)
+        m, n = np.meshgrid(steps, steps, indexing='ij')
+        m, n = m.reshape(-1, 1), n.reshape(-1, 1)
+        return (size - n) * self.p1 + (n - m) * self.p2 + m * self.p3
 
     def get_center(self):
         """
@@ -3,6 +3,7 @@
 Quaternion operations for Ångström Python package.
 """
 import numpy as np
+from .rotation import quaternion_matrix
 
 
 class Quaternion(object):
@@ -181,3 +182,281 @@ class Quaternion(object):
         Quat.z = Quat.z + axis_point2[2]
 
         return Quat
+
+
+class QuaternionArray(object):
+    """
+    Array of quaternions for batched quaternion operations and 3D rotations.
+    Quaternions are stored as an (N, 4) float64 array with columns w, x, y, z.
+
+    """
+    def __init__(self, array):
+        """
+        Initialize QuaternionArray with an (N, 4) array -> [[w1, x1, y1, z1], ...].
+
+        Parameters
+        ----------
+        array: ndarray or list
+            Quaternion w, x, y, and z values with shape (N, 4) (a single (4,) quaternion is also accepted).
+
+        """
+        self.array = np.ascontiguousarray(array, dtype=np.float64).reshape(-1, 4)
+
+    def __repr__(self):
+        return "<QuaternionArray object with: %i quaternions>" % len(self)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, i):
+        """
+        Returns a Quaternion object for given index or a QuaternionArray for slicing.
+
+        """
+        if isinstance(i, (int, np.integer)):
+            return Quaternion(self.array[i].tolist())
+        return QuaternionArray(self.array[i])
+
+    @property
+    def w(self):
+        return self.array[:, 0]
+
+    @property
+    def x(self):
+        return self.array[:, 1]
+
+    @property
+    def y(self):
+        return self.array[:, 2]
+
+    @property
+    def z(self):
+        return self.array[:, 3]
+
+    def xyz(self):
+        """
+        Returns x, y, z values of the quaternions as an (N, 3) array.
+
+        """
+        return self.array[:, 1:]
+
+    @classmethod
+    def from_quaternions(cls, quaternions):
+        """
+        Create QuaternionArray from a list of Quaternion objects.
+
+        """
+        return cls([[q.w, q.x, q.y, q.z] for q in quaternions])
+
+    @classmethod
+    def from_axis_angle(cls, axes, angles):
+        """
+        Create rotation quaternions from axis vectors and rotation angles.
+
+        Parameters
+        ----------
+        axes: ndarray
+            Axis vectors with shape (N, 3) or a single (3,) axis for all angles.
+        angles: ndarray
+            Rotation angles in radians with shape (N,).
+
+        Returns
+        -------
+        QuaternionArray
+            Unit quaternions for the rotations.
+
+        """
+        axes = np.asarray(axes, dtype=float)
+        axes = axes / np.linalg.norm(axes, axis=-1, keepdims=True)
+        half_angles = np.asarray(angles, dtype=float) / 2.0
+        axes, half_angles = np.broadcast_arrays(axes.reshape(-1, 3), half_angles.reshape(-1, 1))
+        array = np.empty((len(axes), 4))
+        array[:, 0] = np.cos(half_angles[:, 0])
+        array[:, 1:] = np.sin(half_angles) * axes
+        return cls(array)
+
+    @classmethod
+    def from_matrix(cls, matrices):
+        """
+        Create unit quaternions from rotation matrices (Shepperd's method).
+
+        Parameters
+        ----------
+        matrices: ndarray
+            Rotation matrices with shape (N, 3, 3) or a single (3, 3) matrix.
+
+        Returns
+        -------
+        QuaternionArray
+            Unit quaternions with positive w for the rotations.
+
+        """
+        m = np.asarray(matrices, dtype=float).reshape(-1, 3, 3)
+        trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+        # Pick the numerically most stable formula for each matrix
+        case = np.argmax(np.stack((trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]), axis=1), axis=1)
+        array = np.empty((len(m), 4))
+
+        c = case == 0
+        s = np.sqrt(1.0 + trace[c]) * 2
+        array[c] = np.stack((0.25 * s, (m[c, 2, 1] - m[c, 1, 2]) / s,
+                             (m[c, 0, 2] - m[c, 2, 0]) / s, (m[c, 1, 0] - m[c, 0, 1]) / s), axis=1)
+        c = case == 1
+        s = np.sqrt(1.0 + m[c, 0, 0] - m[c, 1, 1] - m[c, 2, 2]) * 2
+        array[c] = np.stack(((m[c, 2, 1] - m[c, 1, 2]) / s, 0.25 * s,
+                             (m[c, 0, 1] + m[c, 1, 0]) / s, (m[c, 0, 2] + m[c, 2, 0]) / s), axis=1)
+        c = case == 2
+        s = np.sqrt(1.0 + m[c, 1, 1] - m[c, 0, 0] - m[c, 2, 2]) * 2
+        array[c] = np.stack(((m[c, 0, 2] - m[c, 2, 0]) / s, (m[c, 0, 1] + m[c, 1, 0]) / s,
+                             0.25 * s, (m[c, 1, 2] + m[c, 2, 1]) / s), axis=1)
+        c = case == 3
+        s = np.sqrt(1.0 + m[c, 2, 2] - m[c, 0, 0] - m[c, 1, 1]) * 2
+        array[c] = np.stack(((m[c, 1, 0] - m[c, 0, 1]) / s, (m[c, 0, 2] + m[c, 2, 0]) / s,
+                             (m[c, 1, 2] + m[c, 2, 1]) / s, 0.25 * s), axis=1)
+        array[array[:, 0] < 0] *= -1
+        return cls(array)
+
+    def __mul__(self, quat2):
+        """
+        Hamilton product of each quaternion with another quaternion (broadcasted) or quaternion array.
+
+        Parameters
+        ----------
+        quat2: QuaternionArray or Quaternion
+            The quaternions to multiply with.
+
+        Returns
+        -------
+        QuaternionArray
+            The resulting quaternions from the multiplication.
+
+        """
+        if isinstance(quat2, Quaternion):
+            quat2 = QuaternionArray([quat2.w, quat2.x, quat2.y, quat2.z])
+        w1, x1, y1, z1 = self.array.T
+        w2, x2, y2, z2 = quat2.array.T
+        w1, w2 = np.broadcast_arrays(w1, w2)
+        array = np.empty((len(w1), 4))
+        array[:, 0] = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+        array[:, 1] = x1 * w2 + w1 * x2 - z1 * y2 + y1 * z2
+        array[:, 2] = y1 * w2 + z1 * x2 + w1 * y2 - x1 * z2
+        array[:, 3] = z1 * w2 - y1 * x2 + x1 * y2 + w1 * z2
+        return QuaternionArray(array)
+
+    def __truediv__(self, quat2):
+        """
+        Divide quaternions by others. Performs the operation as q1 * inverse q2.
+
+        """
+        if isinstance(quat2, Quaternion):
+            quat2 = QuaternionArray([quat2.w, quat2.x, quat2.y, quat2.z])
+        return self * quat2.inv()
+
+    def conjugate(self):
+        """
+        Returns the conjugate of the quaternions as a new QuaternionArray.
+
+        """
+        array = self.array.copy()
+        array[:, 1:] *= -1
+        return QuaternionArray(array)
+
+    def norm(self):
+        """
+        Returns the norm of each quaternion.
+
+        """
+        return np.sqrt(np.einsum('ij,ij->i', self.array, self.array))
+
+    def inv(self):
+        """
+        Returns the inverse of the quaternions as a new QuaternionArray.
+
+        """
+        conjugate = self.conjugate()
+        conjugate.array /= np.einsum('ij,ij->i', self.array, self.array)[:, None]
+        return conjugate
+
+    def normalize(self):
+        """
+        Normalize quaternions to unit length in place.
+
+        Returns
+        -------
+        QuaternionArray
+            The normalized QuaternionArray object (self).
+
+        """
+        self.array /= self.norm()[:, None]
+        return self
+
+    def to_matrix(self):
+        """
+        Convert quaternions to rotation matrices (quaternions are normalized first).
+
+        Returns
+        -------
+        ndarray
+            Rotation matrices with shape (N, 3, 3).
+
+        """
+        return quaternion_matrix(self.array / self.norm()[:, None])
+
+    def rotate(self, points, pairwise=False):
+        """
+        Rotate points around the origin using the quaternions.
+
+        Parameters
+        ----------
+        points: ndarray
+            Points to rotate with shape (M, 3) (or (N, 3) for pairwise rotation).
+        pairwise: bool
+            Rotate each point by its own quaternion (True) or all points by each quaternion (False).
+
+        Returns
+        -------
+        ndarray
+            Rotated points with shape (N, 3) for pairwise rotation or (N, M, 3) otherwise.
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        matrices = self.to_matrix()
+        if pairwise:
+            if len(points) != len(self):
+                raise Exception('Pairwise rotation requires the same number of points (%i) and quaternions (%i)'
+                                % (len(points), len(self)))
+            return np.einsum('nij,nj->ni', matrices, points)
+        return np.einsum('nij,mj->nmi', matrices, points)
+
+    def slerp(self, quat2, t):
+        """
+        Spherical linear interpolation between unit quaternions.
+
+        Parameters
+        ----------
+        quat2: QuaternionArray
+            End quaternions (same length as self or a single quaternion).
+        t: float or ndarray
+            Interpolation parameter(s) between 0 and 1, broadcasted over the quaternions.
+
+        Returns
+        -------
+        QuaternionArray
+            Interpolated unit quaternions.
+
+        """
+        q1 = self.array / self.norm()[:, None]
+        q2 = quat2.array / quat2.norm()[:, None]
+        q1, q2 = np.broadcast_arrays(q1, q2)
+        t = np.asarray(t, dtype=float).reshape(-1, 1)
+        dot = np.einsum('ij,ij->i', q1, q2)
+        # Use the shortest path
+        q2 = np.where(dot[:, None] < 0, -q2, q2)
+        dot = np.clip(np.abs(dot), -1.0, 1.0)[:, None]
+        theta = np.arccos(dot)
+        sin_theta = np.sin(theta)
+        close = sin_theta < 1e-8
+        sin_theta[close] = 1.0
+        s1 = np.where(close, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+        s2 = np.where(close, t, np.sin(t * theta) / sin_theta)
+        return QuaternionArray(s1 * q1 + s2 * q2).normalize()
@@ -0,0 +1,102 @@
+"""
+--- Ångström ---
+Batched rotation operations for Ångström Python package.
+"""
+import numpy as np
+
+
+AXES = {'x': ([0, 0, 0], [1, 0, 0]),
+        'y': ([0, 0, 0], [0, 1, 0]),
+        'z': ([0, 0, 0], [0, 0, 1])}
+
+
+def quaternion_matrix(quaternion):
+    """
+    Convert unit quaternion(s) to rotation matrices.
+
+    Parameters
+    ----------
+    quaternion : ndarray
+        Unit quaternion [w, x, y, z] with shape (4,) or array of unit quaternions with shape (N, 4).
+
+    Returns
+    -------
+    ndarray
+        Rotation matrix with shape (3, 3) or array of rotation matrices with shape (N, 3, 3).
+
+    """
+    q = np.asarray(quaternion, dtype=float)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    matrix = np.empty(q.shape[:-1] + (3, 3))
+    matrix[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    matrix[..., 0, 1] = 2 * (x * y - w * z)
+    matrix[..., 0, 2] = 2 * (x * z + w * y)
+    matrix[..., 1, 0] = 2 * (x * y + w * z)
+    matrix[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    matrix[..., 1, 2] = 2 * (y * z - w * x)
+    matrix[..., 2, 0] = 2 * (x * z - w * y)
+    matrix[..., 2, 1] = 2 * (y * z + w * x)
+    matrix[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return matrix
+
+
+def rotation_matrix(axis_vector, angle):
+    """
+    Calculate rotation matrix for a rotation around an axis vector by a given angle.
+    The direction of rotation is counter-clockwise when looking down the axis vector.
+
+    Parameters
+    ----------
+    axis_vector : ndarray
+        3D vector defining the direction of the axis of rotation.
+    angle : float
+        Rotation angle in radians.
+
+    Returns
+    -------
+    ndarray
+        Rotation matrix with shape (3, 3).
+
+    """
+    axis_vector = np.asarray(axis_vector, dtype=float)
+    axis_vector = axis_vector / np.linalg.norm(axis_vector)
+    quaternion = np.concatenate(([np.cos(angle / 2.0)], np.sin(angle / 2.0) * axis_vector))
+    return quaternion_matrix(quaternion)
+
+
+def rotate(coordinates, axis, angle, out=None):
+    """
+    Rotate coordinates around an axis defined by two points in 3D space by a given angle.
+    The direction of rotation is counter-clockwise given that axis is defined as p2 - p1.
+    A single rotation matrix is built and applied to all coordinates at once.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        Float array of coordinates with shape (N, 3) or (F, N, 3).
+    axis : tuple or str
+        Tuple of 3D points defining the axis of rotation.
+        If 'x', 'y', or 'z' is given primary axes are used.
+    angle : float
+        Rotation angle in radians.
+    out : ndarray or None
+        Array to write rotated coordinates (same shape as coordinates).
+        If None the coordinates are rotated in place.
+
+    Returns
+    -------
+    ndarray
+        Rotated coordinates (the 'out' array or the input array for in place rotation).
+    """
+    if isinstance(axis, str):
+        axis = AXES[axis]
+    axis_point1, axis_point2 = np.asarray(axis[0], dtype=float), np.asarray(axis[1], dtype=float)
+    matrix = rotation_matrix(axis_point2 - axis_point1, angle)
+    if out is None:
+        out = coordinates
+        coordinates -= axis_point2
+        out[...] = np.dot(coordinates, matrix.T)
+    else:
+        np.dot(coordinates - axis_point2, matrix.T, out=out)
+    out += axis_point2
+    return out
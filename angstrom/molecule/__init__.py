@@ -4,3 +4,4 @@ Molecule class for Ångström Python package.
 """
 from .molecule import Molecule
 from .cell import Cell
+from .supercell import VirtualSupercell
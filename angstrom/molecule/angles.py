@@ -3,34 +3,31 @@
 Molecular angle determination and calculation for Ångström Python package.
 """
 import numpy as np
+from .topology import BondGraph, to_tuples, calculate_tuples
 
 
 def get_angles(bonds):
     """
-    Iterate through bonds to get angles.
+    Walk over the bond graph to get angles.
     Bonds should NOT contain duplicates.
 
     Parameters
     ----------
-    bonds : list
-        List of bonded atoms.
+    bonds : list or BondGraph
+        List of bonded atoms or bond graph built from them.
 
     Returns
     -------
     list
         List of atom id triplets that make up an angle.
+
+    See Also
+    --------
+    BondGraph.angles: Returns angles as an int32 NumPy array.
     """
-    angles = []
-    for i1, b1 in enumerate(bonds):
-        for i2, b2 in enumerate(bonds):
-            if i2 > i1:
-                shared_atom = list(set(b1) & set(b2))
-                if len(shared_atom) > 0:
-                    atom1 = [b for b in b1 if b != shared_atom[0]][0]
-                    atom2 = [b for b in b2 if b != shared_atom[0]][0]
-                    other_atoms = sorted([atom1, atom2])
-                    angles.append((other_atoms[0], shared_atom[0], other_atoms[1]))
-    return sorted(angles)
+    if not isinstance(bonds, BondGraph):
+        bonds = BondGraph(bonds)
+    return to_tuples(bonds.angles())
 
 
 def calculate_angle(p1, p2, p3):
@@ -58,3 +55,38 @@ def calculate_angle(p1, p2, p3):
     v23 = np.array(p3) - np.array(p2)
     angle = np.arccos(np.dot(v21, v23) / (np.linalg.norm(v21) * np.linalg.norm(v23)))
     return np.degrees(angle)
+
+
+def calculate_angles(angles, coordinates, cell=None, chunk=None):
+    """
+    Calculate all angles for all frames at once in degrees.
+
+    Parameters
+    ----------
+    angles : ndarray
+        Atom id triplets with shape (n, 3), the second atom is the vertex (see get_angles).
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    cell : Cell or None
+        Unit cell for minimum image convention (periodic molecules).
+    chunk : int or None
+        Number of frames processed at once.
+
+    Returns
+    -------
+    ndarray
+        Angles in degrees with shape (n,) or (F, n).
+
+    """
+    angles = np.asarray(angles, dtype=np.intp).reshape(-1, 3)
+    return calculate_tuples(_angle_kernel, angles, coordinates, cell=cell, chunk=chunk)
+
+
+def _angle_kernel(vectors):
+    """
+    Calculate angles from bond vectors (p2 - p1, p3 - p2) with shape (..., 2, 3).
+
+    """
+    v21, v23 = -vectors[..., 0, :], vectors[..., 1, :]
+    cross = np.linalg.norm(np.cross(v21, v23), axis=-1)
+    return np.degrees(np.arctan2(cross, np.einsum('...i,...i->...', v21, v23)))
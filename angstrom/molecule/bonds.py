@@ -2,26 +2,13 @@
 --- Ångström ---
 Molecular bonding estimation for Ångström Python package.
 """
-# Molecular Single-Bond Covalent Radii for Elements 1-118 by Pyykko et al. doi: 10.1002/chem.200800987
-rcov = {'H': 0.32, 'He': 0.46, 'Li': 1.33, 'Be': 1.02, 'B': 0.85, 'C': 0.75, 'N': 0.71,
-        'O': 0.63, 'F': 0.64, 'Ne': 0.67, 'Na': 1.55, 'Mg': 1.39, 'Al': 1.26, 'Si': 1.16,
-        'P': 1.11, 'S': 1.03, 'Cl': 0.99, 'Ar': 0.96, 'K': 1.96, 'Ca': 1.71, 'Sc': 1.48,
-        'Ti': 1.36, 'V': 1.34, 'Cr': 1.22, 'Mn': 1.19, 'Fe': 1.16, 'Co': 1.11, 'Ni': 1.10,
-        'Cu': 1.12, 'Zn': 1.18, 'Ga': 1.24, 'Ge': 1.21, 'As': 1.21, 'Se': 1.16, 'Br': 1.14,
-        'Kr': 1.17, 'Rb': 2.10, 'Sr': 1.85, 'Y': 1.63, 'Zr': 1.54, 'Nb': 1.47, 'Mo': 1.38,
-        'Tc': 1.28, 'Ru': 1.25, 'Rh': 1.25, 'Pd': 1.20, 'Ag': 1.28, 'Cd': 1.36, 'In': 1.42,
-        'Sn': 1.40, 'Sb': 1.40, 'Te': 1.36, 'I': 1.33, 'Xe': 1.31, 'Cs': 2.32, 'Ba': 1.96,
-        'Hf': 1.52, 'Ta': 1.46, 'W': 1.37, 'Re': 1.31, 'Os': 1.29, 'Ir': 1.22, 'Pt': 1.23,
-        'Au': 1.24, 'Hg': 1.33, 'Tl': 1.44, 'Pb': 1.44, 'Bi': 1.51, 'Po': 1.45, 'At': 1.47,
-        'Ru': 1.42, 'Fr': 2.23, 'Ra': 2.01, 'Rf': 1.57, 'Db': 1.49, 'Sg': 1.43, 'Bh': 1.41,
-        'Hs': 1.34, 'Mt': 1.29, 'Ds': 1.28, 'Rg': 1.21, 'La': 1.80, 'Ce': 1.63, 'Pr': 1.76,
-        'Nd': 1.74, 'Pm': 1.73, 'Sm': 1.72, 'Eu': 1.68, 'Gd': 1.69, 'Tb': 1.68, 'Dy': 1.67,
-        'Ho': 1.66, 'Er': 1.65, 'Tm': 1.64, 'Yb': 1.70, 'Lu': 1.62, 'Ac': 1.86, 'Th': 1.75,
-        'Pa': 1.69, 'U': 1.70, 'Np': 1.17, 'Pu': 1.72, 'Am': 1.66, 'Cm': 1.66, 'Bk': 1.68,
-        'Cf': 1.68, 'Es': 1.65, 'Fm': 1.67, 'Md': 1.73, 'No': 1.76, 'Lr': 1.61}
-
-
-def get_bonds(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
+from itertools import product
+import numpy as np
+from .neighbors import cell_list_pairs
+from angstrom.elements import rcov
+
+
+def get_bonds(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16, method='cell_list'):
     """
     Estimate molecular bonding by calculating interatomic distance.
     If two atoms are closer to each other than the sum of their covalent radii and RADIUS_BUFFER
@@ -39,6 +26,10 @@ def get_bonds(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
         Atomic radius buffer (Å).
     MIN_BOND_DISTANCE : float
         Minimum bonding distance (Å).
+    method : str
+        Neighbor search method ([cell_list] | sort).
+            - cell_list: Linked-cell search, scales linearly with number of atoms.
+            - sort: Pairwise search over atoms sorted by z coordinate (slow, kept for cross-checking).
 
     Returns
     -------
@@ -49,6 +40,46 @@ def get_bonds(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
     ----------
     .. [1] Pyykkö, Pekka, and Michiko Atsumi, *Molecular single‐bond covalent radii for elements 1–118.*
     Chemistry–A European Journal 15.1 (**2009**): 186-197.
+    """
+    if method == 'sort':
+        return get_bonds_sort(atoms, coordinates, RADIUS_BUFFER=RADIUS_BUFFER, MIN_BOND_DISTANCE=MIN_BOND_DISTANCE)
+    elif method != 'cell_list':
+        raise ValueError('Unknown bonding method: %s (cell_list | sort)' % method)
+    if len(atoms) < 2:
+        return []
+    symbols, atom_types = np.unique(atoms, return_inverse=True)
+    radii = np.array([rcov[i] for i in symbols])[atom_types.reshape(-1)]
+    # Largest possible bond length is used as the cell size of the neighbor search
+    max_rad = radii.max()
+    i, j, distance = cell_list_pairs(coordinates, max_rad + max_rad + RADIUS_BUFFER)
+    max_bond_distance = radii[i] + radii[j] + RADIUS_BUFFER
+    bonded = (distance >= MIN_BOND_DISTANCE) & (distance <= max_bond_distance)
+    i, j = i[bonded], j[bonded]
+    order = np.lexsort((j, i))
+    return list(zip(i[order].tolist(), j[order].tolist()))
+
+
+def get_bonds_sort(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
+    """
+    Estimate molecular bonding by comparing atom pairs sorted according to their z coordinate.
+    This is the original pairwise implementation of 'get_bonds' and it is kept for cross-checking.
+
+    Parameters
+    ----------
+    atoms : list
+        List of atom names.
+    coordinates : list
+        List of atomic coordinates.
+    RADIUS_BUFFER : float
+        Atomic radius buffer (Å).
+    MIN_BOND_DISTANCE : float
+        Minimum bonding distance (Å).
+
+    Returns
+    -------
+    list
+        List of bonded atoms as tuples sorted according to atom index of the first atom.
+
     """
     coors_z = list(enumerate(coordinates))
     coors_z = sorted(coors_z, key=lambda x: x[1][2])
@@ -67,3 +98,93 @@ def get_bonds(atoms, coordinates, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
             if distance >= MIN_BOND_DISTANCE and distance <= max_bond_distance:
                 bonds.append(tuple(sorted((coors_z[i][0], coors_z[j][0]))))
     return sorted(bonds)
+
+
+def get_periodic_bonds(atoms, coordinates, cell, RADIUS_BUFFER=0.45, MIN_BOND_DISTANCE=0.16):
+    """
+    Estimate molecular bonding for a periodic system using the same criteria as 'get_bonds'.
+    Atoms are wrapped into the unit cell in fractional space and periodic images of the atoms
+    close to the cell faces are added around the cell, so bonds across the cell faces are found
+    without building a supercell. For cells larger than twice the bond cutoff this is equivalent
+    to using minimum-image distances. For smaller cells every bonded image is reported.
+
+    Parameters
+    ----------
+    atoms : list
+        List of atom names.
+    coordinates : list
+        List of atomic coordinates.
+    cell : Cell
+        Unit cell of the system.
+    RADIUS_BUFFER : float
+        Atomic radius buffer (Å).
+    MIN_BOND_DISTANCE : float
+        Minimum bonding distance (Å).
+
+    Returns
+    -------
+    tuple
+        List of bonded atoms as tuples (i, j) sorted according to atom index of the first atom and
+        an integer array of image offsets with shape (n_bonds, 3). Atom i is bonded to the image of
+        atom j located at: coordinates[j] + image @ cell.vectors.
+        Bonds within the cell have an image offset of (0, 0, 0).
+
+    """
+    if len(atoms) == 0:
+        return [], np.empty((0, 3), dtype=int)
+    symbols, atom_types = np.unique(atoms, return_inverse=True)
+    radii = np.array([rcov[i] for i in symbols])[atom_types.reshape(-1)]
+    max_rad = radii.max()
+    cutoff = max_rad + max_rad + RADIUS_BUFFER
+
+    # Wrap atoms into the unit cell in fractional space
+    frac = cell.car2frac(np.reshape(coordinates, (-1, 3)))
+    shift = np.floor(frac)
+    frac -= shift
+    wrapped = cell.frac2car(frac)
+
+    # Number of image layers required in each direction
+    vectors = cell.vectors
+    widths = cell.volume / np.linalg.norm(np.cross(vectors[[1, 2, 0]], vectors[[2, 0, 1]]), axis=1)
+    frac_cutoff = cutoff / widths
+    layers = np.ceil(frac_cutoff).astype(int)
+
+    # Periodic images of atoms within the cutoff distance of the cell
+    ghost_atoms, ghost_images, ghost_coors = [], [], []
+    for image in product(*[range(-n, n + 1) for n in layers]):
+        if image == (0, 0, 0):
+            continue
+        image_frac = frac + image
+        inside = np.all((image_frac >= -frac_cutoff) & (image_frac <= 1 + frac_cutoff), axis=1)
+        ghost_atoms.append(np.nonzero(inside)[0])
+        ghost_images.append(np.tile(image, (len(ghost_atoms[-1]), 1)))
+        ghost_coors.append(wrapped[inside] + np.dot(image, vectors))
+    ghost_atoms, ghost_images = np.concatenate(ghost_atoms), np.concatenate(ghost_images)
+
+    i, j, distance = cell_list_pairs(wrapped, cutoff)
+    images = np.zeros((len(i), 3), dtype=int)
+    gi, g, gdistance = cell_list_pairs(wrapped, cutoff, other=np.concatenate(ghost_coors))
+    gj, gimages = ghost_atoms[g], ghost_images[g]
+    # Every bond across the cell faces is found from both sides, keep only one of them
+    keep = (gi < gj) | ((gi == gj) & _is_positive(gimages))
+    i, j = np.concatenate((i, gi[keep])), np.concatenate((j, gj[keep]))
+    distance = np.concatenate((distance, gdistance[keep]))
+    images = np.concatenate((images, gimages[keep]))
+
+    max_bond_distance = radii[i] + radii[j] + RADIUS_BUFFER
+    bonded = (distance >= MIN_BOND_DISTANCE) & (distance <= max_bond_distance)
+    i, j, images = i[bonded], j[bonded], images[bonded]
+    # Convert image offsets from wrapped to given coordinates
+    images = images + (shift[i] - shift[j]).astype(int)
+    order = np.lexsort((images[:, 2], images[:, 1], images[:, 0], j, i))
+    return list(zip(i[order].tolist(), j[order].tolist())), images[order]
+
+
+def _is_positive(images):
+    """
+    Returns True for image offsets that are lexicographically greater than (0, 0, 0).
+
+    """
+    first = np.argmax(images != 0, axis=1)
+    return images[np.arange(len(images)), first] > 0
+
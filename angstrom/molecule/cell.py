@@ -2,9 +2,16 @@
 --- Ångström ---
 Cell class for Ångström Python package.
 """
+from itertools import product
 import numpy as np
 
 
+# Fractional shifts to the 27 neighboring images (used for minimum image search in triclinic cells)
+IMAGE_SHIFTS = np.array(list(product((-1, 0, 1), repeat=3)), dtype=float)
+# Maximum number of displacement vectors searched at once for triclinic cells (each has 27 images)
+IMAGE_CHUNK = 2**14
+
+
 class Cell:
     """Cell class for unit cell and periodic boundary operations."""
     def __init__(self, cellpar):
@@ -150,7 +157,7 @@ class Cell:
         self.edges[10] = [self.vertices[7], self.vertices[5]]
         self.edges[11] = [self.vertices[7], self.vertices[6]]
 
-    def supercell(self, atoms, coordinates, replication, center=True):
+    def supercell(self, atoms, coordinates, replication, center=True, images=False):
         """
         Builds a supercell for given replication in a, b, and c directions of the cell.
 
@@ -178,48 +185,59 @@ class Cell:
             Replication in cell vectors -> [a, b, c].
         center : bool
             Keep the original cell at the center.
+        images : bool
+            Also return the image index of each atom in the supercell.
 
         Returns
         -------
         Cell
-            Supercell with replicated coordinates and atoms.
+            Supercell with replicated coordinates and atoms (and image index of each atom if images=True).
+            The image indices refer to 'translation_vectors' and 'translation_indices' attributes.
 
         """
-        a_v, b_v, c_v = self.vectors
-
-        # Calculate center translation vectors for each cell
-        if center:
-            center_trans_vec = []
-            for dim, factor in enumerate(replication):
-                center_translation = (factor - 1) / 2 * a_v[dim] + (factor - 1) / 2 * b_v[dim]
-                center_translation += (factor - 1) / 2 * c_v[dim]
-                center_trans_vec.append(center_translation)
-        else:
-            center_trans_vec = [0, 0, 0]
-
-        # Calculate translation vectors for each cell
-        self.translation_vectors = []
-        for a_rep in range(replication[0]):
-            for b_rep in range(replication[1]):
-                for c_rep in range(replication[2]):
-                    a_trans = a_v[0] * a_rep + b_v[0] * b_rep + c_v[0] * c_rep - center_trans_vec[0]
-                    b_trans = a_v[1] * a_rep + b_v[1] * b_rep + c_v[1] * c_rep - center_trans_vec[1]
-                    c_trans = a_v[2] * a_rep + b_v[2] * b_rep + c_v[2] * c_rep - center_trans_vec[2]
-                    self.translation_vectors.append([a_trans, b_trans, c_trans])
+        self.translation_indices, self.translation_vectors = self.translations(replication, center=center)
 
         # Create new cell
         supcellpar = [self.a * replication[0], self.b * replication[1], self.c * replication[2]]
         supcellpar += [np.degrees(i) for i in [self.alpha, self.beta, self.gamma]]
         supcell = Cell(supcellpar)
-        supcell_atoms = np.empty((0,), dtype='U2')
-        supcell_coordinates = np.empty((0, 3))
 
-        # Calculate supercell coordinates
-        for trans_vec in self.translation_vectors:
-            supcell_atoms = np.concatenate((supcell_atoms, atoms))
-            supcell_coordinates = np.concatenate((supcell_coordinates, coordinates + trans_vec))
+        # Calculate supercell coordinates in a preallocated array
+        coordinates = np.asarray(coordinates, dtype=float)
+        n_images, n_atoms = len(self.translation_vectors), len(coordinates)
+        supcell_coordinates = np.empty((n_images, n_atoms, 3))
+        np.add(self.translation_vectors[:, None, :], coordinates[None, :, :], out=supcell_coordinates)
+        supcell_coordinates = supcell_coordinates.reshape(n_images * n_atoms, 3)
+        supcell_atoms = np.tile(np.asarray(atoms), n_images)
+        if images:
+            return supcell, supcell_atoms, supcell_coordinates, np.repeat(np.arange(n_images), n_atoms)
         return supcell, supcell_atoms, supcell_coordinates
 
+    def translations(self, replication, center=True):
+        """
+        Calculate translation vectors for each cell image of a supercell.
+        The images are ordered with the c index changing fastest and the a index changing slowest.
+
+        Parameters
+        ----------
+        replication : list
+            Replication in cell vectors -> [a, b, c].
+        center : bool
+            Keep the original cell at the center.
+
+        Returns
+        -------
+        tuple
+            Image indices with shape (n_images, 3) and translation vectors with shape (n_images, 3).
+
+        """
+        indices = np.indices(replication).reshape(3, -1).T
+        translation_vectors = np.dot(indices, self.vectors)
+        # Center translation vector for the original cell
+        if center:
+            translation_vectors -= (np.array(replication) - 1) / 2 * self.vectors.sum(axis=0)
+        return indices, translation_vectors
+
     def _calculate_pbc_parameters(self):
         """
         Calculates constants used for periodic boundary conditions transformations.
@@ -244,52 +262,155 @@ class Cell:
         zc1 = self.c * self.frac_volume / uc_sin[2]
         self.to_car = [xc1, xc2, xc3, yc1, yc2, zc1]
 
-    def car2frac(self, car_coor):
+        # Row vector transformation matrices -> car = frac @ matrix | frac = car @ inverse
+        self.matrix = np.array([[xc1, 0, 0], [xc2, yc1, 0], [xc3, yc2, zc1]])
+        self.inverse = np.array([[xf1, 0, 0], [xf2, yf1, 0], [xf3, yf2, zf1]])
+        self.orthogonal = bool(np.allclose([self.alpha, self.beta, self.gamma], np.pi / 2))
+
+    def car2frac(self, car_coor, out=None):
         """
         Convert cartesian coordinates to fractional coordinates.
 
         Parameters
         ----------
-        atoms : ndarray
-            List of atom types.
+        car_coor : ndarray
+            Cartesian coordinates with shape (3,), (N, 3) or (F, N, 3).
+        out : ndarray or None
+            Array to write fractional coordinates (same shape as car_coor).
 
         Returns
         -------
-        list
+        ndarray
             Fractional coordinates.
 
         Notes
         -----
-        Requires 'to_frac' attribute which is calculated for Cell objects during initialization.
+        Requires 'inverse' attribute which is calculated for Cell objects during initialization.
 
         """
-        x, y, z = car_coor
-        x_frac = self.to_frac[0] * x + self.to_frac[1] * y + self.to_frac[2] * z
-        y_frac = self.to_frac[3] * y + self.to_frac[4] * z
-        z_frac = self.to_frac[5] * z
-        return [x_frac, y_frac, z_frac]
+        return np.matmul(np.asarray(car_coor, dtype=float), self.inverse, out=out)
 
-    def frac2car(self, frac_coor):
+    def frac2car(self, frac_coor, out=None):
         """
         Convert fractional coordinates to cartesian coordinates.
 
         Parameters
         ----------
-        atoms : ndarray
-            List of atom types.
+        frac_coor : ndarray
+            Fractional coordinates with shape (3,), (N, 3) or (F, N, 3).
+        out : ndarray or None
+            Array to write cartesian coordinates (same shape as frac_coor).
 
         Returns
         -------
-        list
+        ndarray
             Cartesian coordinates.
 
         Notes
         -----
-        Requires 'to_car' attribute which is calculated for Cell objects during initialization.
+        Requires 'matrix' attribute which is calculated for Cell objects during initialization.
+
+        """
+        return np.matmul(np.asarray(frac_coor, dtype=float), self.matrix, out=out)
+
+    def wrap(self, coordinates, out=None):
+        """
+        Wrap cartesian coordinates into the unit cell.
+
+        Parameters
+        ----------
+        coordinates : ndarray
+            Cartesian coordinates with shape (3,), (N, 3) or (F, N, 3).
+        out : ndarray or None
+            Array to write wrapped coordinates (same shape as coordinates).
+
+        Returns
+        -------
+        ndarray
+            Wrapped cartesian coordinates (fractional coordinates in [0, 1)).
+
+        """
+        frac = self.car2frac(coordinates)
+        frac -= np.floor(frac)
+        return self.frac2car(frac, out=out)
+
+    def minimum_image(self, dr, out=None):
+        """
+        Apply minimum image convention to displacement vectors.
+        Fractional displacements are rounded to the nearest integer which gives the minimum image for
+        orthogonal cells. For triclinic cells the 27 neighboring images of the rounded displacement
+        are also compared and the shortest one is selected (in chunks of IMAGE_CHUNK vectors).
+
+        Parameters
+        ----------
+        dr : ndarray
+            Cartesian displacement vectors with shape (3,), (N, 3) or (F, N, 3).
+        out : ndarray or None
+            Array to write minimum image displacements (same shape as dr).
+
+        Returns
+        -------
+        ndarray
+            Minimum image displacement vectors.
+
+        """
+        frac = self.car2frac(dr)
+        frac -= np.round(frac)
+        if self.orthogonal:
+            return self.frac2car(frac, out=out)
+        if out is None:
+            out = np.empty(frac.shape)
+        frac, minimum = frac.reshape(-1, 3), out.reshape(-1, 3)
+        # Images are searched in chunks to limit the size of the (n, 27, 3) candidates array
+        for start in range(0, len(frac), IMAGE_CHUNK):
+            candidates = self.frac2car(frac[start:start + IMAGE_CHUNK, None, :] + IMAGE_SHIFTS)
+            shortest = np.argmin(np.einsum('...ij,...ij->...i', candidates, candidates), axis=-1)
+            minimum[start:start + IMAGE_CHUNK] = candidates[np.arange(len(candidates)), shortest]
+        if not np.shares_memory(minimum, out):
+            out[...] = minimum.reshape(out.shape)
+        return out
+
+    def distance_matrix(self, coor_a, coor_b=None, out=None, chunk_size=2**18):
+        """
+        Calculate minimum image distances between two sets of coordinates.
+        Distances are calculated in chunks of rows so that temporary arrays never exceed
+        'chunk_size' vectors, including the 27 candidate images of each displacement vector
+        for triclinic cells. A preallocated (or memory-mapped) output array can be
+        given with 'out' when the full distance matrix is too large.
+
+        Parameters
+        ----------
+        coor_a : ndarray
+            Cartesian coordinates with shape (N, 3) or for multiple frames with shape (F, N, 3).
+        coor_b : ndarray or None
+            Cartesian coordinates with shape (M, 3) or (F, M, 3) (default: coor_a).
+        out : ndarray or None
+            Array to write distances with shape (N, M) or (F, N, M).
+        chunk_size : int
+            Maximum number of vectors (pairs times images searched) calculated at once.
+
+        Returns
+        -------
+        ndarray
+            Distance matrix with shape (N, M) or (F, N, M).
 
         """
-        x_frac, y_frac, z_frac = frac_coor
-        x = self.to_car[0] * x_frac + self.to_car[1] * y_frac + self.to_car[2] * z_frac
-        y = self.to_car[3] * y_frac + self.to_car[4] * z_frac
-        z = self.to_car[5] * z_frac
-        return [x, y, z]
+        coor_a = np.asarray(coor_a, dtype=float)
+        coor_b = coor_a if coor_b is None else np.asarray(coor_b, dtype=float)
+        frames_a = coor_a.reshape((-1,) + coor_a.shape[-2:])
+        frames_b = coor_b.reshape((-1,) + coor_b.shape[-2:])
+        n_frames = max(len(frames_a), len(frames_b))
+        n_a, n_b = frames_a.shape[1], frames_b.shape[1]
+        shape = (n_a, n_b) if coor_a.ndim == 2 and coor_b.ndim == 2 else (n_frames, n_a, n_b)
+        if out is None:
+            out = np.empty(shape)
+        out_frames = out.reshape(n_frames, n_a, n_b)
+        images = 1 if self.orthogonal else len(IMAGE_SHIFTS)
+        rows = max(1, chunk_size // max(n_b * images, 1))
+        for frame in range(n_frames):
+            frame_a = frames_a[frame if len(frames_a) > 1 else 0]
+            frame_b = frames_b[frame if len(frames_b) > 1 else 0]
+            for start in range(0, n_a, rows):
+                dr = self.minimum_image(frame_b[None, :, :] - frame_a[start:start + rows, None, :])
+                out_frames[frame, start:start + rows] = np.sqrt(np.einsum('...i,...i', dr, dr))
+        return out
@@ -2,39 +2,70 @@
 --- Ångström ---
 Molecular dihedral determination and calculation for Ångström Python package.
 """
+import numpy as np
+from .topology import BondGraph, to_tuples, calculate_tuples
+
 
 def get_dihedrals(bonds):
     """
-    Iterate over bonds to get dihedrals.
+    Walk over the bond graph to get dihedrals.
     Bonds should NOT contain duplicates.
 
     Parameters
     ----------
-    bonds : list
-        List of bonded atoms.
+    bonds : list or BondGraph
+        List of bonded atoms or bond graph built from them.
 
     Returns
     -------
     list
         List of atom id quadruplets that make up a dihedral.
+
+    See Also
+    --------
+    BondGraph.dihedrals: Returns dihedrals as an int32 NumPy array.
+    """
+    if not isinstance(bonds, BondGraph):
+        bonds = BondGraph(bonds)
+    return to_tuples(bonds.dihedrals())
+
+
+def calculate_dihedrals(dihedrals, coordinates, cell=None, chunk=None):
+    """
+    Calculate all dihedral angles for all frames at once in degrees.
+    The dihedral angle is the angle between planes (p1, p2, p3) and (p2, p3, p4) in (-180, 180]
+    (0 for cis and 180 for trans configuration, positive for clockwise rotation).
+
+    Parameters
+    ----------
+    dihedrals : ndarray
+        Atom id quadruplets with shape (n, 4) (see get_dihedrals).
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    cell : Cell or None
+        Unit cell for minimum image convention (periodic molecules).
+    chunk : int or None
+        Number of frames processed at once.
+
+    Returns
+    -------
+    ndarray
+        Dihedral angles in degrees with shape (n,) or (F, n).
+
+    """
+    dihedrals = np.asarray(dihedrals, dtype=np.intp).reshape(-1, 4)
+    return calculate_tuples(_dihedral_kernel, dihedrals, coordinates, cell=cell, chunk=chunk)
+
+
+def _dihedral_kernel(vectors):
+    """
+    Calculate dihedral angles from bond vectors (p2 - p1, p3 - p2, p4 - p3) with shape (..., 3, 3).
+
     """
-    dihedrals = []
-    for i1, middle_bond in enumerate(bonds):
-        atom1, atom2 = middle_bond
-        atom1_bonds, atom2_bonds = [], []
-        for i2, other_bond in enumerate(bonds):
-            if atom1 in other_bond:
-                atom1_bonds.append(other_bond)
-            elif atom2 in other_bond:
-                atom2_bonds.append(other_bond)
-
-        for bond1 in atom1_bonds:
-            for bond2 in atom2_bonds:
-                atom0 = [b for b in bond1 if b != atom1][0]
-                atom3 = [b for b in bond2 if b != atom2][0]
-                dihedral = (min(atom0,atom3), atom1, atom2, max(atom0,atom3))
-                # Make sure dihedral is not a loop
-                if len(set(dihedral)) == 4:
-                    dihedrals.append(tuple(dihedral))
-
-    return sorted(dihedrals)
+    b1, b2, b3 = vectors[..., 0, :], vectors[..., 1, :], vectors[..., 2, :]
+    n1, n2 = np.cross(b1, b2), np.cross(b2, b3)
+    y = np.linalg.norm(b2, axis=-1) * np.einsum('...i,...i->...', b1, n2)
+    x = np.einsum('...i,...i->...', n1, n2)
+    angles = np.degrees(np.arctan2(y, x))
+    # arctan2 returns -180 for trans dihedrals with y = -0.0 (or tiny negative y) -> use 180
+    return np.where(angles == -180, 180.0, angles)
@@ -0,0 +1,83 @@
+"""
+--- Ångström ---
+Molecule file format registry for Ångström Python package.
+Readers and writers are registered by file extension and used by 'read_molecule' and 'write_molecule'.
+"""
+import os
+
+
+# File extension -> reader function
+READERS = {}
+# File extension -> (writer function, list of supported keyword arguments)
+WRITERS = {}
+
+
+def register_reader(extension, reader):
+    """
+    Register a molecule file reader for given file extension.
+
+    Parameters
+    ----------
+    extension : str
+        File extension without the dot (ex: 'pdb').
+    reader : function
+        Reader function that takes the file name and returns a dictionary with
+        'atoms', 'coordinates' and 'header' keys (and optionally 'bonds' and 'cell').
+
+    Returns
+    -------
+    None
+        Adds reader to the registry.
+
+    """
+    READERS[extension.lower()] = reader
+
+
+def register_writer(extension, writer, options=()):
+    """
+    Register a molecule file writer for given file extension.
+
+    Parameters
+    ----------
+    extension : str
+        File extension without the dot (ex: 'pdb').
+    writer : function
+        Writer function with (fileobj, atoms, coordinates, **options) arguments.
+    options : list
+        Keyword arguments of 'write_molecule' supported by the writer (ex: ['bonds', 'header']).
+
+    Returns
+    -------
+    None
+        Adds writer to the registry.
+
+    """
+    WRITERS[extension.lower()] = (writer, list(options))
+
+
+def get_reader(filename):
+    """
+    Returns registered reader for the extension of given file name.
+
+    """
+    return _lookup(READERS, filename, 'reading')
+
+
+def get_writer(filename):
+    """
+    Returns registered writer and its supported keyword arguments for the extension of given file name.
+
+    """
+    return _lookup(WRITERS, filename, 'writing')
+
+
+def _lookup(registry, filename, operation):
+    """
+    Find registry entry for the extension of given file name.
+
+    """
+    extension = os.path.splitext(filename)[1].replace('.', '').lower()
+    if extension not in registry:
+        raise Exception('File format "%s" is not supported for %s (supported formats: %s)'
+                        % (extension, operation, ', '.join(sorted(registry))))
+    return registry[extension]
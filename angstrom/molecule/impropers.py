@@ -2,37 +2,59 @@
 --- Ångström ---
 Molecular improper determination and calculation for Ångström Python package.
 """
-from itertools import combinations
+import numpy as np
+from .topology import BondGraph, to_tuples, calculate_tuples
+from .dihedrals import _dihedral_kernel
 
 
 def get_impropers(bonds):
     """
-    Iterate over bonds to get impropers.
+    Walk over the bond graph to get impropers.
     Choose all three bonds that have one atom in common.
     For each set of bonds you have 3 impropers where one of the noncommon atoms is out of plane.
 
     Parameters
     ----------
-    bonds : list
-        List of atom ids that make up bonds.
+    bonds : list or BondGraph
+        List of atom ids that make up bonds or bond graph built from them.
 
     Returns
     -------
     list
         List of atom id quadruplets that make up a improper.
+
+    See Also
+    --------
+    BondGraph.impropers: Returns impropers as an int32 NumPy array.
+    """
+    if not isinstance(bonds, BondGraph):
+        bonds = BondGraph(bonds)
+    return to_tuples(bonds.impropers())
+
+
+def calculate_impropers(impropers, coordinates, cell=None, chunk=None):
+    """
+    Calculate all improper angles for all frames at once in degrees.
+    The improper angle is the angle between planes (p1, p2, p3) and (p2, p3, p4) in (-180, 180].
+    For impropers from get_impropers p2 is the central atom and p1 is the out of plane atom,
+    so the angle is 0 (or 180) when all four atoms are in the same plane.
+
+    Parameters
+    ----------
+    impropers : ndarray
+        Atom id quadruplets with shape (n, 4) (see get_impropers).
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    cell : Cell or None
+        Unit cell for minimum image convention (periodic molecules).
+    chunk : int or None
+        Number of frames processed at once.
+
+    Returns
+    -------
+    ndarray
+        Improper angles in degrees with shape (n,) or (F, n).
+
     """
-    impropers, checked = [], []
-    for bond in bonds:
-        for atom in bond:
-            if atom not in checked:
-                bonded_list = []
-                for bond2 in bonds:
-                    if atom in bond2:
-                        bonded_list.append(bond2[1 - bond2.index(atom)])
-                if len(bonded_list) >= 3:
-                    for triplet in combinations(bonded_list, 3):
-                        for out_of_plane in triplet:
-                            imp = tuple([out_of_plane, atom] + sorted([i for i in triplet if i != out_of_plane]))
-                            impropers.append(imp)
-            checked.append(atom)
-    return sorted(impropers)
+    impropers = np.asarray(impropers, dtype=np.intp).reshape(-1, 4)
+    return calculate_tuples(_dihedral_kernel, impropers, coordinates, cell=cell, chunk=chunk)
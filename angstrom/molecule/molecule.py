@@ -2,20 +2,22 @@
 --- Ångström ---
 Molecule class for Ångström Python package.
 """
-from .read import read_xyz
+from .read import read_molecule
 from .write import write_molecule
-from .bonds import get_bonds
+from .bonds import get_bonds, get_periodic_bonds
 from .angles import get_angles
 from .dihedrals import get_dihedrals
 from .impropers import get_impropers
+from .topology import BondGraph
 from .cell import Cell
+from .supercell import VirtualSupercell
 from angstrom.geometry import get_molecule_center, align_vectors
-from angstrom.geometry.quaternion import Quaternion
+from angstrom.geometry.rotation import rotate
 from angstrom.geometry.plane import Plane
+from angstrom.elements import atom_codes, get_masses
 import os
 import logging
 import numpy as np
-import periodictable
 
 
 class Molecule:
@@ -34,7 +36,7 @@ class Molecule:
         coordinates : list or None
             List of atomic positions of the molecule.
         read : str or None
-            File name to read molecule file (formats: xyz).
+            File name to read molecule file (formats: xyz | pdb | cif).
 
         """
         self.name = 'Molecule'
@@ -47,6 +49,41 @@ class Molecule:
             self.atoms = []
             self.coordinates = []
 
+    @property
+    def atoms(self):
+        """
+        Element names of the molecule atoms.
+
+        """
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        self._atoms = atoms
+        self._codes, self._codes_key = None, None
+
+    @property
+    def codes(self):
+        """
+        Integer atom codes (atomic numbers) of the molecule atoms.
+        Cached codes are reused only while the atoms (same object and contents) are unchanged,
+        so in place edits such as mol.atoms[0] = 'N' are detected.
+
+        """
+        key = self._atoms_key()
+        if self._codes is None or key != self._codes_key:
+            self._codes, self._codes_key = atom_codes(self._atoms), key
+        return self._codes
+
+    def _atoms_key(self):
+        """
+        Returns identity and content hash of the atoms used to validate cached atom codes.
+
+        """
+        atoms = self._atoms
+        contents = atoms.tobytes() if isinstance(atoms, np.ndarray) else tuple(atoms)
+        return id(atoms), len(atoms), hash(contents)
+
     def __repr__(self):
         """
         Molecule class return.
@@ -104,17 +141,22 @@ class Molecule:
         Parameters
         ----------
         filename : str
-            Molecule file name (formats: xyz).
+            Molecule file name (formats: xyz | pdb | cif).
 
         Returns
         -------
         None
             Assigns 'coordinates', 'atoms', and 'header', and 'name' attributes.
+            Also assigns 'bonds' and 'cell' attributes if the file has bonding and cell information.
 
         """
         self.name = os.path.splitext(os.path.basename(filename))[0]
-        mol = read_xyz(filename)
+        mol = read_molecule(filename)
         self.atoms, self.coordinates, self.header = mol['atoms'], mol['coordinates'], mol['header']
+        if 'bonds' in mol:
+            self.bonds = mol['bonds']
+        if 'cell' in mol:
+            self.set_cell(mol['cell'])
 
     def write(self, filename, bonds=False, cell=None, header='angstrom', group=None):
         """
@@ -146,44 +188,84 @@ class Molecule:
         else:
             write_molecule(filename, self.atoms, self.coordinates, bonds=None, cell=cell, header=header, group=group)
 
-    def get_bonds(self):
+    def get_bonds(self, periodic=False):
         """
         Estimate molecular bonding.
+
+        Parameters
+        ----------
+        periodic : bool
+            Include bonds across the faces of the unit cell (requires 'cell' attribute).
+            Image offsets of the bonds are assigned to the 'bond_images' attribute.
+
+        Returns
+        -------
+        None
+            Assigns 'bonds' attribute (and 'bond_images' attribute for periodic bonding).
+            Image offsets of a previous periodic bonding are removed for non-periodic bonding.
+
         """
-        self.bonds = get_bonds(self.atoms, self.coordinates)
+        if periodic:
+            if getattr(self, 'cell', None) is None:
+                raise Exception('Periodic bonding requires a unit cell (see set_cell)')
+            self.bonds, self.bond_images = get_periodic_bonds(self.atoms, self.coordinates, self.cell)
+        else:
+            self.bonds = get_bonds(self.atoms, self.coordinates)
+            if hasattr(self, 'bond_images'):
+                del self.bond_images
 
-    def get_angles(self):
+    def get_angles(self, bond_graph=None):
         """
         Iterate over bonds to get angles.
+
+        Parameters
+        ----------
+        bond_graph : BondGraph or None
+            Bond graph built from 'bonds' attribute (built here if not given).
+
         """
         if not hasattr(self, 'bonds'):
             self.get_bonds()
-        self.angles = get_angles(self.bonds)
+        self.angles = get_angles(self.bonds if bond_graph is None else bond_graph)
 
-    def get_dihedrals(self):
+    def get_dihedrals(self, bond_graph=None):
         """
         Iterate over bonds to get dihedrals.
+
+        Parameters
+        ----------
+        bond_graph : BondGraph or None
+            Bond graph built from 'bonds' attribute (built here if not given).
+
         """
         if not hasattr(self, 'bonds'):
             self.get_bonds()
-        self.dihedrals = get_dihedrals(self.bonds)
+        self.dihedrals = get_dihedrals(self.bonds if bond_graph is None else bond_graph)
 
-    def get_impropers(self):
+    def get_impropers(self, bond_graph=None):
         """
         Iterate over angles to get impropers.
+
+        Parameters
+        ----------
+        bond_graph : BondGraph or None
+            Bond graph built from 'bonds' attribute (built here if not given).
+
         """
         if not hasattr(self, 'bonds'):
             self.get_bonds()
-        self.impropers = get_impropers(self.bonds)
+        self.impropers = get_impropers(self.bonds if bond_graph is None else bond_graph)
 
     def get_topology(self):
         """
         Estimate molecular topology (bonds, angles, dihedrals, and impropers).
+        The bond graph is built once and shared for angles, dihedrals and impropers.
         """
         self.get_bonds()
-        self.get_angles()
-        self.get_dihedrals()
-        self.get_impropers()
+        bond_graph = BondGraph(self.bonds, n_atoms=len(self.atoms))
+        self.get_angles(bond_graph)
+        self.get_dihedrals(bond_graph)
+        self.get_impropers(bond_graph)
 
     def get_molecular_weight(self):
         """
@@ -199,7 +281,7 @@ class Molecule:
             Molecular weight of the Molecule object.
 
         """
-        return sum([periodictable.elements.symbol(atom).mass for atom in self.atoms])
+        return float(get_masses(codes=self.codes).sum())
 
     def get_chemical_formula(self):
         """
@@ -233,7 +315,8 @@ class Molecule:
             Molecule center coordinates.
 
         """
-        return get_molecule_center(self.atoms, self.coordinates, mass=mass)
+        codes = self.codes if mass else None
+        return get_molecule_center(self.atoms, self.coordinates, mass=mass, codes=codes)
 
     def center(self, coor=[0, 0, 0], mass=True):
         """
@@ -303,8 +386,8 @@ class Molecule:
         """
         if center:
             current_center = self.get_center(mass=mass)
-        Q = Quaternion([0, 1, 1, 1])
-        self.coordinates = np.array([Q.rotation(coor, axis, angle).np() for coor in self.coordinates])
+        # Rotate a copy so that arrays shared with other objects (ex: trajectory frames) are not modified
+        self.coordinates = rotate(np.array(self.coordinates, dtype=float), axis, angle)
         if center:
             self.center(current_center, mass=mass)
 
@@ -315,7 +398,7 @@ class Molecule:
         Parameters
         ----------
         plane : Plane
-            Mirror plane defined by either 3 points or a string (ex: 'xy') for main planes.
+            Mirror plane given as a Plane object, 3 points or a string (ex: 'xy') for main planes.
         translate : float or None
             Translate the molecule after reflection by given amount on the axis normal to the plane.
 
@@ -326,16 +409,16 @@ class Molecule:
 
         """
         self._set_plane(plane)
-        self.coordinates = np.array([self.plane.reflect(i) for i in self.coordinates])
+        self.coordinates = self.plane.reflect(self.coordinates)
         if translate is not None:
             self.translate(np.array([self.plane.a, self.plane.b, self.plane.c]) * translate)
 
     def _set_plane(self, args):
         """
-        Set plane of reflection.
+        Set plane of reflection from a Plane object, 3 points or a string.
 
         """
-        self.plane = Plane(args)
+        self.plane = Plane.from_args(args)
 
     def align(self, mol_vector, align_vector, center=False, mass=True):
         """
@@ -378,7 +461,7 @@ class Molecule:
         """
         self.cell = Cell(cellpar)
 
-    def replicate(self, replication, center=True):
+    def replicate(self, replication, center=True, virtual=False):
         """
         Build a supercell by replicating the cell.
 
@@ -386,13 +469,20 @@ class Molecule:
         ----------
         replication : list
             Replication in cell vectors -> [a, b, c].
+        center : bool
+            Keep the original cell at the center.
+        virtual : bool
+            Return a lazy VirtualSupercell that generates image coordinates on demand
+            instead of allocating the replicated coordinates.
 
         Returns
         -------
-        Molecule
+        Molecule or VirtualSupercell
             The replicated Molecule object.
 
         """
+        if virtual:
+            return VirtualSupercell(self, replication, center=center)
         supercell, atoms, coors = self.cell.supercell(self.atoms, self.coordinates, replication, center=center)
         supermol = Molecule(atoms=atoms, coordinates=coors)
         supermol.cell = supercell
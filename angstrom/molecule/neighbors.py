@@ -0,0 +1,92 @@
+"""
+--- Ångström ---
+Linked-cell neighbor search for Ångström Python package.
+"""
+from itertools import product
+import numpy as np
+
+
+# Neighboring cell offsets. The half shell visits each pair of cells only once.
+FULL_SHELL = list(product((-1, 0, 1), repeat=3))
+HALF_SHELL = [offset for offset in FULL_SHELL if offset >= (0, 0, 0)]
+
+
+def cell_list_pairs(coordinates, cutoff, other=None):
+    """
+    Find all pairs of points within a cutoff distance using a linked-cell (spatial binning) search.
+    Points are binned into cubic cells with edge length equal to the cutoff so that only
+    points in neighboring cells need to be compared. Distances are calculated with NumPy for
+    all points of a pair of cells at once which makes the search scale roughly linearly
+    with the number of points.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        List of 3D coordinates with shape (N, 3).
+    cutoff : float
+        Cutoff distance (Å).
+    other : ndarray or None
+        Second set of 3D coordinates with shape (M, 3).
+        If given, pairs between 'coordinates' and 'other' are searched instead.
+
+    Returns
+    -------
+    tuple
+        Index arrays (i, j) and distances (d) of all pairs with d <= cutoff.
+        If 'other' is None each pair is listed once with i < j.
+        Otherwise i is an index of 'coordinates' and j is an index of 'other'.
+
+    """
+    coor_a = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    coor_b = coor_a if other is None else np.asarray(other, dtype=float).reshape(-1, 3)
+    empty = np.empty((0,), dtype=np.int64)
+    if len(coor_a) == 0 or len(coor_b) == 0 or (other is None and len(coor_a) < 2):
+        return empty, empty, np.empty((0,))
+
+    # Pad the cell edge slightly so that round-off never separates a pair by more than one cell
+    cell_edge = max(cutoff, 1e-8) * (1 + 1e-9)
+    origin = np.minimum(coor_a.min(axis=0), coor_b.min(axis=0))
+    # One empty layer of cells on each side -> neighbor cell keys never wrap around
+    grid_a = np.floor((coor_a - origin) / cell_edge).astype(np.int64) + 1
+    grid_b = grid_a if other is None else np.floor((coor_b - origin) / cell_edge).astype(np.int64) + 1
+    shape = np.maximum(grid_a.max(axis=0), grid_b.max(axis=0)) + 2
+    keys_a = (grid_a[:, 0] * shape[1] + grid_a[:, 1]) * shape[2] + grid_a[:, 2]
+    keys_b = keys_a if other is None else (grid_b[:, 0] * shape[1] + grid_b[:, 1]) * shape[2] + grid_b[:, 2]
+
+    # Sort points of the second set by cell to get the contents of each cell as a contiguous block
+    order = np.argsort(keys_b, kind='stable')
+    cell_keys, cell_starts, cell_counts = np.unique(keys_b[order], return_index=True, return_counts=True)
+    if other is None:
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+
+    pairs_i, pairs_j, distances = [], [], []
+    for offset in (HALF_SHELL if other is None else FULL_SHELL):
+        neighbor_keys = keys_a + (offset[0] * shape[1] + offset[1]) * shape[2] + offset[2]
+        cell_idx = np.searchsorted(cell_keys, neighbor_keys)
+        cell_idx[cell_idx == len(cell_keys)] = 0
+        found = np.nonzero(cell_keys[cell_idx] == neighbor_keys)[0]
+        if len(found) == 0:
+            continue
+        starts, counts = cell_starts[cell_idx[found]], cell_counts[cell_idx[found]]
+        # Expand every query point into (point, neighbor) pairs for all points in the neighbor cell
+        idx_i = np.repeat(found, counts)
+        sorted_j = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        if other is None and offset == (0, 0, 0):
+            # Same cell -> keep each pair only once
+            keep = sorted_j > rank[idx_i]
+            idx_i, sorted_j = idx_i[keep], sorted_j[keep]
+        idx_j = order[sorted_j]
+        delta = coor_b[idx_j] - coor_a[idx_i]
+        dist = (delta[:, 0] ** 2 + delta[:, 1] ** 2 + delta[:, 2] ** 2) ** 0.5
+        within = dist <= cutoff
+        pairs_i.append(idx_i[within])
+        pairs_j.append(idx_j[within])
+        distances.append(dist[within])
+
+    if len(pairs_i) == 0:
+        return empty, empty, np.empty((0,))
+    pairs_i, pairs_j, distances = np.concatenate(pairs_i), np.concatenate(pairs_j), np.concatenate(distances)
+    if other is None:
+        pairs_i, pairs_j = np.minimum(pairs_i, pairs_j), np.maximum(pairs_i, pairs_j)
+    return pairs_i, pairs_j, distances
@@ -2,7 +2,36 @@
 --- Ångström ---
 Methods for reading chemical file formats.
 """
+import re
+import warnings
 import numpy as np
+from .cell import Cell
+from .formats import get_reader, register_reader
+
+
+# Cell parameter tags of cif files
+CIF_CELL_TAGS = ['_cell_length_a', '_cell_length_b', '_cell_length_c',
+                 '_cell_angle_alpha', '_cell_angle_beta', '_cell_angle_gamma']
+
+
+def read_molecule(filename):
+    """
+    Read molecule file. Supported formats -> (xyz | pdb | cif)
+    The file format is extracted from the file extension and the reader is selected from the format registry.
+
+    Parameters
+    ----------
+    filename : str
+        Molecule file name.
+
+    Returns
+    -------
+    dict
+        Molecule dictionary with 'atoms', 'coordinates' and 'header' keys.
+        Also includes 'bonds' and 'cell' keys if the file has bonding and cell information.
+
+    """
+    return get_reader(filename)(filename)
 
 
 def read_xyz(filename):
@@ -21,12 +50,227 @@ def read_xyz(filename):
         -> {'atoms': ['C', ...], 'coordinates': [[x1, y1, z1], ...]}.
 
     """
-    with open(filename, 'r') as xyz_file:
-        xyz_lines = xyz_file.readlines()
-    n_atoms = int(xyz_lines[0].strip())
-    header = xyz_lines[1].strip()
-    atoms, coordinates = np.empty((n_atoms,), dtype='U2'), np.empty((n_atoms, 3))
-    for i, line in enumerate(xyz_lines[2:]):
-        atoms[i] = line.split()[0]
-        coordinates[i] = [float(i) for i in line.split()[1:4]]
+    with open(filename, 'rb') as xyz_file:
+        n_atoms = int(xyz_file.readline().strip())
+        header = xyz_file.readline().decode().strip()
+        atoms, coordinates = parse_xyz_block(xyz_file.read(), n_atoms)
     return dict(atoms=atoms, coordinates=coordinates, header=header)
+
+
+def parse_xyz_block(block, n_atoms, atoms=None, coordinates=None):
+    """
+    Parse atom lines of xyz file(s) in bulk.
+    The whole block is tokenized with a single split and the coordinates are converted to floats at once.
+    If the block does not have exactly 4 columns per atom (ex: extra columns) lines are parsed one by one.
+
+    Parameters
+    ----------
+    block : bytes or str or list
+        Atom lines as a single text block or a list of lines -> 'C 0.000 1.000 2.000'.
+    n_atoms : int
+        Number of atoms in the block.
+    atoms : ndarray or None
+        Array to assign atom names with shape (n_atoms,).
+    coordinates : ndarray or None
+        Array to assign coordinates with shape (n_atoms, 3).
+
+    Returns
+    -------
+    tuple
+        Atom names with shape (n_atoms,) and coordinates with shape (n_atoms, 3).
+
+    """
+    if atoms is None:
+        atoms = np.empty((n_atoms,), dtype='U2')
+    if coordinates is None:
+        coordinates = np.empty((n_atoms, 3))
+    if isinstance(block, (list, tuple)):
+        lines = block
+        tokens = (b' ' if len(lines) > 0 and isinstance(lines[0], bytes) else ' ').join(lines).split()
+    else:
+        lines = None
+        tokens = block.split()
+    if len(tokens) == 4 * n_atoms:
+        atoms[:] = tokens[0::4]
+        del tokens[0::4]
+    else:
+        # Irregular block -> use the first 4 columns of each non-empty line
+        lines = block.splitlines() if lines is None else lines
+        lines = [line.split() for line in lines if line.strip()][:n_atoms]
+        atoms[:] = [line[0] for line in lines]
+        tokens = [value for line in lines for value in line[1:4]]
+    coordinates[:] = np.array(tokens, dtype=float).reshape(n_atoms, 3)
+    return atoms, coordinates
+
+
+def read_pdb(filename):
+    """
+    Read pdb file format (ATOM, HETATM, CONECT and CRYST1 records).
+    Element names are read from the element column or from the atom name if the element column is empty.
+    Serial numbers in hybrid-36 format are supported.
+
+    Parameters
+    ----------
+    filename : str
+        pdb file name.
+
+    Returns
+    -------
+    dict
+        Molecule dictionary with 'atoms', 'coordinates' and 'header' keys.
+        Also includes 'bonds' (list of atom index pairs starting from 0) if there are CONECT records
+        and 'cell' (cell parameters) if there is a CRYST1 record.
+
+    """
+    with open(filename, 'r') as pdb_file:
+        lines = pdb_file.read().splitlines()
+    atom_lines = [line for line in lines if line.startswith(('ATOM  ', 'HETATM'))]
+    atoms = np.array([_pdb_element(line) for line in atom_lines], dtype='U2')
+    coordinates = [(line[30:38], line[38:46], line[46:54]) for line in atom_lines]
+    coordinates = np.array(coordinates, dtype=float).reshape(-1, 3)
+    header = ''
+    for line in lines:
+        if line.startswith(('HEADER', 'COMPND')):
+            header = line[10:].strip()
+            break
+    molecule = dict(atoms=atoms, coordinates=coordinates, header=header)
+
+    cryst = [line for line in lines if line.startswith('CRYST1')]
+    if len(cryst) > 0:
+        cell = cryst[0]
+        molecule['cell'] = [float(cell[i:j]) for i, j in [(6, 15), (15, 24), (24, 33), (33, 40), (40, 47), (47, 54)]]
+
+    conect = [line for line in lines if line.startswith('CONECT')]
+    if len(conect) > 0:
+        serials = {decode_hybrid36(line[6:11]): i for i, line in enumerate(atom_lines)}
+        pairs, missing = set(), set()
+        for line in conect:
+            fields = [line[start:start + 5] for start in range(6, min(len(line), 31), 5)]
+            ids = [decode_hybrid36(field) for field in fields if field.strip()]
+            missing.update(i for i in ids if i not in serials)
+            if len(ids) == 0 or ids[0] not in serials:
+                continue
+            atom = serials[ids[0]]
+            for neighbor in [serials[i] for i in ids[1:] if i in serials]:
+                pairs.add((min(atom, neighbor), max(atom, neighbor)))
+        if len(missing) > 0:
+            warnings.warn('Skipping CONECT records of missing atom serials: %s' % ', '.join(map(str, sorted(missing))),
+                          RuntimeWarning)
+        molecule['bonds'] = sorted(pairs)
+    return molecule
+
+
+def read_cif(filename):
+    """
+    Read cif file format with P1 symmetry (symmetry operations are not applied).
+    Atom sites are read from fractional coordinates (or cartesian coordinates if given).
+    Charges and oxidation states are removed from atom type symbols (ex: 'O2-' -> 'O').
+
+    Parameters
+    ----------
+    filename : str
+        cif file name.
+
+    Returns
+    -------
+    dict
+        Molecule dictionary with 'atoms', 'coordinates', 'header' and 'cell' (cell parameters) keys
+        ('cell' is not included for cartesian coordinates without cell parameters).
+
+    """
+    with open(filename, 'r') as cif_file:
+        lines = [line.strip() for line in cif_file.read().splitlines()]
+    header, tags, loops = '', {}, []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith('data_') and not header:
+            header = line[5:]
+        elif line.startswith('loop_'):
+            columns, rows = [], []
+            i += 1
+            while i < len(lines) and lines[i].startswith('_'):
+                columns.append(lines[i].split()[0])
+                i += 1
+            while i < len(lines) and lines[i] and not lines[i].startswith(('_', 'loop_', 'data_', '#')):
+                rows.append(lines[i].split())
+                i += 1
+            loops.append((columns, rows))
+            continue
+        elif line.startswith('_'):
+            tag = line.split(None, 1)
+            tags[tag[0]] = tag[1].strip("'\"") if len(tag) > 1 else ''
+        i += 1
+
+    cellpar = [_cif_number(tags[tag]) for tag in CIF_CELL_TAGS] if all(tag in tags for tag in CIF_CELL_TAGS) else None
+    for columns, rows in loops:
+        if '_atom_site_fract_x' in columns or '_atom_site_Cartn_x' in columns:
+            break
+    else:
+        raise Exception('No atom sites found in %s' % filename)
+    table = np.array([row[:len(columns)] for row in rows], dtype=object).reshape(-1, len(columns))
+    if '_atom_site_type_symbol' in columns:
+        atoms = [re.match('[A-Za-z]+', symbol).group() for symbol in table[:, columns.index('_atom_site_type_symbol')]]
+    else:
+        atoms = [re.match('[A-Za-z]+', label).group()[:2] for label in table[:, columns.index('_atom_site_label')]]
+    fractional = '_atom_site_fract_x' in columns
+    if fractional and cellpar is None:
+        missing = [tag for tag in CIF_CELL_TAGS if tag not in tags]
+        raise Exception('Fractional coordinates require cell parameters (missing: %s) in %s' % (', '.join(missing), filename))
+    axes = ['_atom_site_fract_%s' % i for i in 'xyz'] if fractional else ['_atom_site_Cartn_%s' % i for i in 'xyz']
+    coordinates = [[_cif_number(v) for v in table[:, columns.index(axis)]] for axis in axes]
+    coordinates = np.array(coordinates, dtype=float).T.reshape(-1, 3)
+    if fractional:
+        coordinates = Cell(cellpar).frac2car(coordinates)
+    molecule = dict(atoms=np.array(atoms, dtype='U2'), coordinates=coordinates, header=header)
+    if cellpar is not None:
+        molecule['cell'] = cellpar
+    return molecule
+
+
+def decode_hybrid36(string):
+    """
+    Decode pdb serial number in decimal or hybrid-36 format.
+
+    Parameters
+    ----------
+    string : str
+        Serial number string (ex: '   12' or 'A0000').
+
+    Returns
+    -------
+    int
+        Serial number.
+
+    """
+    string = string.strip()
+    width = 5
+    if string[0].isupper():
+        return int(string, 36) - 10 * 36 ** (width - 1) + 10 ** width
+    if string[0].islower():
+        return int(string, 36) - 10 * 36 ** (width - 1) + 10 ** width + 26 * 36 ** (width - 1)
+    return int(string)
+
+
+def _pdb_element(line):
+    """
+    Returns element name of a pdb atom record.
+
+    """
+    element = line[76:78].strip()
+    if not element:
+        element = re.sub('[^A-Za-z]', '', line[12:16])[:2]
+    return element[0].upper() + element[1:].lower()
+
+
+def _cif_number(value):
+    """
+    Convert cif number to float removing the standard uncertainty (ex: '8.995(2)').
+
+    """
+    return float(value.split('(')[0])
+
+
+register_reader('xyz', read_xyz)
+register_reader('pdb', read_pdb)
+register_reader('cif', read_cif)
@@ -0,0 +1,201 @@
+"""
+--- Ångström ---
+Virtual (lazy) supercell for Ångström Python package.
+"""
+from .bonds import get_periodic_bonds
+from .write import write_molecule
+from .cell import Cell
+import numpy as np
+
+
+class VirtualSupercell:
+    """
+    Supercell view of a periodic molecule.
+    Image coordinates are generated on demand from the unit cell coordinates and the translation
+    vectors so the expanded (n_images * N, 3) coordinate array is never allocated.
+    Atoms of the supercell are ordered image by image in the same order as 'Cell.supercell'.
+
+    """
+    def __init__(self, molecule, replication, center=True):
+        """
+        Virtual supercell initialization.
+
+        Parameters
+        ----------
+        molecule : Molecule
+            Molecule object with a unit cell ('cell' attribute).
+        replication : list
+            Replication in cell vectors -> [a, b, c].
+        center : bool
+            Keep the original cell at the center.
+
+        """
+        self.molecule = molecule
+        self.cell = molecule.cell
+        self.replication = tuple(int(i) for i in replication)
+        self.center = center
+        self.atoms = np.asarray(molecule.atoms)
+        self.coordinates = np.asarray(molecule.coordinates, dtype=float)
+        self.translation_indices, self.translation_vectors = self.cell.translations(self.replication, center=center)
+        self.supercell = Cell([self.cell.a * self.replication[0],
+                               self.cell.b * self.replication[1],
+                               self.cell.c * self.replication[2]] +
+                              [np.degrees(i) for i in [self.cell.alpha, self.cell.beta, self.cell.gamma]])
+        self.n_images = len(self.translation_vectors)
+        self.name = '%s_supercell' % getattr(molecule, 'name', 'Molecule')
+
+    def __repr__(self):
+        """
+        VirtualSupercell class return.
+
+        """
+        return "<VirtualSupercell [%s] with: %i x %i x %i images | %i atoms>" % ((self.name,) + self.replication + (len(self),))
+
+    def __len__(self):
+        """
+        Returns number of atoms in the supercell.
+
+        """
+        return self.n_images * len(self.atoms)
+
+    def __getitem__(self, images):
+        """
+        Materialize given image(s) of the supercell as a Molecule object.
+
+        Parameters
+        ----------
+        images : int or slice
+            Image index (or slice of image indices) ordered as 'translation_indices'.
+
+        Returns
+        -------
+        Molecule
+            Molecule object with the atoms of the selected images.
+
+        """
+        if isinstance(images, slice):
+            images = np.arange(self.n_images)[images]
+            atoms = np.tile(self.atoms, len(images))
+        else:
+            atoms = self.atoms.copy()
+        coordinates = self.image_coordinates(images).reshape(-1, 3)
+        return self.molecule.__class__(atoms=atoms, coordinates=coordinates)
+
+    def image_coordinates(self, images, out=None):
+        """
+        Calculate coordinates of given image(s).
+
+        Parameters
+        ----------
+        images : int or ndarray
+            Image index or array of image indices.
+        out : ndarray or None
+            Array to write image coordinates with shape (N, 3) or (n_images, N, 3).
+
+        Returns
+        -------
+        ndarray
+            Image coordinates with shape (N, 3) for a single image or (n_images, N, 3).
+
+        """
+        translations = self.translation_vectors[images]
+        return np.add(translations[..., None, :], self.coordinates, out=out)
+
+    def iter_blocks(self, images_per_block=1):
+        """
+        Iterate over the supercell in blocks of images.
+        Only one block of coordinates is kept in memory at a time.
+
+        Parameters
+        ----------
+        images_per_block : int
+            Number of images in each block.
+
+        Yields
+        ------
+        tuple
+            Atom names with shape (n * N,) and coordinates with shape (n * N, 3) for each block of n images.
+
+        """
+        n_atoms = len(self.atoms)
+        for start in range(0, self.n_images, images_per_block):
+            images = np.arange(start, min(start + images_per_block, self.n_images))
+            coordinates = self.image_coordinates(images).reshape(len(images) * n_atoms, 3)
+            yield np.tile(self.atoms, len(images)), coordinates
+
+    def to_molecule(self):
+        """
+        Materialize the supercell as a Molecule object (same as 'Molecule.replicate').
+
+        """
+        supermol = self[:]
+        supermol.name = self.name
+        supermol.cell = self.supercell
+        return supermol
+
+    def get_bonds(self, periodic=False):
+        """
+        Estimate bonding of the supercell from the periodic bonds of the unit cell.
+        Each unit cell bond is mapped to every image using its image offset, so no
+        distances are calculated for the supercell.
+
+        Parameters
+        ----------
+        periodic : bool
+            Include bonds across the supercell faces.
+            If True 'bond_images' attribute is also assigned with image offsets in supercell vectors.
+
+        Returns
+        -------
+        None
+            Assigns 'bonds' attribute (and 'bond_images' if periodic=True, removed otherwise) to the VirtualSupercell object.
+
+        """
+        bonds, offsets = get_periodic_bonds(self.atoms, self.coordinates, self.cell)
+        bonds = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+        n_atoms, replication = len(self.atoms), np.array(self.replication)
+        # Image index triplet of the partner atom for each (image, bond) pair
+        partner = self.translation_indices[:, None, :] + offsets[None, :, :]
+        wrapped = partner % replication
+        images = np.broadcast_to(partner // replication, partner.shape).reshape(-1, 3)
+        image_i = np.repeat(np.arange(self.n_images), len(bonds))
+        image_j = ((wrapped[..., 0] * replication[1] + wrapped[..., 1]) * replication[2] + wrapped[..., 2]).ravel()
+        atom_i = image_i * n_atoms + np.tile(bonds[:, 0], self.n_images)
+        atom_j = image_j * n_atoms + np.tile(bonds[:, 1], self.n_images)
+        if not periodic:
+            inside = np.all(images == 0, axis=1)
+            atom_i, atom_j, images = atom_i[inside], atom_j[inside], images[inside]
+        # Order each bond so that i <= j (reverse the image offset for swapped bonds)
+        swap = atom_i > atom_j
+        atom_i, atom_j = np.where(swap, atom_j, atom_i), np.where(swap, atom_i, atom_j)
+        images = np.where(swap[:, None], -images, images)
+        order = np.lexsort((images[:, 2], images[:, 1], images[:, 0], atom_j, atom_i))
+        self.bonds = list(zip(atom_i[order].tolist(), atom_j[order].tolist()))
+        if periodic:
+            self.bond_images = images[order]
+        elif hasattr(self, 'bond_images'):
+            del self.bond_images
+
+    def write(self, filename, bonds=False, header='angstrom'):
+        """
+        Write supercell to file by streaming one image at a time.
+
+        Parameters
+        ----------
+        filename : str
+            Molecule file name (formats: xyz, pdb, cif).
+        bonds : bool
+            Write bonds (pdb only).
+        header : str
+            File header.
+
+        Returns
+        -------
+        None
+            Writes molecule file.
+
+        """
+        if bonds:
+            self.get_bonds()
+        write_molecule(filename, self.atoms, self, bonds=self.bonds if bonds else None,
+                       cell=self.supercell.to_list(), header=header)
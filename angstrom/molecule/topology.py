@@ -0,0 +1,236 @@
+"""
+--- Ångström ---
+Adjacency list (compressed sparse row) bond graph for Ångström Python package.
+"""
+from itertools import combinations
+from angstrom.geometry.descriptors import CHUNK_SIZE
+import numpy as np
+
+
+class BondGraph:
+    """
+    Bond graph stored as a compressed sparse row (CSR) adjacency list.
+    The neighbors of atom i are: indices[indptr[i]:indptr[i + 1]] (sorted by atom index).
+
+    """
+    def __init__(self, bonds, n_atoms=None):
+        """
+        Build bond graph from a list of bonds.
+        Bonds should NOT contain duplicates.
+
+        Parameters
+        ----------
+        bonds : list or ndarray
+            List of bonded atom index pairs.
+        n_atoms : int or None
+            Number of atoms (default: largest atom index in bonds + 1).
+
+        """
+        self.bonds = np.asarray(bonds, dtype=np.int32).reshape(-1, 2)
+        if n_atoms is None:
+            n_atoms = int(self.bonds.max()) + 1 if len(self.bonds) > 0 else 0
+        self.n_atoms = n_atoms
+        source = np.concatenate((self.bonds[:, 0], self.bonds[:, 1]))
+        target = np.concatenate((self.bonds[:, 1], self.bonds[:, 0]))
+        order = np.lexsort((target, source))
+        self.indices = target[order]
+        self.degree = np.bincount(source, minlength=n_atoms).astype(np.int32)
+        self.indptr = np.zeros(n_atoms + 1, dtype=np.int64)
+        np.cumsum(self.degree, out=self.indptr[1:])
+
+    def __repr__(self):
+        """
+        BondGraph class return.
+
+        """
+        return "<BondGraph with: %i atoms | %i bonds>" % (self.n_atoms, len(self.bonds))
+
+    def neighbors(self, atom):
+        """
+        Returns sorted array of atom indices bonded to given atom.
+
+        """
+        return self.indices[self.indptr[atom]:self.indptr[atom + 1]]
+
+    def _neighbor_table(self, degree):
+        """
+        Returns atoms with given number of neighbors and their neighbors as a (n, degree) array.
+
+        """
+        centers = np.nonzero(self.degree == degree)[0]
+        columns = self.indptr[centers][:, None] + np.arange(degree)
+        return centers.astype(np.int32), self.indices[columns]
+
+    def angles(self):
+        """
+        Get angles by walking over the neighbors of each atom.
+
+        Returns
+        -------
+        ndarray
+            Atom id triplets (int32) that make up an angle with shape (n_angles, 3) sorted in ascending order.
+
+        """
+        angles = [np.empty((0, 3), dtype=np.int32)]
+        for degree in np.unique(self.degree[self.degree >= 2]):
+            centers, neighbors = self._neighbor_table(degree)
+            pairs = np.array(list(combinations(range(degree), 2)))
+            block = np.empty((len(centers), len(pairs), 3), dtype=np.int32)
+            block[:, :, 0] = neighbors[:, pairs[:, 0]]
+            block[:, :, 1] = centers[:, None]
+            block[:, :, 2] = neighbors[:, pairs[:, 1]]
+            angles.append(block.reshape(-1, 3))
+        return _sort_rows(np.concatenate(angles))
+
+    def dihedrals(self):
+        """
+        Get dihedrals by walking over the neighbors of both atoms of each bond.
+        The middle atoms keep the order they have in the bond.
+
+        Returns
+        -------
+        ndarray
+            Atom id quadruplets (int32) that make up a dihedral with shape (n_dihedrals, 4) sorted in ascending order.
+
+        """
+        atom1, atom2 = self.bonds[:, 0], self.bonds[:, 1]
+        # First atom -> neighbors of atom1 except atom2
+        bond_idx, atom0 = _expand(np.arange(len(self.bonds)), self.indptr[atom1], self.degree[atom1], self.indices)
+        keep = atom0 != atom2[bond_idx]
+        bond_idx, atom0 = bond_idx[keep], atom0[keep]
+        # Last atom -> neighbors of atom2 except atom1 and atom0
+        b2 = atom2[bond_idx]
+        pair_idx, atom3 = _expand(np.arange(len(bond_idx)), self.indptr[b2], self.degree[b2], self.indices)
+        bond_idx, atom0 = bond_idx[pair_idx], atom0[pair_idx]
+        keep = (atom3 != atom1[bond_idx]) & (atom3 != atom0)
+        bond_idx, atom0, atom3 = bond_idx[keep], atom0[keep], atom3[keep]
+        dihedrals = np.empty((len(bond_idx), 4), dtype=np.int32)
+        dihedrals[:, 0] = np.minimum(atom0, atom3)
+        dihedrals[:, 1] = atom1[bond_idx]
+        dihedrals[:, 2] = atom2[bond_idx]
+        dihedrals[:, 3] = np.maximum(atom0, atom3)
+        return _sort_rows(dihedrals)
+
+    def impropers(self):
+        """
+        Get impropers for all atoms bonded to at least three atoms.
+        For each set of three neighbors there are 3 impropers where one of the neighbors is out of plane.
+
+        Returns
+        -------
+        ndarray
+            Atom id quadruplets (int32) that make up an improper with shape (n_impropers, 4) sorted in ascending order.
+
+        """
+        impropers = [np.empty((0, 4), dtype=np.int32)]
+        for degree in np.unique(self.degree[self.degree >= 3]):
+            centers, neighbors = self._neighbor_table(degree)
+            template = np.array([(o, p, q) for o in range(degree)
+                                 for p, q in combinations([i for i in range(degree) if i != o], 2)])
+            block = np.empty((len(centers), len(template), 4), dtype=np.int32)
+            block[:, :, 0] = neighbors[:, template[:, 0]]
+            block[:, :, 1] = centers[:, None]
+            block[:, :, 2] = neighbors[:, template[:, 1]]
+            block[:, :, 3] = neighbors[:, template[:, 2]]
+            impropers.append(block.reshape(-1, 4))
+        return _sort_rows(np.concatenate(impropers))
+
+
+def _expand(ids, starts, counts, indices):
+    """
+    Expand each id into (id, neighbor) pairs for given CSR row starts and counts.
+
+    """
+    total = counts.sum()
+    positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return np.repeat(ids, counts), indices[positions]
+
+
+def _sort_rows(array):
+    """
+    Sort rows of a 2D array in ascending (lexicographic) order.
+
+    """
+    return array[np.lexsort(array.T[::-1])]
+
+
+def to_tuples(array):
+    """
+    Convert 2D array of atom ids to a list of tuples.
+
+    """
+    return [tuple(row) for row in array.tolist()]
+
+
+def bond_vectors(tuples, coordinates, cell=None):
+    """
+    Calculate vectors between consecutive atoms of each atom tuple (ex: angles or dihedrals).
+
+    Parameters
+    ----------
+    tuples : ndarray
+        Atom id tuples with shape (n, k).
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    cell : Cell or None
+        Unit cell for minimum image convention.
+
+    Returns
+    -------
+    ndarray
+        Vectors from atom i to atom i + 1 of each tuple with shape (n, k - 1, 3) or (F, n, k - 1, 3).
+
+    """
+    points = np.asarray(coordinates, dtype=float)[..., tuples, :]
+    vectors = points[..., 1:, :] - points[..., :-1, :]
+    if cell is not None:
+        vectors = cell.minimum_image(vectors)
+    return vectors
+
+
+def calculate_tuples(kernel, tuples, coordinates, cell=None, chunk=None):
+    """
+    Calculate values for atom tuples using a kernel function of their bond vectors.
+    Frames (or tuples for a single frame) are processed in chunks so that temporary arrays stay below
+    CHUNK_SIZE values and memory-mapped or lazily read trajectories are never loaded at once.
+
+    Parameters
+    ----------
+    kernel : function
+        Function that calculates values from bond vectors with shape (..., n, k - 1, 3).
+    tuples : ndarray
+        Atom id tuples with shape (n, k).
+    coordinates : ndarray
+        Atomic coordinates with shape (N, 3) or (F, N, 3).
+    cell : Cell or None
+        Unit cell for minimum image convention.
+    chunk : int or None
+        Number of frames (or tuples for a single frame) processed at once (default: limited by CHUNK_SIZE).
+
+    Returns
+    -------
+    ndarray
+        Values with shape (n,) or (F, n).
+
+    """
+    # Minimum image for triclinic cells compares 27 images of each bond vector
+    size = 3 * tuples.shape[1] * (27 if cell is not None and not cell.orthogonal else 1)
+    if len(np.shape(coordinates)) == 2:
+        coordinates = np.asarray(coordinates, dtype=float)
+        if chunk is None:
+            chunk = max(1, CHUNK_SIZE // size)
+        values = np.empty(len(tuples))
+        for start in range(0, len(tuples), chunk):
+            values[start:start + chunk] = kernel(bond_vectors(tuples[start:start + chunk], coordinates, cell))
+        return values
+    values = np.empty((len(coordinates), len(tuples)))
+    if chunk is None:
+        chunk = CHUNK_SIZE // max(size * len(tuples), 1)
+        if chunk == 0:
+            # A single frame is too large -> process each frame in chunks of tuples
+            for frame in range(len(coordinates)):
+                values[frame] = calculate_tuples(kernel, tuples, coordinates[frame], cell)
+            return values
+    for start in range(0, len(coordinates), chunk):
+        values[start:start + chunk] = kernel(bond_vectors(tuples, coordinates[start:start + chunk], cell))
+    return values
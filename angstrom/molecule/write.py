@@ -2,14 +2,25 @@
 --- Ångström ---
 Methods for writing chemical file formats.
 """
-import os
+from itertools import chain
+import numpy as np
 from .cell import Cell
+from .formats import get_writer, register_writer
+
+
+# Maximum number of lines formatted with a single string formatting operation
+CHUNK_LINES = 2**14
+
+# Hybrid-36 digits used for pdb serial numbers larger than 99999
+HY36_UPPER = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+HY36_LOWER = '0123456789abcdefghijklmnopqrstuvwxyz'
 
 
 def write_molecule(filename, atoms, coordinates, bonds=None, group=None, cell=None, header='angstrom'):
     """
     Write molecule file. Supprted formats -> (xyz | pdb | cif)
-    The file format is extracted from the file extension.
+    The file format is extracted from the file extension and the writer is selected from the format registry.
+    Only the keyword arguments supported by the writer of the format are used.
 
     Parameters
     ----------
@@ -19,6 +30,7 @@ def write_molecule(filename, atoms, coordinates, bonds=None, group=None, cell=No
         List of atom names.
     coordinates : list
         List of atomic coordinates.
+        Objects with an 'iter_blocks' method (ex: VirtualSupercell) are written one block at a time.
     bonds : list
         Atomic bonding (used in pdb format).
     group : list
@@ -34,14 +46,10 @@ def write_molecule(filename, atoms, coordinates, bonds=None, group=None, cell=No
         Writes molecule information to given file name.
 
     """
-    file_format = os.path.splitext(filename)[1].replace('.', '')
+    writer, options = get_writer(filename)
+    kwargs = dict(bonds=bonds, group=group, cell=cell, header=header)
     with open(filename, 'w') as fileobj:
-        if file_format == 'xyz':
-            write_xyz(fileobj, atoms, coordinates, header=header)
-        elif file_format == 'pdb':
-            write_pdb(fileobj, atoms, coordinates, bonds=bonds, group=group, header=header)
-        elif file_format == 'cif':
-            write_cif(fileobj, atoms, coordinates, cell=cell, header=header)
+        writer(fileobj, atoms, coordinates, **{option: kwargs[option] for option in options})
 
 
 def write_xyz(fileobj, atoms, coordinates, header='angstrom'):
@@ -68,8 +76,8 @@ def write_xyz(fileobj, atoms, coordinates, header='angstrom'):
     fileobj.write(str(len(coordinates)) + '\n')
     fileobj.write(header + '\n')
     xyz_format = '%-2s %7.4f %7.4f %7.4f\n'
-    for atom, coor in zip(atoms, coordinates):
-        fileobj.write(xyz_format % (atom, coor[0], coor[1], coor[2]))
+    for block_atoms, block_coordinates in _iter_blocks(atoms, coordinates):
+        write_lines(fileobj, xyz_format, [_to_list(block_atoms)] + _columns(block_coordinates))
     fileobj.flush()
 
 
@@ -100,25 +108,113 @@ def write_pdb(fileobj, atoms, coordinates, bonds=None, group=None, header='angst
     """
     fileobj.write('HEADER    %s\n' % header)
     pdb_format = 'HETATM%5d%3s  M%4i %3i     %8.3f%8.3f%8.3f  1.00  0.00          %2s\n'
+    n_atoms = len(coordinates)
+    if n_atoms > 99999:
+        # Atom serial numbers overflow 5 digits -> hybrid-36 encoded serial numbers
+        pdb_format = pdb_format.replace('%5d', '%5s', 1)
     if group is None:
-        group = [1] * len(atoms)
-    for atom_index, (atom_name, atom_coor) in enumerate(zip(atoms, coordinates), start=1):
-        x, y, z = atom_coor
-        residue_no = group[atom_index - 1]
-        fileobj.write(pdb_format % (atom_index, atom_name, residue_no, residue_no, x, y, z, atom_name.rjust(2)))
+        group = [1] * n_atoms
+    atom_index = 0
+    for block_atoms, block_coordinates in _iter_blocks(atoms, coordinates):
+        block_atoms = _to_list(block_atoms)
+        n_block = len(block_atoms)
+        indices = list(range(atom_index + 1, atom_index + n_block + 1))
+        if n_atoms > 99999:
+            indices = [hybrid36(i) for i in indices]
+        residues = _to_list(group[atom_index:atom_index + n_block])
+        columns = [indices, block_atoms, residues, residues] + _columns(block_coordinates)
+        write_lines(fileobj, pdb_format, columns + [[atom.rjust(2) for atom in block_atoms]])
+        atom_index += n_block
     if bonds is not None:
-        for atom in range(1, len(atoms) + 1):
-            atom_bonds = [atom]
-            for b in bonds:
-                if atom == b[0] + 1:
-                    atom_bonds.append(b[1] + 1)
-                elif atom == b[1] + 1:
-                    atom_bonds.append(b[0] + 1)
-            fileobj.write('CONECT' + ' %4i' * len(atom_bonds) % tuple(atom_bonds) + '\n')
+        write_conect(fileobj, bonds, n_atoms)
     fileobj.write('END\n')
     fileobj.flush()
 
 
+def write_conect(fileobj, bonds, n_atoms, chunk=CHUNK_LINES):
+    """
+    Write CONECT records of a pdb file.
+    Neighbor lists of all atoms are built with a single pass over the bonds (neighbors are listed in
+    the order of the bonds). A CONECT record is written for every atom and at most 4 neighbors are
+    written per record, atoms with more neighbors get additional records.
+    Serial numbers larger than 99999 are written in hybrid-36 format.
+
+    Parameters
+    ----------
+    fileobj : file object
+        File object for the pdb file.
+    bonds : list
+        Atom bonding (atom indices start from 0).
+    n_atoms : int
+        Number of atoms.
+    chunk : int
+        Number of records joined for a single write call.
+
+    Returns
+    -------
+    None
+        Writes CONECT records to the file object.
+
+    """
+    bonds = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+    # Interleave both directions of each bond so that a stable sort keeps the bond order
+    source, target = bonds.ravel(), bonds[:, ::-1].ravel()
+    # A bond of an atom to itself is listed only once
+    keep = np.ones(len(source), dtype=bool)
+    keep[1::2] = bonds[:, 0] != bonds[:, 1]
+    source, target = source[keep], target[keep]
+    order = np.argsort(source, kind='stable')
+    neighbors = target[order].tolist()
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(source, minlength=n_atoms)))).tolist()
+    serials = [hybrid36(i) for i in range(n_atoms + 1)]
+    records = []
+    for atom in range(n_atoms):
+        atom_neighbors = neighbors[indptr[atom]:indptr[atom + 1]]
+        record = 'CONECT' + serials[atom + 1]
+        if len(atom_neighbors) == 0:
+            records.append(record + '\n')
+        for start in range(0, len(atom_neighbors), 4):
+            records.append(record + ''.join([serials[i + 1] for i in atom_neighbors[start:start + 4]]) + '\n')
+        if len(records) >= chunk:
+            fileobj.write(''.join(records))
+            records = []
+    fileobj.write(''.join(records))
+
+
+def hybrid36(value, width=5):
+    """
+    Encode integer in hybrid-36 format used for pdb serial numbers that do not fit in the field width.
+    Numbers up to 10^width - 1 are written as decimal numbers, larger numbers are written
+    in base-36 starting with upper case letters followed by lower case letters.
+
+    Parameters
+    ----------
+    value : int
+        Non-negative integer.
+    width : int
+        Field width.
+
+    Returns
+    -------
+    str
+        Hybrid-36 encoded string right justified to given width.
+
+    """
+    if value < 10 ** width:
+        return '%*d' % (width, value)
+    value -= 10 ** width
+    for digits in [HY36_UPPER, HY36_LOWER]:
+        if value < 26 * 36 ** (width - 1):
+            value += 10 * 36 ** (width - 1)
+            encoded = ''
+            while value > 0:
+                value, digit = divmod(value, 36)
+                encoded = digits[digit] + encoded
+            return encoded
+        value -= 26 * 36 ** (width - 1)
+    raise Exception('Value out of range for hybrid-36 encoding with width %i' % width)
+
+
 def write_cif(fileobj, atoms, coordinates, cell=None, header='angstrom'):
     """
     Write given atomic coordinates to file in cif format.
@@ -142,11 +238,11 @@ def write_cif(fileobj, atoms, coordinates, cell=None, header='angstrom'):
         Creates a new .cif file.
 
     """
+    uc = None
     if cell is None:
         cell = [1, 1, 1, 90, 90, 90]
     else:
         uc = Cell(cell)
-        coordinates = [uc.car2frac(c) for c in coordinates]
     fileobj.write('data_%s\n' % header)
     fileobj.write("_symmetry_space_group_name_H-M    'P1'\n")
     fileobj.write('_symmetry_Int_Tables_number       1\n')
@@ -164,6 +260,75 @@ def write_cif(fileobj, atoms, coordinates, cell=None, header='angstrom'):
     fileobj.write('_atom_site_fract_y\n')
     fileobj.write('_atom_site_fract_z\n')
     cif_format = '%s%-4i %2s %7.4f %7.4f %7.4f\n'
-    for i, (atom, coor) in enumerate(zip(atoms, coordinates)):
-        fileobj.write(cif_format % (atom, i, atom, coor[0], coor[1], coor[2]))
+    atom_index = 0
+    for block_atoms, block_coordinates in _iter_blocks(atoms, coordinates):
+        if uc is not None:
+            block_coordinates = uc.car2frac(block_coordinates)
+        block_atoms = _to_list(block_atoms)
+        indices = list(range(atom_index, atom_index + len(block_atoms)))
+        write_lines(fileobj, cif_format, [block_atoms, indices, block_atoms] + _columns(block_coordinates))
+        atom_index += len(block_atoms)
     fileobj.flush()
+
+
+def write_lines(fileobj, line_format, columns, chunk=CHUNK_LINES):
+    """
+    Write formatted lines in bulk.
+    The line format is repeated for a chunk of lines and applied to all values of the chunk at once,
+    resulting in a single write call for each chunk.
+
+    Parameters
+    ----------
+    fileobj : file object
+        File object to write lines.
+    line_format : str
+        Format string for a single line (ex: '%-2s %7.4f %7.4f %7.4f\\n').
+    columns : list
+        List of columns holding the values of each format field (truncated to the shortest column as in zip).
+    chunk : int
+        Number of lines formatted at once.
+
+    Returns
+    -------
+    None
+        Writes formatted lines to the file object.
+
+    """
+    n_lines = min(len(column) for column in columns)
+    for start in range(0, n_lines, chunk):
+        rows = zip(*[column[start:start + chunk] for column in columns])
+        n_chunk = min(chunk, n_lines - start)
+        fileobj.write((line_format * n_chunk) % tuple(chain.from_iterable(rows)))
+
+
+def _columns(coordinates):
+    """
+    Returns x, y, z columns of coordinates as lists of Python floats.
+
+    """
+    return np.asarray(coordinates, dtype=float).reshape(-1, 3).T.tolist()
+
+
+def _to_list(values):
+    """
+    Returns given sequence as a list of Python objects.
+
+    """
+    return np.asarray(values).tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _iter_blocks(atoms, coordinates):
+    """
+    Iterate over (atoms, coordinates) blocks.
+    Coordinates with an 'iter_blocks' method (ex: VirtualSupercell) are streamed block by block.
+
+    """
+    if hasattr(coordinates, 'iter_blocks'):
+        yield from coordinates.iter_blocks()
+    else:
+        yield atoms, coordinates
+
+
+register_writer('xyz', write_xyz, options=['header'])
+register_writer('pdb', write_pdb, options=['bonds', 'group', 'header'])
+register_writer('cif', write_cif, options=['cell', 'header'])
@@ -3,3 +3,4 @@
 Trajectory class for Ångström Python package.
 """
 from .trajectory import Trajectory
+from .binary import xyz_to_binary, binary_to_xyz
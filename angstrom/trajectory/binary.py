@@ -0,0 +1,185 @@
+"""
+--- Ångström ---
+Compact binary trajectory format with memory-mapped access.
+
+File layout:
+    - Magic bytes (8 bytes): b'ANGTRAJ1'
+    - Header length (8 bytes): little-endian unsigned integer
+    - Header (JSON): number of frames and atoms, coordinate data type, atom names (stored once),
+      frame headers, and byte offsets of the frame index and coordinate data
+    - Frame index: little-endian int64 byte offset of each frame
+    - Coordinates: little-endian float32 or float64 array with shape (n_frames, n_atoms, 3)
+"""
+import json
+import numpy as np
+from .read import read_xyz_traj
+from .write import write_xyz_traj
+
+
+MAGIC = b'ANGTRAJ1'
+ALIGNMENT = 64
+
+
+def write_binary_traj(filename, atoms, coordinates, headers=None, dtype='float32'):
+    """
+    Write trajectory in binary format.
+    The number and order of atoms must be the same for each frame.
+
+    Parameters
+    ----------
+    filename : str
+        Binary trajectory file name.
+    atoms : list
+        List of atom names with shape (N,) or for each frame with shape (n_frames, N).
+    coordinates : list
+        List of atomic coordinates for each frame with shape (n_frames, N, 3).
+        Any sequence of (N, 3) frames can be used (frames are written one by one).
+    headers : list or None
+        List of frame headers.
+    dtype : str
+        Data type of the coordinates (float32 | float64).
+
+    Returns
+    -------
+    None
+        Writes binary trajectory file.
+
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    atoms = np.asarray(atoms)
+    if atoms.ndim == 2:
+        if not np.all(atoms == atoms[0]):
+            raise Exception('Binary trajectory cannot have different atoms per frame')
+        atoms = atoms[0]
+    n_frames, n_atoms = len(coordinates), len(atoms)
+    frame_size = n_atoms * 3 * dtype.itemsize
+
+    header = {'n_frames': n_frames, 'n_atoms': n_atoms, 'dtype': dtype.name,
+              'atoms': [str(a) for a in atoms],
+              'headers': None if headers is None else [str(h) for h in headers]}
+    # Offsets depend on the header length, the header is padded to keep the data aligned
+    header_bytes = json.dumps(header).encode()
+    index_offset = _align(len(MAGIC) + 8 + len(header_bytes) + 128)
+    data_offset = _align(index_offset + 8 * n_frames)
+    header.update(index_offset=index_offset, data_offset=data_offset)
+    header_bytes = json.dumps(header).encode().ljust(index_offset - len(MAGIC) - 8)
+
+    with open(filename, 'wb') as traj_file:
+        traj_file.write(MAGIC)
+        traj_file.write(np.array(len(header_bytes), dtype='<u8').tobytes())
+        traj_file.write(header_bytes)
+        traj_file.write(np.arange(data_offset, data_offset + n_frames * frame_size, frame_size, dtype='<i8').tobytes())
+        traj_file.write(b'\0' * (data_offset - traj_file.tell()))
+        for frame_coors in coordinates:
+            traj_file.write(np.ascontiguousarray(frame_coors, dtype=dtype).tobytes())
+
+
+def read_binary_traj(filename, mmap=True):
+    """
+    Read trajectory in binary format.
+
+    Parameters
+    ----------
+    filename : str
+        Binary trajectory file name.
+    mmap : bool
+        Memory-map the coordinates (zero-copy, copy-on-write) instead of reading them into memory.
+        Coordinates can be modified in place, changes are kept in memory and never written to the file.
+
+    Returns
+    -------
+    dict
+        Trajectory dictionary with 'atoms' (N,), 'coordinates' (n_frames, N, 3), 'headers' and 'index' keys.
+
+    """
+    header = read_binary_header(filename)
+    shape = (header['n_frames'], header['n_atoms'], 3)
+    dtype = np.dtype(header['dtype']).newbyteorder('<')
+    if mmap and header['n_frames'] > 0:
+        coordinates = np.memmap(filename, dtype=dtype, mode='c', offset=header['data_offset'], shape=shape)
+    else:
+        with open(filename, 'rb') as traj_file:
+            traj_file.seek(header['data_offset'])
+            coordinates = np.fromfile(traj_file, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+    index = np.fromfile(filename, dtype='<i8', count=header['n_frames'], offset=header['index_offset'])
+    headers = header['headers']
+    if headers is None:
+        headers = ['angstrom - %i' % i for i in range(header['n_frames'])]
+    return {'atoms': np.array(header['atoms'], dtype='U2'), 'coordinates': coordinates,
+            'headers': np.array(headers, dtype=object), 'index': index}
+
+
+def read_binary_header(filename):
+    """
+    Read header of a binary trajectory file.
+
+    Parameters
+    ----------
+    filename : str
+        Binary trajectory file name.
+
+    Returns
+    -------
+    dict
+        Binary trajectory header.
+
+    """
+    with open(filename, 'rb') as traj_file:
+        if traj_file.read(len(MAGIC)) != MAGIC:
+            raise Exception('%s is not an Ångström binary trajectory file' % filename)
+        header_length = int(np.frombuffer(traj_file.read(8), dtype='<u8')[0])
+        return json.loads(traj_file.read(header_length).decode())
+
+
+def xyz_to_binary(xyz_file, binary_file, dtype='float32'):
+    """
+    Convert xyz trajectory to binary trajectory format.
+
+    Parameters
+    ----------
+    xyz_file : str
+        Trajectory file in xyz format.
+    binary_file : str
+        Binary trajectory file name.
+    dtype : str
+        Data type of the coordinates (float32 | float64).
+
+    Returns
+    -------
+    None
+        Writes binary trajectory file.
+
+    """
+    traj = read_xyz_traj(xyz_file)
+    write_binary_traj(binary_file, traj['atoms'], traj['coordinates'], headers=traj['headers'], dtype=dtype)
+
+
+def binary_to_xyz(binary_file, xyz_file):
+    """
+    Convert binary trajectory to xyz trajectory format.
+
+    Parameters
+    ----------
+    binary_file : str
+        Binary trajectory file name.
+    xyz_file : str
+        Trajectory file in xyz format.
+
+    Returns
+    -------
+    None
+        Writes xyz trajectory file.
+
+    """
+    traj = read_binary_traj(binary_file)
+    atoms = np.broadcast_to(traj['atoms'], traj['coordinates'].shape[:2])
+    with open(xyz_file, 'w') as traj_file:
+        write_xyz_traj(traj_file, atoms, traj['coordinates'], headers=traj['headers'])
+
+
+def _align(offset):
+    """
+    Round offset up to the next multiple of ALIGNMENT bytes.
+
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -4,6 +4,7 @@ Read trajectory from molecular file formats.
 """
 import os
 import numpy as np
+from angstrom.molecule.read import parse_xyz_block
 
 
 def read_xyz_traj(filename):
@@ -22,17 +23,276 @@ def read_xyz_traj(filename):
         Trajectory dictionary with 'atoms', 'coordinates', 'timestep' and 'xyz' keys.
 
     """
-    with open(filename, 'r') as traj_file:
-        traj = traj_file.readlines()
+    with open(filename, 'rb') as traj_file:
+        traj = traj_file.read().splitlines()
     n_atoms = int(traj[0].strip())                # Get number of atoms from first line
     n_frames = int(len(traj) / (n_atoms + 2))     # Calculate number of frames (assuming n_atoms is constant)
     trajectory = {'atoms': np.empty((n_frames, n_atoms), dtype='U2'),  # String of length 2
                   'coordinates': np.empty((n_frames, n_atoms, 3)),     # Float
                   'headers': np.empty((n_frames,), dtype=object)}      # Python object
-    for frame in range(n_frames):
-        start = frame * (n_atoms + 2)             # Frame start
-        end = (frame + 1) * (n_atoms + 2)         # Frame end
-        trajectory['coordinates'][frame] = [[float(i) for i in line.split()[1:4]] for line in traj[start + 2:end]]
-        trajectory['atoms'][frame] = [line.split()[0] for line in traj[start + 2:end]]
-        trajectory['headers'][frame] = (traj[start + 1].strip())
+    traj = traj[:n_frames * (n_atoms + 2)]
+    trajectory['headers'][:] = [header.decode().strip() for header in traj[1::n_atoms + 2]]
+    # Remove number of atoms and header lines of each frame and parse all atom lines at once
+    del traj[0::n_atoms + 2]
+    del traj[0::n_atoms + 1]
+    parse_xyz_block(traj, n_frames * n_atoms, atoms=trajectory['atoms'].reshape(-1),
+                    coordinates=trajectory['coordinates'].reshape(-1, 3))
     return trajectory
+
+
+def iter_xyz_traj(filename, chunk=None, stride=1, start=0, stop=None):
+    """
+    Iterate over the frames of an xyz trajectory by streaming the file.
+    Assumes number of atoms is constant.
+    The frames are parsed into a single preallocated buffer, memory use does not depend on the
+    number of frames. The yielded arrays are overwritten in the next iteration, copy them if needed.
+
+    Parameters
+    ----------
+    filename : str
+        Trajectory file in xyz format.
+    chunk : int or None
+        Number of frames to yield at once. If None frames are yielded one by one.
+    stride : int
+        Read every 'stride' frame.
+    start : int
+        Index of the first frame to read.
+    stop : int or None
+        Index of the frame to stop reading (exclusive). If None read until the end of file.
+
+    Yields
+    ------
+    tuple
+        Atom names with shape (N,) and coordinates with shape (N, 3) of each frame if chunk is None
+        or with shapes (k, N) and (k, N, 3) for chunks of k frames (k <= chunk).
+
+    """
+    with open(filename, 'r') as traj_file:
+        n_atoms = int(traj_file.readline().strip())
+        traj_file.seek(0)
+        n_buffer = 1 if chunk is None else chunk
+        atoms, coordinates = np.empty((n_buffer, n_atoms), dtype='U2'), np.empty((n_buffer, n_atoms, 3))
+        frame, n_read = 0, 0
+        while stop is None or frame < stop:
+            if not traj_file.readline().strip():
+                break
+            traj_file.readline()
+            if frame >= start and (frame - start) % stride == 0:
+                lines = [traj_file.readline() for i in range(n_atoms)]
+                if len(lines[-1]) == 0:
+                    break
+                parse_xyz_lines(lines, atoms[n_read], coordinates[n_read])
+                n_read += 1
+                if n_read == n_buffer:
+                    yield (atoms[0], coordinates[0]) if chunk is None else (atoms, coordinates)
+                    n_read = 0
+            else:
+                for i in range(n_atoms):
+                    traj_file.readline()
+            frame += 1
+        if n_read > 0 and chunk is not None:
+            yield atoms[:n_read], coordinates[:n_read]
+
+
+def parse_xyz_lines(lines, atoms, coordinates):
+    """
+    Parse atom lines of an xyz frame into given atom names and coordinates arrays.
+
+    Parameters
+    ----------
+    lines : list
+        List of atom lines -> 'C 0.000 1.000 2.000'.
+    atoms : ndarray
+        Array to assign atom names with shape (N,).
+    coordinates : ndarray
+        Array to assign coordinates with shape (N, 3).
+
+    Returns
+    -------
+    None
+        Assigns atom names and coordinates in place.
+
+    """
+    parse_xyz_block(lines, len(lines), atoms, coordinates)
+
+
+def index_xyz_traj(filename, save=True, chunk_size=2**26):
+    """
+    Scan xyz trajectory once and record the byte offset of each frame.
+    Assumes number of atoms is constant.
+    The index is saved to a sidecar file (filename + '.idx') and reused as long as the
+    size and modification time of the trajectory file do not change.
+
+    Parameters
+    ----------
+    filename : str
+        Trajectory file in xyz format.
+    save : bool
+        Read and write the sidecar index file.
+    chunk_size : int
+        Number of bytes read at once while scanning the file.
+
+    Returns
+    -------
+    ndarray
+        Byte offsets of each frame followed by the file size with shape (n_frames + 1,).
+
+    """
+    index_file = filename + '.idx'
+    stat = os.stat(filename)
+    if save and os.path.exists(index_file):
+        try:
+            index = np.load(index_file)
+            if index[0] == stat.st_size and index[1] == stat.st_mtime_ns:
+                return index[2:]
+        except (OSError, ValueError):
+            pass
+
+    with open(filename, 'rb') as traj_file:
+        n_lines = int(traj_file.readline().strip()) + 2
+        traj_file.seek(0)
+        offsets, line_count, position, last_byte = [np.zeros(1, dtype=np.int64)], 1, 0, b'\n'
+        while True:
+            chunk = traj_file.read(chunk_size)
+            if not chunk:
+                break
+            last_byte = chunk[-1:]
+            # Line starts are the positions after each new line character
+            line_starts = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10) + position + 1
+            frame_starts = (np.arange(len(line_starts)) + line_count) % n_lines == 0
+            offsets.append(line_starts[frame_starts])
+            line_count += len(line_starts)
+            position += len(chunk)
+    # Drop incomplete frames at the end of the file
+    n_lines_total = line_count - 1 if last_byte == b'\n' else line_count
+    offsets = np.concatenate(offsets)[:n_lines_total // n_lines]
+    offsets = np.append(offsets, stat.st_size)
+
+    if save:
+        try:
+            with open(index_file, 'wb') as index_fileobj:
+                np.save(index_fileobj, np.concatenate(([stat.st_size, stat.st_mtime_ns], offsets)))
+        except OSError:
+            pass
+    return offsets
+
+
+class XYZTrajectoryReader:
+    """
+    Random access reader for xyz trajectories using the byte offset of each frame.
+    Frames are parsed on demand, only the most recently read frame is kept in memory.
+
+    """
+    def __init__(self, filename, starts=None, ends=None, index=True):
+        """
+        Initialize reader by indexing the trajectory file.
+
+        Parameters
+        ----------
+        filename : str
+            Trajectory file in xyz format.
+        starts : ndarray or None
+            Start byte offsets of the frames to read (default: all frames from the file index).
+        ends : ndarray or None
+            End byte offsets of the frames to read (default: all frames from the file index).
+        index : bool
+            Read and write the sidecar index file.
+
+        """
+        self.filename = filename
+        if starts is None or ends is None:
+            offsets = index_xyz_traj(filename, save=index)
+            starts, ends = offsets[:-1], offsets[1:]
+        self.starts, self.ends = starts, ends
+        with open(filename, 'r') as traj_file:
+            self.n_atoms = int(traj_file.readline().strip())
+        self._cache = (None, None)
+        self.atoms = LazyFrames(self, 0)
+        self.coordinates = LazyFrames(self, 1)
+        self.headers = LazyFrames(self, 2)
+
+    def __repr__(self):
+        return "<XYZTrajectoryReader %s | frames: %i | atoms: %i>" % (self.filename, len(self), self.n_atoms)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def subset(self, frames):
+        """
+        Returns a new reader for a subset of frames without scanning the file again.
+
+        Parameters
+        ----------
+        frames : slice or ndarray
+            Frame indices.
+
+        Returns
+        -------
+        XYZTrajectoryReader
+            Reader for the selected frames.
+
+        """
+        return XYZTrajectoryReader(self.filename, starts=self.starts[frames], ends=self.ends[frames])
+
+    def read_frame(self, frame):
+        """
+        Read a single frame.
+
+        Parameters
+        ----------
+        frame : int
+            Frame index.
+
+        Returns
+        -------
+        tuple
+            Atom names, coordinates, and header of the frame.
+
+        """
+        frame = range(len(self))[frame]
+        if self._cache[0] != frame:
+            with open(self.filename, 'rb') as traj_file:
+                traj_file.seek(self.starts[frame])
+                lines = traj_file.read(self.ends[frame] - self.starts[frame]).splitlines()
+            atoms, coordinates = parse_xyz_block(lines[2:self.n_atoms + 2], self.n_atoms)
+            self._cache = (frame, (atoms, coordinates, lines[1].decode().strip()))
+        return self._cache[1]
+
+
+class LazyFrames:
+    """
+    Array-like view of one field (atoms | coordinates | headers) of a lazily read trajectory.
+
+    """
+    def __init__(self, reader, field):
+        self.reader, self.field = reader, field
+
+    def __len__(self):
+        return len(self.reader)
+
+    @property
+    def shape(self):
+        n_frames, n_atoms = len(self.reader), self.reader.n_atoms
+        return [(n_frames, n_atoms), (n_frames, n_atoms, 3), (n_frames,)][self.field]
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, i):
+        """
+        Returns a single frame for an integer index or stacked frames for slices and index arrays.
+
+        """
+        if isinstance(i, (int, np.integer)):
+            return self.reader.read_frame(i)[self.field]
+        frames = range(len(self))[i] if isinstance(i, slice) else i
+        return np.array([self.reader.read_frame(j)[self.field] for j in frames])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.reader.read_frame(i)[self.field]
+
+    def __array__(self, dtype=None, copy=None):
+        array = self[:]
+        return array if dtype is None else array.astype(dtype)
@@ -2,9 +2,11 @@
 --- Ångström ---
 Read, manipulate and analyze molecular trajectory files.
 """
-from .read import read_xyz_traj
+from .read import read_xyz_traj, iter_xyz_traj, XYZTrajectoryReader
 from .write import write_xyz_traj
-from angstrom.geometry import get_molecule_center
+from .binary import read_binary_traj, write_binary_traj
+from angstrom.geometry import get_molecule_center, center_of_mass, get_descriptors, Plane
+from angstrom.elements import get_masses
 from angstrom import Molecule
 import numpy as np
 import os
@@ -13,34 +15,41 @@ import os
 class Trajectory:
     """
     Reading and analyzing trajectories in xyz format.
+    If the atoms are the same for every frame they are stored once as a shared topology ('topology' attribute)
+    and the 'atoms' attribute is a read-only view of it for each frame.
 
     """
-    def __init__(self, atoms=None, coordinates=None, read=None, molecule=None):
+    def __init__(self, atoms=None, coordinates=None, read=None, molecule=None, lazy=False):
         """
         Create a trajectory object.
 
         Parameters
         ----------
         atoms : list or None
-            List of elements of the molecule for each frame.
+            List of elements of the molecule for each frame or a single list of elements shared by all frames.
         coordinates : list or None
             List of atomic positions of the molecule for each frame.
         read : str or None
             File name to read molecule file (formats: xyz).
         molecule : Molecule
             Create a Trajectory with 1 frame from a Molecule object.
+        lazy : bool
+            Read frames from the file on demand instead of loading the whole trajectory (see 'read').
 
         """
         self.name = 'Trajectory'
+        self.reader = None
+        self.bonds = None
         if atoms is not None and coordinates is not None:
             self.atoms = atoms
             self.coordinates = coordinates
         elif read is not None:
-            self.read(read)
+            self.read(read, lazy=lazy)
         elif molecule is not None:
-            self.atoms = np.array([molecule.atoms])
+            self.atoms = np.array(molecule.atoms)
             self.coordinates = np.array([molecule.coordinates])
             self.name = molecule.name
+            self.bonds = getattr(molecule, 'bonds', None)
         else:
             self.atoms = []
             self.coordinates = []
@@ -58,7 +67,37 @@ class Trajectory:
         Returns number of frames.
 
         """
-        return len(self.atoms)
+        return len(self.coordinates)
+
+    @property
+    def atoms(self):
+        """
+        Atom names for each frame with shape (n_frames, n_atoms).
+        For a shared topology this is a read-only view of the 'topology' attribute (no memory per frame).
+
+        """
+        if self.topology is not None:
+            return np.broadcast_to(self.topology, (len(self.coordinates), len(self.topology)))
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        """
+        Assign atom names as a shared topology (1D or same atoms for all frames) or for each frame (2D).
+
+        """
+        self._atoms, self.topology = None, None
+        if isinstance(atoms, (list, tuple, np.ndarray)):
+            atoms = np.asarray(atoms)
+            if atoms.ndim == 1:
+                self.topology = atoms
+            elif len(atoms) > 0 and np.all(atoms == atoms[0]):
+                self.topology = np.array(atoms[0])
+            else:
+                self._atoms = atoms
+        else:
+            # Array-like atoms (lazy reading) are kept as they are
+            self._atoms = atoms
 
     def __add__(self, traj):
         """
@@ -90,13 +129,26 @@ class Trajectory:
             indices = range(len(self))[i.start:i.stop:i.step]
             if len(indices) == 0:
                 return []
+            elif self.reader is not None:
+                new_traj = Trajectory()
+                new_traj._set_reader(self.reader.subset(i))
+                new_traj.name = self.name
+                return new_traj
             else:
-                new_traj = Trajectory(molecule=self[indices[0]])
-                for j in indices[1:]:
-                    new_traj.append(self[j])
+                # Basic slicing of the arrays returns views, no frames are copied
+                atoms = self.topology if self.topology is not None else self.atoms[i]
+                new_traj = Trajectory(atoms=atoms, coordinates=self.coordinates[i])
+                if hasattr(self, 'headers'):
+                    new_traj.headers = self.headers[i]
+                new_traj.name, new_traj.bonds = self.name, self.bonds
                 return new_traj
         else:
-            return Molecule(atoms=self.atoms[i], coordinates=self.coordinates[i])
+            # Atoms are shared with the trajectory -> read-only view so that frames can not change them
+            atoms = self.topology if self.topology is not None else self.atoms[i]
+            mol = Molecule(atoms=_read_only(atoms), coordinates=self.coordinates[i])
+            if self.bonds is not None:
+                mol.bonds = self.bonds
+            return mol
 
     def __iter__(self):
         """
@@ -122,6 +174,7 @@ class Trajectory:
         """
         Append molecule to trajectory.
         The number of atoms in the molecule must match that of the trajectory.
+        Frames are stored in buffers with doubling capacity so appending is amortized O(1).
 
         Parameters
         ----------
@@ -134,38 +187,131 @@ class Trajectory:
             Added to Trajectory object.
 
         """
-        if len(mol.atoms) != self.atoms.shape[1]:
+        n_frames = len(self)
+        if n_frames > 0 and len(mol.atoms) != np.shape(self.atoms)[1]:
             raise Exception('Trajectory cannot have different number of atoms per frame')
-        self.atoms = np.append(self.atoms, [mol.atoms], axis=0)
-        self.coordinates = np.append(self.coordinates, [mol.coordinates], axis=0)
+        if n_frames == 0:
+            self.topology, self._atoms = np.array(mol.atoms), None
+        elif self.topology is not None and not np.array_equal(self.topology, mol.atoms):
+            # Composition changes -> switch to storing atoms for each frame
+            self.topology, self._atoms = None, np.array(self.atoms)
+        # Lazily read and memory-mapped trajectories are loaded into memory
+        if self.topology is None:
+            self._atoms = self._append_frame('atoms', self._atoms, mol.atoms)
+        self.coordinates = self._append_frame('coordinates', self.coordinates, mol.coordinates)
+        if hasattr(self, 'headers'):
+            header = getattr(mol, 'header', 'angstrom - %i' % n_frames)
+            self.headers = self._append_frame('headers', self.headers, np.array(header, dtype=object))
+        self.reader = None
+
+    def _append_frame(self, name, frames, frame):
+        """
+        Append frame to an array of frames stored in a buffer with doubling capacity.
+        The returned array is a view of the buffer, the buffer is only copied when it is full.
 
-    def read(self, filename):
         """
-        Read xyz formatted trajectory file.
+        if not hasattr(self, '_buffers'):
+            self._buffers = {}
+        buffer = self._buffers.get(name)
+        frame = np.asarray(frame)
+        n_frames = len(frames)
+        if (buffer is None or not isinstance(frames, np.ndarray) or frames.base is not buffer
+                or n_frames == len(buffer) or buffer.shape[1:] != frame.shape
+                or np.promote_types(buffer.dtype, frame.dtype) != buffer.dtype):
+            frames = np.asarray(frames) if n_frames > 0 else np.empty((0,) + frame.shape, dtype=frame.dtype)
+            buffer = np.empty((max(2 * n_frames, 8),) + frame.shape, dtype=np.promote_types(frames.dtype, frame.dtype))
+            buffer[:n_frames] = frames
+            self._buffers[name] = buffer
+        buffer[n_frames] = frame
+        return buffer[:n_frames + 1]
+
+    def read(self, filename, lazy=False):
+        """
+        Read trajectory file, file format extracted from file extension (formats: xyz | atraj).
 
         Parameters
         ----------
         filename : str
             Trajectory file name.
+        lazy : bool
+            Index the byte offset of each frame and parse frames only when they are accessed (xyz).
+            The frame index is saved next to the trajectory file (filename + '.idx') and reused.
+            Binary (atraj) trajectories are always memory-mapped.
 
         Returns
         -------
         None
             Assigns 'coordinates', 'atoms', and 'headers' attributes.
+            For lazy reading these are array-like views that read frames from the file.
+
+        """
+        self.name, file_format = os.path.splitext(os.path.basename(filename))
+        if file_format == '.atraj':
+            traj = read_binary_traj(filename, mmap=True)
+            self.atoms, self.coordinates, self.headers = traj['atoms'], traj['coordinates'], traj['headers']
+        elif lazy:
+            self._set_reader(XYZTrajectoryReader(filename))
+        else:
+            traj = read_xyz_traj(filename)
+            self.atoms, self.coordinates, self.headers = traj['atoms'], traj['coordinates'], traj['headers']
+
+    def _set_reader(self, reader):
+        """
+        Use a lazy trajectory reader for 'atoms', 'coordinates', and 'headers' attributes.
 
         """
-        self.name = os.path.splitext(os.path.basename(filename))[0]
-        traj = read_xyz_traj(filename)
-        self.atoms, self.coordinates, self.headers = traj['atoms'], traj['coordinates'], traj['headers']
+        self.reader = reader
+        self.atoms, self.coordinates, self.headers = reader.atoms, reader.coordinates, reader.headers
 
-    def write(self, filename):
+    @staticmethod
+    def iterread(filename, chunk=None, stride=1, start=0, stop=None):
         """
-        Write xyz formatted trajectory file.
+        Stream frames of an xyz trajectory file without loading the trajectory into memory.
+        A single preallocated buffer is reused for all frames, so the yielded objects are
+        overwritten in the next iteration (copy them if they need to be stored).
+
+        Example (center of mass of each frame):
+            >>> centers = [mol.get_center() for mol in Trajectory.iterread('traj.xyz')]
 
         Parameters
         ----------
         filename : str
             Trajectory file name (formats: xyz).
+        chunk : int or None
+            Number of frames to yield at once as a coordinates array.
+            If None frames are yielded one by one as Molecule objects.
+        stride : int
+            Read every 'stride' frame.
+        start : int
+            Index of the first frame to read.
+        stop : int or None
+            Index of the frame to stop reading (exclusive).
+
+        Yields
+        ------
+        Molecule or ndarray
+            Molecule object for each frame or coordinates of k frames with shape (k, N, 3) for chunks.
+
+        """
+        name = os.path.splitext(os.path.basename(filename))[0]
+        for atoms, coordinates in iter_xyz_traj(filename, chunk=chunk, stride=stride, start=start, stop=stop):
+            if chunk is None:
+                mol = Molecule(atoms=atoms, coordinates=coordinates)
+                mol.name = name
+                yield mol
+            else:
+                yield coordinates
+
+    def write(self, filename, dtype='float32'):
+        """
+        Write trajectory file, file format extracted from file extension (formats: xyz | atraj).
+
+        Parameters
+        ----------
+        filename : str
+            Trajectory file name (formats: xyz | atraj).
+        dtype : str
+            Coordinate data type for binary trajectory files (float32 | float64).
 
         Returns
         -------
@@ -173,15 +319,38 @@ class Trajectory:
             Writes molecule information to given file name.
 
         """
+        if os.path.splitext(filename)[1] == '.atraj':
+            write_binary_traj(filename, self.atoms, self.coordinates, headers=getattr(self, 'headers', None), dtype=dtype)
+            return
         with open(filename, 'w') as traj_file:
             if hasattr(self, 'headers'):
                 write_xyz_traj(traj_file, self.atoms, self.coordinates, headers=self.headers)
             else:
                 write_xyz_traj(traj_file, self.atoms, self.coordinates)
 
+    def get_bonds(self, frame=0):
+        """
+        Estimate bonding from a single frame and assign it to the shared topology.
+
+        Parameters
+        ----------
+        frame : int
+            Frame index used for bonding estimation.
+
+        Returns
+        -------
+        None
+            Assigns 'bonds' attribute, shared by all Molecule objects returned from the Trajectory.
+
+        """
+        mol = self[frame]
+        mol.get_bonds()
+        self.bonds = mol.bonds
+
     def get_center(self, mass=True):
         """
         Get coordinates of molecule center at each frame.
+        For a constant composition all frames are calculated at once (in chunks of frames).
 
         Parameters
         ----------
@@ -194,7 +363,84 @@ class Trajectory:
             Molecule center coordinates for each frame.
 
         """
-        centers = np.empty((len(self.atoms), 3))
+        if self.topology is not None:
+            return center_of_mass(self.coordinates, masses=self._masses(mass))
+        centers = np.empty((len(self.coordinates), 3))
         for f, (frame_atoms, frame_coors) in enumerate(zip(self.atoms, self.coordinates)):
             centers[f] = get_molecule_center(frame_atoms, frame_coors, mass=mass)
         return centers
+
+    def get_descriptors(self, mass=True, chunk=None):
+        """
+        Calculate geometric descriptors for all frames in a single pass over the coordinates:
+        center, radius of gyration, inertia tensor, principal moments and axes, and bounding box.
+        Mass weighting requires the same atoms for each frame. For lazily read trajectories the
+        atoms of the first frame are used for all frames.
+
+        Parameters
+        ----------
+        mass : bool
+            Use atomic masses (True) or the same weight for all atoms (False).
+        chunk : int or None
+            Number of frames processed at once.
+
+        Returns
+        -------
+        dict
+            Descriptors for each frame (see angstrom.geometry.get_descriptors).
+
+        """
+        return get_descriptors(self.coordinates, masses=self._masses(mass), chunk=chunk)
+
+    def _masses(self, mass=True):
+        """
+        Returns atomic masses of the shared topology (None for unit weights).
+        Lazily read trajectories use the atoms of the first frame.
+
+        """
+        if not mass:
+            return None
+        if self.topology is not None:
+            return get_masses(self.topology)
+        if self.reader is not None and len(self) > 0:
+            return get_masses(self.atoms[0])
+        raise Exception('Mass weighted descriptors require the same atoms for each frame (use mass=False)')
+
+    def reflect(self, plane, translate=None):
+        """
+        Get mirror image of all frames by reflecting the coordinates through a plane of reflection.
+        Coordinates are reflected in place in a single pass (memory-mapped and lazily read
+        trajectories are loaded into memory).
+
+        Parameters
+        ----------
+        plane : Plane
+            Mirror plane given as a Plane object, 3 points or a string (ex: 'xy') for main planes.
+        translate : float or None
+            Translate all frames after reflection by given amount on the axis normal to the plane.
+
+        Returns
+        -------
+        None
+            Modifies 'coordinates' attribute of the Trajectory object.
+
+        """
+        self.plane = Plane.from_args(plane)
+        coordinates = self.coordinates
+        if not (isinstance(coordinates, np.ndarray) and coordinates.flags.writeable and coordinates.dtype.kind == 'f'):
+            coordinates = np.array(coordinates, dtype=float)
+        self.plane.reflect(coordinates, out=coordinates)
+        if translate is not None:
+            coordinates += np.array([self.plane.a, self.plane.b, self.plane.c]) * translate
+        self.coordinates = coordinates
+        self.reader = None
+
+
+def _read_only(array):
+    """
+    Returns a read-only view of an array.
+
+    """
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+    return view
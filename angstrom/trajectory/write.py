@@ -2,6 +2,7 @@
 --- Ångström ---
 Functions for writing Trajectory files.
 """
+from angstrom.molecule.write import write_lines, _columns, _to_list
 
 
 def write_xyz_traj(fileobj, atoms, coordinates, headers=None):
@@ -30,8 +31,7 @@ def write_xyz_traj(fileobj, atoms, coordinates, headers=None):
         headers = ['angstrom - %i' % i for i in range(n_frames)]
     xyz_format = '%-2s %7.4f %7.4f %7.4f\n'
     for frame_atoms, frame_coors, frame_header in zip(atoms, coordinates, headers):
-        fileobj.write('%i\n' % len(frame_atoms))
-        fileobj.write('%s\n' % frame_header)
-        for atom, coor in zip(frame_atoms, frame_coors):
-            fileobj.write(xyz_format % (atom, coor[0], coor[1], coor[2]))
-        fileobj.flush()
+        frame_atoms = _to_list(frame_atoms)
+        fileobj.write('%i\n%s\n' % (len(frame_atoms), frame_header))
+        write_lines(fileobj, xyz_format, [frame_atoms] + _columns(frame_coors))
+    fileobj.flush()
@@ -6,6 +6,7 @@ Molecular visualization models for Blender.
 import os
 import yaml
 import pickle
+import tempfile
 import subprocess
 from pprint import pprint
 
@@ -89,12 +90,12 @@ class Blender:
             self.config = self.configure()
 
     def configure(self, mol_file='', img_file='', img_format='PNG',
-                  images=[], vid_file='', vid_format='AVI_JPEG', fps=10,
+                  images=[], frames='', vid_file='', vid_format='AVI_JPEG', fps=10,
                   script='img', render=True, save='',
                   model='default', colors=COLORS, background_color=None,
                   resolution=(1920, 1080), light=2000.0,
                   camera_zoom=20, camera_distance=10, camera_view='xy', camera_type='ORTHO',
-                  verbose=False, pickle='temp-config.pkl', executable='blender'):
+                  verbose=False, pickle='', executable='blender'):
         """
         Get Blender image rendering settings.
 
@@ -107,7 +108,12 @@ class Blender:
         img_format : str
             Image file format ([PNG] | JPEG | TIFF | BMP and more)
         images : list
-            List of image paths for sequencer.
+            List of image paths for sequencer (or image paths for each frame in batch mode).
+        frames : str
+            Numpy (.npy) file with coordinates of each frame with shape (n_frames, N, 3).
+            If given all frames are rendered in a single Blender process (batch mode) using
+            mol_file for the first frame and 'images' as output image file names.
+            Atoms are moved in place only for models without sticks (space_filling, surface).
         vid_file : str
             Video file name (sequencer only).
         vid_format : str
@@ -144,6 +150,7 @@ class Blender:
             Blender subprocess verbosity.
         pickle : str
             Pickle file for communicating settings with Blender.
+            If empty a unique temporary file is used for each run.
         executable : str
             Path to blender executable (depends on OS).
 
@@ -163,7 +170,7 @@ class Blender:
 
         config = {'pdb': {**{'filepath': mol_file}, **self.models[model]},
                   'img_file': img_file, 'img_format': img_format,
-                  'vid_file': vid_file, 'vid_format': vid_format, 'images': images, 'fps': fps,
+                  'vid_file': vid_file, 'vid_format': vid_format, 'images': images, 'frames': frames, 'fps': fps,
                   'camera': dict(location=VIEW[camera_view]['location'],
                                  rotation=VIEW[camera_view]['rotation'],
                                  type=camera_type, zoom=camera_zoom),
@@ -174,7 +181,7 @@ class Blender:
         self.config = config
         return config
 
-    def write_config(self, config_file):
+    def write_config(self, config_file, config=None):
         """
         Write config pickle file to send config information to Blender.
 
@@ -182,14 +189,17 @@ class Blender:
         ----------
         config_file : str
             Pickle file name.
+        config : dict or None
+            Blender render settings (default: self.config).
 
         Returns
         -------
         None
             Writes pickle config file.
         """
+        config = self.config if config is None else config
         with open(config_file, 'wb') as handle:
-            pickle.dump(self.config, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(config, handle, protocol=pickle.HIGHEST_PROTOCOL)
 
 
     def read_config(self, config_file):
@@ -231,26 +241,36 @@ class Blender:
         """
         pprint(self.config)
 
-    def run(self):
+    def run(self, config=None):
         """
         Run Blender in the background using subprocess and following command:
-            >>> blender --background --python blender_image.py -- temp-config.pkl
+            >>> blender --background --python-exit-code 1 --python blender_image.py -- config.pkl
+        An exception is raised if Blender (or the Python script) fails.
 
         Parameters
         ----------
-        None
+        config : dict or None
+            Blender render settings (default: self.config).
+            Separate settings can be used to run multiple Blender processes at the same time.
 
         Returns
         -------
         None
             Runs Blender Python script.
         """
-        self.write_config(self.config['pickle'])
-        command = [self.config['executable'], '--background', '--python', self.config['script'], '--', self.config['pickle']]
-        with open(os.devnull, 'w') as null:
-            blend = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = blend.stdout.decode(), blend.stderr.decode()
-            if self.config['verbose']:
-                print("Stdout:\n\n%s\nStderr:\n%s" % (stdout, stderr))
-        if os.path.exists(self.config['pickle']):
-            os.remove(self.config['pickle'])
+        config = self.config if config is None else config
+        config_file = config['pickle']
+        if config_file == '':
+            handle, config_file = tempfile.mkstemp(prefix='angstrom-blender-', suffix='.pkl')
+            os.close(handle)
+        self.write_config(config_file, config)
+        command = [config['executable'], '--background', '--python-exit-code', '1',
+                   '--python', config['script'], '--', config_file]
+        blend = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = blend.stdout.decode(), blend.stderr.decode()
+        if config['verbose']:
+            print("Stdout:\n\n%s\nStderr:\n%s" % (stdout, stderr))
+        if os.path.exists(config_file):
+            os.remove(config_file)
+        if blend.returncode != 0:
+            raise Exception('Blender failed with exit code %i:\n%s' % (blend.returncode, stderr))
@@ -1,10 +1,14 @@
 """
 --- Ångström ---
 Render image of a molecule file using Blender.
+In batch mode ('frames' setting) all frames of a trajectory are rendered in the same Blender process.
+Atom positions are updated in place only for models without sticks (space_filling, surface),
+models with sticks (default, ball_and_stick, stick) re-import the molecule for each frame.
 """
 import pickle
 import bpy
 import sys
+import numpy as np
 
 
 def render_pdb(settings):
@@ -28,13 +32,7 @@ def render_pdb(settings):
     """
     # Delete the cube
     bpy.ops.object.delete(use_global=False)
-    # bpy.ops.import_mesh.pdb(filepath=pdb_file)
-    bpy.ops.import_mesh.pdb(**settings['pdb'])
-
-    if settings['colors'] is not None:
-        # Find intersection of atoms of the molecule and atoms that have color defined
-        for atom in set(settings['colors'].keys()).intersection(bpy.data.materials.keys()):
-            bpy.data.materials[atom].diffuse_color = settings['colors'][atom]
+    import_pdb(settings)
 
     # Make materials shiny (mirror)
     # for Item in bpy.data.materials:
@@ -69,12 +67,188 @@ def render_pdb(settings):
     # Save .blend file
     if settings['save'] != '':
         bpy.ops.wm.save_as_mainfile(filepath=settings['save'])
-    if settings['render']:
-        # Set the output file and name it!
-        bpy.context.scene.render.image_settings.file_format = settings['img_format']
-        bpy.context.scene.render.filepath = settings['img_file']
-        # Render
-        bpy.ops.render.render(write_still=True)
+    if settings['render'] and not settings.get('frames'):
+        render_still(settings, settings['img_file'])
+
+
+def import_pdb(settings):
+    """
+    Import pdb file using Blender pdb reader and set atom colors.
+
+    """
+    bpy.ops.import_mesh.pdb(**settings['pdb'])
+    if settings['colors'] is not None:
+        # Find intersection of atoms of the molecule and atoms that have color defined
+        for atom in set(settings['colors'].keys()).intersection(bpy.data.materials.keys()):
+            bpy.data.materials[atom].diffuse_color = settings['colors'][atom]
+
+
+def render_still(settings, img_file):
+    """
+    Render current scene to given image file.
+
+    """
+    bpy.context.scene.render.image_settings.file_format = settings['img_format']
+    bpy.context.scene.render.filepath = img_file
+    bpy.ops.render.render(write_still=True)
+
+
+def render_frames(settings):
+    """
+    Render all frames of a trajectory in a single Blender process.
+    The scene is built once from the pdb file of the first frame.
+    For models without sticks (space_filling, surface) the vertices of the atom objects are moved
+    in place for each frame. Sticks (bonds) are not updated in place, so for models with sticks
+    (default, ball_and_stick, stick) the molecule is cleared and re-imported for each frame and
+    only the Blender start up and scene setup are saved. Both paths center each frame the same way
+    as importing its pdb file.
+
+    Parameters
+    ----------
+    settings : dict
+        Blender render settings with 'frames' (.npy file of coordinates with shape (n_frames, N, 3))
+        and 'images' (image file name for each frame) keys.
+
+    Returns
+    -------
+    None
+        This function is called by the Blender Python installation.
+
+    """
+    frames = np.load(settings['frames'], mmap_mode='r')
+    render_pdb(settings)
+    if not settings['render']:
+        return
+    with open(settings['pdb']['filepath'], 'r') as pdb_file:
+        template = pdb_file.readlines()
+    if settings['pdb'].get('use_sticks', False):
+        print('Sticks can not be moved in place -> importing pdb file for each frame')
+        for coordinates, img_file in zip(frames, settings['images']):
+            write_frame_pdb(template, coordinates, settings['pdb']['filepath'])
+            clear_molecule()
+            import_pdb(settings)
+            render_still(settings, img_file)
+    else:
+        elements = [line[76:78].strip() for line in template if line.startswith(('ATOM  ', 'HETATM'))]
+        atom_vertices = map_atom_vertices(elements, frames[0], settings['pdb'])
+        for coordinates, img_file in zip(frames, settings['images']):
+            move_atom_vertices(atom_vertices, coordinates)
+            render_still(settings, img_file)
+
+
+def atom_objects():
+    """
+    Returns atom objects created by the pdb reader (meshes with atoms as vertices instanced as balls).
+
+    """
+    return [obj for obj in bpy.data.objects if obj.type == 'MESH' and obj.instance_type == 'VERTS']
+
+
+def element_names():
+    """
+    Returns element names used by the pdb reader for each element symbol (ex: {'C': 'Carbon'}).
+
+    """
+    from io_mesh_pdb.import_pdb import ELEMENTS_DEFAULT
+    names = {}
+    for element in ELEMENTS_DEFAULT:
+        # Each element entry has the element name and the element symbol as strings
+        name, symbol = sorted([e for e in element if isinstance(e, str)], key=len, reverse=True)[:2]
+        names[symbol.lower()] = name
+    return names
+
+
+def map_atom_vertices(elements, coordinates, pdb_settings):
+    """
+    Match vertices of the atom objects to atoms using the import order.
+    The pdb reader creates one object for each element (named after the element) and adds the atoms
+    of that element as vertices in the order they appear in the pdb file.
+
+    Parameters
+    ----------
+    elements : list
+        Element symbol of each atom in the pdb file.
+    coordinates : ndarray
+        Atomic coordinates of the imported frame with shape (N, 3).
+    pdb_settings : dict
+        Settings of the pdb reader ('scale_distances' and 'use_center' are used).
+
+    Returns
+    -------
+    tuple
+        List of (object, atom indices, inverse world matrix) for each atom object, the translation
+        from scaled atom coordinates to world coordinates for the imported frame, the center of the
+        imported frame, the distance scale, and whether each frame is centered.
+
+    """
+    names = element_names()
+    atom_names = np.array([names.get(element.lower(), element) for element in elements])
+    scale = pdb_settings.get('scale_distances', 1)
+    use_center = pdb_settings.get('use_center', False)
+    coordinates = np.asarray(coordinates, dtype=float)
+    atom_vertices, positions, indices = [], [], []
+    for obj in atom_objects():
+        name = obj.name.split('_')[0]
+        atom_ids = np.where(atom_names == name)[0]
+        if len(atom_ids) != len(obj.data.vertices):
+            raise Exception('Atom object %s has %i vertices for %i atoms' % (obj.name, len(obj.data.vertices), len(atom_ids)))
+        world = np.array(obj.matrix_world)
+        local = np.empty(len(obj.data.vertices) * 3)
+        obj.data.vertices.foreach_get('co', local)
+        positions.append(local.reshape(-1, 3) @ world[:3, :3].T + world[:3, 3])
+        indices.append(atom_ids)
+        atom_vertices.append((obj, atom_ids, np.linalg.inv(world)))
+    # Translation applied by the pdb reader (centering) for the imported frame
+    indices, positions = np.concatenate(indices), np.concatenate(positions)
+    offset = (positions - coordinates[indices] * scale).mean(axis=0)
+    return atom_vertices, offset, coordinates.mean(axis=0), scale, use_center
+
+
+def move_atom_vertices(atom_vertices, coordinates):
+    """
+    Move vertices of the atom objects to given atomic coordinates.
+    If the pdb reader centers the molecule each frame is centered as well (same as importing each frame).
+
+    """
+    atom_vertices, offset, center, scale, use_center = atom_vertices
+    coordinates = np.asarray(coordinates, dtype=float)
+    if use_center:
+        coordinates = coordinates - (coordinates.mean(axis=0) - center)
+    scaled = coordinates * scale + offset
+    for obj, indices, inverse in atom_vertices:
+        local = scaled[indices] @ inverse[:3, :3].T + inverse[:3, 3]
+        obj.data.vertices.foreach_set('co', local.ravel())
+        obj.data.update()
+
+
+def write_frame_pdb(template, coordinates, pdb_file):
+    """
+    Write pdb file for a frame by replacing the coordinates of the atom records of a template pdb file.
+
+    """
+    atom_index = 0
+    with open(pdb_file, 'w') as frame_file:
+        for line in template:
+            if line.startswith(('ATOM  ', 'HETATM')):
+                x, y, z = coordinates[atom_index]
+                line = '%s%8.3f%8.3f%8.3f%s' % (line[:30], x, y, z, line[54:])
+                atom_index += 1
+            frame_file.write(line)
+
+
+def clear_molecule():
+    """
+    Delete all objects except the camera and the light, and the materials that are no longer used.
+
+    """
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in bpy.data.objects:
+        if obj.name not in ['Camera', 'Light']:
+            obj.select_set(True)
+    bpy.ops.object.delete()
+    for material in list(bpy.data.materials):
+        if material.users == 0:
+            bpy.data.materials.remove(material)
 
 
 if __name__ == '__main__':
@@ -82,4 +256,7 @@ if __name__ == '__main__':
     with open(argv[0], 'rb') as handle:
         settings = pickle.load(handle)
     print(settings)
-    render_pdb(settings)
+    if settings.get('frames'):
+        render_frames(settings)
+    else:
+        render_pdb(settings)
@@ -0,0 +1,180 @@
+"""
+--- Ångström ---
+Content-addressed render cache for Ångström Python package.
+Rendered images are stored in a local directory with the hash of the molecule and the render
+settings as file name and evicted in least recently used order when the directory is too large.
+"""
+import numpy as np
+import hashlib
+import shutil
+import json
+import os
+
+
+# Render settings that do not change the rendered image (file paths, verbosity)
+IGNORED_SETTINGS = ['filepath', 'img_file', 'images', 'frames', 'vid_file', 'pickle', 'verbose', 'executable', 'save']
+
+
+class RenderCache:
+    """
+    Content-addressed render cache with size-bounded least recently used (LRU) eviction.
+    """
+    def __init__(self, directory, max_size=2**30):
+        """
+        Initialize render cache.
+
+        Parameters
+        ----------
+        directory : str
+            Cache directory (created if it does not exist).
+        max_size : int
+            Maximum total size of cached images in bytes (default: 1 GB).
+
+        Returns
+        -------
+        None
+            Initializes RenderCache object.
+
+        """
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, atoms, coordinates, bonds=None, settings=None):
+        """
+        Calculate cache key (sha256) from molecule data and render settings.
+
+        Parameters
+        ----------
+        atoms : list
+            List of elements.
+        coordinates : ndarray
+            List of atomic coordinates.
+        bonds : list or None
+            List of bonded atom index pairs.
+        settings : dict or list or None
+            Render settings (file paths and verbosity are ignored).
+
+        Returns
+        -------
+        str
+            Hexadecimal cache key.
+
+        """
+        sha = hashlib.sha256()
+        sha.update(' '.join(str(atom) for atom in atoms).encode())
+        sha.update(np.ascontiguousarray(coordinates, dtype=np.float64).tobytes())
+        sha.update(b'bonds')
+        if bonds is not None:
+            sha.update(np.ascontiguousarray(np.reshape(bonds, (-1, 2)), dtype=np.int64).tobytes())
+        sha.update(json.dumps(_relevant(settings), sort_keys=True, default=str).encode())
+        return sha.hexdigest()
+
+    def path(self, key, img_file):
+        """
+        Returns cache entry path for given key and image file (extension of the image file is kept).
+
+        """
+        return os.path.join(self.directory, key + os.path.splitext(img_file)[1])
+
+    def get(self, key, img_file):
+        """
+        Copy cached image to given image file if it exists in the cache.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        img_file : str
+            Image file name to save.
+
+        Returns
+        -------
+        bool
+            True if the image was found in the cache.
+
+        """
+        entry = self.path(key, img_file)
+        try:
+            shutil.copyfile(entry, img_file)
+            # Modification time is used as the last access time for LRU eviction
+            os.utime(entry)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put(self, key, img_file):
+        """
+        Add rendered image file to the cache and evict least recently used images if needed.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        img_file : str
+            Rendered image file name.
+
+        Returns
+        -------
+        None
+            Copies image file to the cache directory.
+
+        """
+        entry = self.path(key, img_file)
+        temp_entry = '%s.%i.tmp' % (entry, os.getpid())
+        shutil.copyfile(img_file, temp_entry)
+        os.replace(temp_entry, entry)
+        self.evict()
+
+    def size(self):
+        """
+        Returns total size of cached images in bytes.
+
+        """
+        return sum(size for path, size, mtime in self._entries())
+
+    def evict(self):
+        """
+        Remove least recently used images until the total size is below the maximum size.
+
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total_size = sum(size for path, size, mtime in entries)
+        for path, size, mtime in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self):
+        """
+        Remove all cached images.
+
+        """
+        for path, size, mtime in self._entries():
+            os.remove(path)
+
+    def _entries(self):
+        """
+        Returns (path, size, last access time) for each cached image.
+
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+
+def _relevant(settings):
+    """
+    Remove render settings that do not change the rendered image.
+
+    """
+    if isinstance(settings, dict):
+        return {k: _relevant(v) for k, v in settings.items() if k not in IGNORED_SETTINGS}
+    return settings
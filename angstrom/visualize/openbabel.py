@@ -17,7 +17,7 @@ class OpenBabel:
         self.config = ['-xS', '-xd', 'xb', 'none']
         self.verbose = False
 
-    def run(self, mol_file, img_file):
+    def run(self, mol_file, img_file, verbose=None):
         """
         Render image file using OpenBabel.
 
@@ -27,15 +27,19 @@ class OpenBabel:
             Molecule file name to read.
         img_file : str
             Image file name to save ('svg' file format is recommended).
+        verbose : bool or None
+            Verbosity (default: 'verbose' attribute).
 
         Returns
         -------
         None
-            Renders image file.
+            Renders image file (an exception is raised if OpenBabel fails).
 
         """
         command = [self.executable, mol_file, '-O', img_file] + self.config
         obabel = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         stdout, stderr = obabel.stdout.decode(), obabel.stderr.decode()
-        if self.verbose:
+        if (self.verbose if verbose is None else verbose):
             print("Stdout:\n\n%s\nStderr:\n%s" % (stdout, stderr))
+        if obabel.returncode != 0:
+            raise Exception('OpenBabel failed with exit code %i:\n%s' % (obabel.returncode, stderr))
@@ -4,15 +4,19 @@ Render molecular images and animations.
 """
 from .blender import Blender
 from .openbabel import OpenBabel
+from .cache import RenderCache
 from angstrom.molecule.write import write_pdb
 from angstrom import Molecule, Trajectory
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import tempfile
 import pickle
+import copy
+import numpy as np
 import os
 
 
-def render(render_obj, output='angstrom', renderer='blender', verbose=False):
+def render(render_obj, output='angstrom', renderer='blender', verbose=False, workers=1, cache=None):
     """
     Render Molecule object.
 
@@ -29,6 +33,10 @@ def render(render_obj, output='angstrom', renderer='blender', verbose=False):
         and used here as an argument.
     verbose : bool
         Verbosity.
+    workers : int or None
+        Number of renderer processes running at the same time for videos (None: number of CPUs).
+    cache : RenderCache or str or None
+        Render cache (or cache directory) to reuse previously rendered images.
 
     Returns
     -------
@@ -49,13 +57,13 @@ def render(render_obj, output='angstrom', renderer='blender', verbose=False):
     if isinstance(renderer, str):
         renderer = {'blender': Blender(), 'openbabel': OpenBabel()}[renderer]
     if isinstance(render_obj, Molecule):
-        render_image(render_obj, output, renderer=renderer, verbose=verbose)
+        render_image(render_obj, output, renderer=renderer, verbose=verbose, cache=cache)
     elif isinstance(render_obj, Trajectory):
-        render_video(render_obj, output, renderer=renderer, verbose=verbose)
+        render_video(render_obj, output, renderer=renderer, verbose=verbose, workers=workers, cache=cache)
 
 
 
-def render_image(molecule, img_file, renderer, verbose=False):
+def render_image(molecule, img_file, renderer, verbose=False, cache=None):
     """
     Renders image of a Molecule object.
 
@@ -69,6 +77,8 @@ def render_image(molecule, img_file, renderer, verbose=False):
         Renderer object (blender | openbabel).
     verbose : bool
         Verbosity.
+    cache : RenderCache or str or None
+        Render cache (or cache directory). Cached images are copied without running the renderer.
 
     Returns
     -------
@@ -83,24 +93,32 @@ def render_image(molecule, img_file, renderer, verbose=False):
     """
     if not hasattr(molecule, 'bonds'):
         molecule.get_bonds()
-    temp_pdb_file = tempfile.NamedTemporaryFile(mode='w+', suffix='.pdb')
-    write_pdb(temp_pdb_file, molecule.atoms, molecule.coordinates, bonds=molecule.bonds)
-    if renderer.__class__.__name__ == 'Blender':
-        print('Rendering %s image with Blender -> %s' % (molecule.name, img_file))
-        renderer.config['pdb']['filepath'] = temp_pdb_file.name
-        renderer.config['img_file'] = img_file
-        renderer.config['verbose'] = verbose
-        renderer.run()
-    elif renderer.__class__.__name__ == 'OpenBabel':
-        print('Rendering %s image with OpenBabel -> %s' % (molecule.name, img_file))
-        renderer.verbose = verbose
-        renderer.run(temp_pdb_file.name, img_file)
-    else:
-        print('Rendering engine not detected!')
-    temp_pdb_file.close()
+    if cache is not None:
+        cache = _get_cache(cache)
+        key = cache.key(molecule.atoms, molecule.coordinates, molecule.bonds, _settings(renderer))
+        if cache.get(key, img_file):
+            print('Using cached %s image -> %s' % (molecule.name, img_file))
+            return
+        # Remove old image so that only a newly rendered image is added to the cache
+        _remove(img_file)
+    with tempfile.NamedTemporaryFile(mode='w+', suffix='.pdb') as temp_pdb_file:
+        write_pdb(temp_pdb_file, molecule.atoms, molecule.coordinates, bonds=molecule.bonds)
+        if renderer.__class__.__name__ == 'Blender':
+            print('Rendering %s image with Blender -> %s' % (molecule.name, img_file))
+            renderer.config['pdb']['filepath'] = temp_pdb_file.name
+            renderer.config['img_file'] = img_file
+            renderer.config['verbose'] = verbose
+            renderer.run()
+        elif renderer.__class__.__name__ == 'OpenBabel':
+            print('Rendering %s image with OpenBabel -> %s' % (molecule.name, img_file))
+            renderer.run(temp_pdb_file.name, img_file, verbose=verbose)
+        else:
+            print('Rendering engine not detected!')
+    if cache is not None and os.path.exists(img_file):
+        cache.put(key, img_file)
 
 
-def render_video(trajectory, vid_file, renderer, verbose=False):
+def render_video(trajectory, vid_file, renderer, verbose=False, batch=True, workers=1, cache=None):
     """
     Renders video of a Trajectory object.
 
@@ -114,6 +132,14 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
         Renderer object (blender).
     verbose : bool
         Verbosity.
+    batch : bool
+        Render consecutive frames in a single Blender process (requires the same atoms for each frame).
+        Otherwise Blender is started for each frame. Atoms are moved in place only for models
+        without sticks (space_filling, surface), models with sticks re-import each frame.
+    workers : int or None
+        Number of Blender processes running at the same time (None: number of CPUs).
+    cache : RenderCache or str or None
+        Render cache (or cache directory). Only frames that are not cached are rendered.
 
     Returns
     -------
@@ -127,12 +153,9 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
     """
     if renderer.__class__.__name__ == 'Blender':
         vid_dir = os.path.dirname(vid_file)
+        images = [os.path.join(vid_dir, '%i.png' % idx) for idx in range(len(trajectory))]
         print('Rendering %i images with Blender -> %s' % (len(trajectory), vid_dir))
-        images = []
-        for idx, mol in enumerate(trajectory):
-            img_file = os.path.join(vid_dir, '%i.png' % idx)
-            render_image(mol, img_file, renderer)
-            images.append(img_file)
+        render_frames(trajectory, images, renderer, batch=batch, workers=workers, verbose=verbose, cache=cache)
         renderer.configure(images=images, vid_file=vid_file, script='seq', verbose=verbose,
                            executable=renderer.config['executable'], background_color=(1, 1, 1))
         print('Rendering %s video with Blender -> %s' % (trajectory.name, vid_file))
@@ -142,3 +165,150 @@ def render_video(trajectory, vid_file, renderer, verbose=False):
             if os.path.exists(img):
                 os.remove(img)
         renderer.configure()
+
+
+def render_frames(trajectory, images, renderer, batch=True, workers=1, verbose=False, cache=None):
+    """
+    Renders images of all frames of a Trajectory object using a pool of renderer processes.
+    Each task runs with its own copy of the renderer settings and its own scratch directory,
+    so any number of Blender (or OpenBabel) processes can run at the same time.
+
+    Parameters
+    ----------
+    trajectory : Trajectory
+        Ångström Trajectory object.
+    images : list
+        Image file name for each frame.
+    renderer : object
+        Renderer object (blender | openbabel).
+    batch : bool
+        Blender only: split frames into one block per worker and render each block in
+        a single Blender process (requires the same atoms for each frame). Atoms are moved
+        in place only for models without sticks (space_filling, surface), models with sticks
+        re-import each frame.
+    workers : int or None
+        Number of renderer processes running at the same time (None: number of CPUs).
+    verbose : bool
+        Verbosity.
+    cache : RenderCache or str or None
+        Render cache (or cache directory). Only frames that are not cached are rendered.
+
+    Returns
+    -------
+    None
+        Saves image files (images[i] is the image of frame i).
+
+    """
+    batch = batch and renderer.__class__.__name__ == 'Blender' and trajectory.topology is not None
+    # In batch mode bonds of the first frame are used for all frames
+    bonds = None
+    if batch:
+        bonds = trajectory.bonds if trajectory.bonds is not None else _frame_molecule(trajectory, 0).bonds
+    frames = list(range(len(images)))
+    if cache is not None:
+        cache = _get_cache(cache)
+        settings = _settings(renderer)
+        keys = []
+        for frame in frames:
+            molecule = _frame_molecule(trajectory, frame, bonds)
+            keys.append(cache.key(molecule.atoms, molecule.coordinates, molecule.bonds, settings))
+        frames = [frame for frame in frames if not cache.get(keys[frame], images[frame])]
+        print('Using %i cached images' % (len(images) - len(frames)))
+        # Remove old images so that only newly rendered images are added to the cache
+        for frame in frames:
+            _remove(images[frame])
+    if len(frames) == 0:
+        return
+    workers = os.cpu_count() if workers is None else workers
+    workers = max(1, min(workers, len(frames)))
+    if batch:
+        tasks = [block for block in np.array_split(frames, workers) if len(block) > 0]
+    else:
+        tasks = [[frame] for frame in frames]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Renderers raise an exception if the subprocess fails -> collect results to raise it here
+        list(pool.map(lambda block: _render_task(trajectory, block, images, renderer, batch, bonds, verbose), tasks))
+    if cache is not None:
+        # Old images were removed and failed renders raise an exception -> existing images are new renders
+        for frame in frames:
+            if os.path.exists(images[frame]):
+                cache.put(keys[frame], images[frame])
+
+
+def _render_task(trajectory, frames, images, renderer, batch, bonds, verbose):
+    """
+    Render given frames in a scratch directory with a separate copy of the renderer settings.
+    In batch mode the scene is built once from the first frame and the coordinates of each frame
+    are sent to Blender as a numpy file.
+
+    """
+    with tempfile.TemporaryDirectory(prefix='angstrom-render-') as scratch:
+        if renderer.__class__.__name__ == 'Blender':
+            config = copy.deepcopy(renderer.config)
+            config['pickle'] = os.path.join(scratch, 'config.pkl')
+            config['verbose'] = verbose
+        if batch:
+            config['pdb']['filepath'] = _write_frame(trajectory, frames[0], scratch, bonds)
+            config['frames'] = os.path.join(scratch, 'frames.npy')
+            config['images'] = [images[frame] for frame in frames]
+            np.save(config['frames'], np.asarray(trajectory.coordinates[np.asarray(frames)], dtype=float))
+            renderer.run(config)
+            return
+        for frame in frames:
+            mol_file = _write_frame(trajectory, frame, scratch)
+            if renderer.__class__.__name__ == 'Blender':
+                config['pdb']['filepath'] = mol_file
+                config['img_file'] = images[frame]
+                renderer.run(config)
+            else:
+                renderer.run(mol_file, images[frame], verbose=verbose)
+
+
+def _frame_molecule(trajectory, frame, bonds=None):
+    """
+    Returns Molecule object for given trajectory frame with bonds (estimated if not given).
+
+    """
+    molecule = trajectory[int(frame)]
+    if bonds is not None:
+        molecule.bonds = bonds
+    elif not hasattr(molecule, 'bonds'):
+        molecule.get_bonds()
+    return molecule
+
+
+def _write_frame(trajectory, frame, directory, bonds=None):
+    """
+    Write pdb file with bonds for given trajectory frame and return the file name.
+
+    """
+    molecule = _frame_molecule(trajectory, frame, bonds)
+    mol_file = os.path.join(directory, 'frame-%i.pdb' % frame)
+    with open(mol_file, 'w') as fileobj:
+        write_pdb(fileobj, molecule.atoms, molecule.coordinates, bonds=molecule.bonds)
+    return mol_file
+
+
+def _remove(filename):
+    """
+    Remove file if it exists.
+
+    """
+    if os.path.exists(filename):
+        os.remove(filename)
+
+
+def _get_cache(cache):
+    """
+    Returns RenderCache object for a cache directory.
+
+    """
+    return RenderCache(cache) if isinstance(cache, str) else cache
+
+
+def _settings(renderer):
+    """
+    Returns render settings of a renderer used for render cache keys.
+
+    """
+    return {'renderer': renderer.__class__.__name__, 'config': renderer.config}
@@ -15,7 +15,6 @@ setup(
     include_package_data=True,
     packages=find_packages(),
     install_requires=['numpy',
-                      'periodictable',
                       'pyyaml'],
     extras_require={
         'docs': [
@@ -0,0 +1,47 @@
+"""
+--- Ångström ---
+Tests batched rotation of coordinates.
+"""
+from angstrom.geometry import Quaternion, rotate, rotation_matrix
+from angstrom.cli.tools import rotation
+from angstrom import Molecule
+import numpy as np
+
+
+def test_batch_rotation_should_match_quaternion_rotation():
+    Q = Quaternion([0, 1, 1, 1])
+    coordinates = np.random.normal(size=(20, 3))
+    axis = ([-2, 4, 6.1], [0.3, 1.2, -0.76])
+    angle = np.pi * np.random.normal()
+    expected = np.array([Q.rotation(coor, axis, angle).np() for coor in coordinates])
+    assert np.allclose(rotate(coordinates.copy(), axis, angle), expected)
+    for primary_axis in ['x', 'y', 'z']:
+        expected = np.array([Q.rotation(coor, primary_axis, angle).np() for coor in coordinates])
+        assert np.allclose(rotate(coordinates.copy(), primary_axis, angle), expected)
+
+
+def test_batch_rotation_in_place_and_output_array():
+    coordinates = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    out = np.empty((2, 3))
+    rotated = rotate(coordinates, 'z', np.pi / 2, out=out)
+    assert rotated is out
+    assert np.allclose(coordinates, [[1, 0, 0], [0, 1, 0]])
+    assert np.allclose(out, [[0, 1, 0], [-1, 0, 0]])
+    rotated = rotate(coordinates, 'z', np.pi / 2)
+    assert rotated is coordinates
+    assert np.allclose(coordinates, [[0, 1, 0], [-1, 0, 0]])
+
+
+def test_rotation_matrix_should_be_orthogonal():
+    matrix = rotation_matrix([1, 2, 3], 0.7)
+    assert np.allclose(np.dot(matrix, matrix.T), np.eye(3))
+    assert np.isclose(np.linalg.det(matrix), 1)
+
+
+def test_cli_rotation_trajectory_frames():
+    mol = Molecule(atoms=['C', 'O'], coordinates=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]))
+    for interpolation in ['linear', 'sine']:
+        traj = rotation(mol, 10, 360, 'z', interpolation=interpolation)
+        assert len(traj) == 10
+        assert np.all(np.any(traj.coordinates != 0, axis=(1, 2)))
+        assert np.allclose(np.linalg.norm(traj.coordinates, axis=2), 1)
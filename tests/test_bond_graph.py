@@ -0,0 +1,31 @@
+"""
+--- Ångström ---
+Tests adjacency list (CSR) bond graph topology.
+"""
+from angstrom.molecule.topology import BondGraph
+import numpy as np
+
+
+def test_bond_graph_neighbors_should_be_sorted():
+    graph = BondGraph([(2, 3), (0, 2), (1, 2)])
+    assert graph.n_atoms == 4
+    assert np.allclose(graph.neighbors(2), [0, 1, 3])
+    assert np.allclose(graph.neighbors(0), [2])
+    assert np.allclose(graph.degree, [1, 1, 3, 1])
+
+
+def test_bond_graph_topology_should_return_sorted_int32_arrays():
+    graph = BondGraph([(0, 2), (1, 2), (2, 3), (3, 4), (3, 5)])
+    angles, dihedrals, impropers = graph.angles(), graph.dihedrals(), graph.impropers()
+    assert angles.dtype == np.int32 and angles.shape == (6, 3)
+    assert dihedrals.dtype == np.int32 and dihedrals.shape == (4, 4)
+    assert impropers.dtype == np.int32 and impropers.shape == (6, 4)
+    assert angles.tolist() == [[0, 2, 1], [0, 2, 3], [1, 2, 3], [2, 3, 4], [2, 3, 5], [4, 3, 5]]
+    assert dihedrals.tolist() == [[0, 2, 3, 4], [0, 2, 3, 5], [1, 2, 3, 4], [1, 2, 3, 5]]
+
+
+def test_empty_bond_graph_should_have_no_topology():
+    graph = BondGraph([])
+    assert graph.angles().shape == (0, 3)
+    assert graph.dihedrals().shape == (0, 4)
+    assert graph.impropers().shape == (0, 4)
@@ -0,0 +1,60 @@
+"""
+--- Ångström ---
+Tests bulk formatted writers against line by line formatting.
+"""
+from angstrom.molecule.write import write_xyz, write_pdb, write_cif, write_lines
+from angstrom.molecule import Cell
+from angstrom.trajectory.write import write_xyz_traj
+import numpy as np
+import io
+
+
+rng = np.random.RandomState(5)
+atoms = np.array(['C', 'H', 'Zn', 'O', 'N'] * 40)
+coordinates = rng.uniform(-50, 50, (200, 3))
+
+
+def test_write_lines_chunks():
+    """Tests writing lines in chunks gives the same result for any chunk size."""
+    columns = [atoms.tolist()] + coordinates.T.tolist()
+    ref = ''.join('%-2s %7.4f %7.4f %7.4f\n' % row for row in zip(*columns))
+    for chunk in [1, 7, 200, 1000]:
+        fileobj = io.StringIO()
+        write_lines(fileobj, '%-2s %7.4f %7.4f %7.4f\n', columns, chunk=chunk)
+        assert fileobj.getvalue() == ref
+
+
+def test_bulk_xyz_pdb_cif_match_line_by_line():
+    """Tests xyz, pdb and cif writers against formatting each line separately."""
+    fileobj = io.StringIO()
+    write_xyz(fileobj, atoms, coordinates, header='test')
+    ref = '200\ntest\n' + ''.join('%-2s %7.4f %7.4f %7.4f\n' % (a, *c) for a, c in zip(atoms, coordinates))
+    assert fileobj.getvalue() == ref
+
+    group = list(range(200))
+    fileobj = io.StringIO()
+    write_pdb(fileobj, atoms, coordinates, group=group, header='test')
+    pdb_format = 'HETATM%5d%3s  M%4i %3i     %8.3f%8.3f%8.3f  1.00  0.00          %2s\n'
+    ref = 'HEADER    test\n' + ''.join(pdb_format % (i + 1, a, group[i], group[i], *c, a.rjust(2))
+                                        for i, (a, c) in enumerate(zip(atoms, coordinates))) + 'END\n'
+    assert fileobj.getvalue() == ref
+
+    cellpar = [20, 25, 30, 80, 95, 100]
+    fileobj = io.StringIO()
+    write_cif(fileobj, atoms, coordinates, cell=cellpar, header='test')
+    frac = Cell(cellpar).car2frac(coordinates)
+    atom_lines = ''.join('%s%-4i %2s %7.4f %7.4f %7.4f\n' % (a, i, a, *c) for i, (a, c) in enumerate(zip(atoms, frac)))
+    assert fileobj.getvalue().endswith('_atom_site_fract_z\n' + atom_lines)
+
+
+def test_bulk_xyz_traj_matches_line_by_line():
+    """Tests xyz trajectory writer against formatting each line separately."""
+    traj_coordinates = rng.uniform(-50, 50, (5, 200, 3))
+    traj_atoms = np.array([atoms] * 5)
+    fileobj = io.StringIO()
+    write_xyz_traj(fileobj, traj_atoms, traj_coordinates)
+    ref = ''
+    for frame, frame_coors in enumerate(traj_coordinates):
+        ref += '200\nangstrom - %i\n' % frame
+        ref += ''.join('%-2s %7.4f %7.4f %7.4f\n' % (a, *c) for a, c in zip(atoms, frame_coors))
+    assert fileobj.getvalue() == ref
@@ -2,7 +2,14 @@
 --- Ångström ---
 Tests calculating angles.
 """
-from angstrom.molecule.angles import calculate_angle
+from angstrom.molecule.angles import calculate_angle, calculate_angles, get_angles
+from angstrom.molecule import Cell
+from angstrom import Trajectory
+import numpy as np
+import os
+
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
 
 
 def test_linear_points_should_return_180_degrees():
@@ -41,3 +48,36 @@ def test_water_molecule_should_return_104_5_degrees():
     p2 = [0.000, 0.000, 0.0]
     p3 = [-0.757, 0.586, 0.0]
     assert round(calculate_angle(p1, p2, p3), 2) == 104.51
+
+
+def test_batched_angles_match_single_angle_calculation():
+    benzene = Trajectory(read=benzene_traj_x)
+    benzene.get_bonds()
+    angles = np.array(get_angles(benzene.bonds))
+    values = calculate_angles(angles, benzene.coordinates)
+    assert values.shape == (len(benzene), len(angles))
+    for frame, frame_coors in enumerate(benzene.coordinates):
+        ref = [calculate_angle(*frame_coors[angle]) for angle in angles]
+        assert np.allclose(values[frame], ref)
+        assert np.allclose(calculate_angles(angles, frame_coors), ref)
+    assert np.allclose(calculate_angles(angles, benzene.coordinates, chunk=3), values)
+    assert calculate_angles([], benzene.coordinates[0]).shape == (0,)
+
+
+def test_angles_across_periodic_boundary():
+    cell = Cell([10, 10, 10, 90, 90, 90])
+    coordinates = np.array([[9.5, 0, 0], [0.5, 0, 0], [0.5, 1, 0]])
+    assert np.allclose(calculate_angles([(0, 1, 2)], coordinates, cell=cell), [90])
+
+
+def test_angles_in_chunks_of_frames_and_angles(monkeypatch):
+    import angstrom.molecule.topology as topology
+    cell = Cell([10, 11, 12, 80, 95, 100])
+    coordinates = np.random.RandomState(2).uniform(0, 10, (4, 30, 3))
+    angles = np.random.RandomState(3).randint(0, 30, (50, 3))
+    ref = calculate_angles(angles, coordinates, cell=cell)
+    # Single frames and frame blocks are split into chunks when they exceed CHUNK_SIZE
+    for chunk_size in [100, 3000, 30000]:
+        monkeypatch.setattr(topology, 'CHUNK_SIZE', chunk_size)
+        assert np.allclose(calculate_angles(angles, coordinates, cell=cell), ref)
+        assert np.allclose(calculate_angles(angles, coordinates[1], cell=cell), ref[1])
@@ -0,0 +1,55 @@
+"""
+--- Ångström ---
+Tests calculating dihedral and improper angles.
+"""
+from angstrom.molecule.dihedrals import calculate_dihedrals
+from angstrom.molecule.impropers import calculate_impropers
+from angstrom.molecule import Cell
+from angstrom import Molecule, Trajectory
+import numpy as np
+import os
+
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_cis_trans_and_gauche_dihedrals():
+    coordinates = np.array([[1, 0, 0], [0, 0, 0], [0, 0, 1], [1, 0, 1],
+                            [-1, 0, 1], [0, 1, 1], [0, -1, 1]], dtype=float)
+    dihedrals = [(0, 1, 2, 3), (0, 1, 2, 4), (0, 1, 2, 5), (0, 1, 2, 6)]
+    assert np.allclose(calculate_dihedrals(dihedrals, coordinates), [0, 180, 90, -90])
+    # Reversing the order of atoms does not change the dihedral angle
+    assert np.allclose(calculate_dihedrals(np.array(dihedrals)[:, ::-1], coordinates), [0, 180, 90, -90])
+    # Nearly planar trans dihedrals are 180 (not -180) on both sides of the plane
+    trans = np.array([[1, 0, 0], [0, 0, 0], [0, 0, 1], [-1, 1e-17, 1]])
+    assert calculate_dihedrals([(0, 1, 2, 3)], trans).tolist() == [180]
+    assert calculate_dihedrals([(0, 1, 2, 3)], trans * [1, -1, 1]).tolist() == [180]
+
+
+def test_dihedrals_across_periodic_boundary():
+    cell = Cell([10, 10, 10, 90, 90, 90])
+    coordinates = np.array([[1, 0, 9.5], [0, 0, 9.5], [0, 0, 0.5], [0, 1, 0.5]])
+    assert np.allclose(calculate_dihedrals([(0, 1, 2, 3)], coordinates, cell=cell), [90])
+    assert np.allclose(np.abs(calculate_dihedrals([(0, 1, 2, 3)], coordinates)), [90])
+
+
+def test_planar_benzene_has_planar_dihedrals_and_impropers():
+    benzene = Trajectory(read=benzene_traj_x)
+    mol = benzene[0]
+    mol.get_topology()
+    dihedrals = calculate_dihedrals(mol.dihedrals, benzene.coordinates)
+    impropers = calculate_impropers(mol.impropers, benzene.coordinates, chunk=2)
+    assert dihedrals.shape == (len(benzene), len(mol.dihedrals))
+    assert impropers.shape == (len(benzene), len(mol.impropers))
+    assert np.allclose(np.sin(np.radians(dihedrals)), 0, atol=1e-3)
+    assert np.allclose(np.sin(np.radians(impropers)), 0, atol=1e-3)
+
+
+def test_pyramidal_improper():
+    # Ammonia: nitrogen (0) is the central atom
+    mol = Molecule(atoms=['N', 'H', 'H', 'H'],
+                   coordinates=np.array([[0, 0, 0.38], [0.94, 0, 0], [-0.47, 0.81, 0], [-0.47, -0.81, 0]]))
+    mol.get_topology()
+    impropers = calculate_impropers(mol.impropers, mol.coordinates)
+    assert len(impropers) == 3
+    assert np.all(np.abs(impropers) > 20) and np.all(np.abs(impropers) < 160)
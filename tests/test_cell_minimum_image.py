@@ -0,0 +1,71 @@
+"""
+--- Ångström ---
+Tests coordinate wrapping and minimum image distances for Cell object.
+"""
+from angstrom.molecule import Cell
+from itertools import product
+import numpy as np
+
+
+def brute_force_minimum_image(cell, dr):
+    """Minimum image displacement by searching over 9x9x9 images."""
+    shifts = np.dot(np.array(list(product(range(-4, 5), repeat=3))), cell.vectors)
+    candidates = dr[..., None, :] + shifts
+    lengths = np.linalg.norm(candidates, axis=-1)
+    return np.take_along_axis(candidates, np.argmin(lengths, axis=-1)[..., None, None], axis=-2)[..., 0, :]
+
+
+def test_cell_wrap():
+    """Tests wrapping coordinates into a triclinic unit cell."""
+    cell = Cell([8.9950, 8.9950, 8.9950, 60, 60, 60])
+    coordinates = np.random.RandomState(1).uniform(-20, 20, (4, 50, 3))
+    wrapped = cell.wrap(coordinates)
+    frac = cell.car2frac(wrapped)
+    assert wrapped.shape == coordinates.shape
+    assert np.all(frac >= -1e-12) and np.all(frac < 1 + 1e-12)
+    # Wrapped coordinates differ from the original coordinates by integer cell translations
+    shift = cell.car2frac(coordinates - wrapped)
+    assert np.allclose(shift, np.round(shift))
+
+
+def test_cell_minimum_image():
+    """Tests minimum image displacements for orthogonal and triclinic cells."""
+    dr = np.random.RandomState(2).uniform(-15, 15, (3, 40, 3))
+    for cellpar in [[10, 12, 14, 90, 90, 90], [8.9950, 8.9950, 8.9950, 60, 60, 60], [10, 11, 9, 75, 110, 100]]:
+        cell = Cell(cellpar)
+        min_dr = cell.minimum_image(dr)
+        assert min_dr.shape == dr.shape
+        assert np.allclose(np.linalg.norm(min_dr, axis=-1), np.linalg.norm(brute_force_minimum_image(cell, dr), axis=-1))
+        out = np.empty_like(dr)
+        cell.minimum_image(dr, out=out)
+        assert np.allclose(out, min_dr)
+        assert np.allclose(cell.minimum_image(dr[0, 0]), min_dr[0, 0])
+
+
+def test_cell_minimum_image_chunks(monkeypatch):
+    """Tests triclinic minimum image search in chunks of vectors."""
+    import angstrom.molecule.cell as cell_module
+    cell = Cell([10, 11, 9, 75, 110, 100])
+    dr = np.random.RandomState(4).uniform(-15, 15, (3, 40, 3))
+    ref = cell.minimum_image(dr)
+    monkeypatch.setattr(cell_module, 'IMAGE_CHUNK', 7)
+    assert np.allclose(cell.minimum_image(dr), ref)
+    out = np.empty((3, 3, 40)).transpose(0, 2, 1)
+    cell.minimum_image(dr, out=out)
+    assert np.allclose(out, ref)
+
+
+def test_cell_distance_matrix():
+    """Tests chunked minimum image distance matrix."""
+    cell = Cell([10, 11, 9, 75, 110, 100])
+    rng = np.random.RandomState(3)
+    coor_a, coor_b = rng.uniform(0, 10, (2, 30, 3)), rng.uniform(0, 10, (20, 3))
+    ref = np.linalg.norm(brute_force_minimum_image(cell, coor_b[None, None, :, :] - coor_a[:, :, None, :]), axis=-1)
+    distances = cell.distance_matrix(coor_a, coor_b, chunk_size=50)
+    assert distances.shape == (2, 30, 20)
+    assert np.allclose(distances, ref)
+    assert np.allclose(cell.distance_matrix(coor_a[0], coor_b), ref[0])
+    self_distances = cell.distance_matrix(coor_a[1])
+    assert self_distances.shape == (30, 30)
+    assert np.allclose(np.diag(self_distances), 0)
+    assert np.allclose(self_distances, self_distances.T)
@@ -10,3 +10,22 @@ def test_cubic_unit_cell_pbc():
     cell = Cell([10, 10, 10, 90.0, 90.0, 90.0])
     assert np.allclose([2, 2, 2], cell.car2frac([20, 20, 20]))
     assert np.allclose([20, 20, 20], cell.frac2car([2, 2, 2]))
+
+
+def test_triclinic_unit_cell_batched_pbc():
+    cell = Cell([8.40900, 13.48800, 14.13020, 61.49240, 85.75740, 81.08290])
+    frac = np.random.rand(4, 10, 3)
+    car = cell.frac2car(frac)
+    assert car.shape == (4, 10, 3)
+    assert np.allclose(car[2, 3], np.dot(frac[2, 3], cell.vectors))
+    assert np.allclose(cell.car2frac(car), frac)
+    assert np.allclose(np.dot(cell.matrix, cell.inverse), np.eye(3))
+
+
+def test_pbc_conversion_with_output_buffer():
+    cell = Cell([10, 12, 14, 90.0, 90.0, 90.0])
+    car = np.array([[10, 12, 14], [5, 6, 7]], dtype=float)
+    out = np.empty((2, 3))
+    frac = cell.car2frac(car, out=out)
+    assert frac is out
+    assert np.allclose(out, [[1, 1, 1], [0.5, 0.5, 0.5]])
@@ -0,0 +1,46 @@
+"""
+--- Ångström ---
+Tests element property table.
+"""
+from angstrom import Molecule
+from angstrom.elements import SYMBOLS, MASSES, RADII, ATOMIC_NUMBERS, atom_codes, get_masses, rcov
+import numpy as np
+import pytest
+
+
+def test_element_table():
+    """Tests element table arrays are indexed by atomic number."""
+    assert len(SYMBOLS) == len(MASSES) == len(RADII) == 119
+    assert ATOMIC_NUMBERS['H'] == 1 and ATOMIC_NUMBERS['C'] == 6 and ATOMIC_NUMBERS['Og'] == 118
+    assert np.isclose(MASSES[ATOMIC_NUMBERS['O']], 15.999)
+    assert RADII[ATOMIC_NUMBERS['C']] == rcov['C']
+
+
+def test_atom_codes_and_masses():
+    """Tests converting element names to atom codes and masses."""
+    atoms = ['C', 'H', 'H', 'O', 'C', 'Zn']
+    codes = atom_codes(atoms)
+    assert codes.tolist() == [6, 1, 1, 8, 6, 30]
+    assert np.allclose(get_masses(atoms), MASSES[codes])
+    assert np.allclose(get_masses(codes=codes), MASSES[codes])
+    with pytest.raises(Exception):
+        atom_codes(['C', 'Xx'])
+
+
+def test_molecule_atom_codes():
+    """Tests atom codes of a molecule are reset when atoms are assigned."""
+    mol = Molecule(atoms=['C', 'O'], coordinates=np.array([[0, 0, 0], [1.2, 0, 0]]))
+    assert mol.codes.tolist() == [6, 8]
+    mol.atoms = ['C', 'S']
+    assert mol.codes.tolist() == [6, 16]
+    assert np.isclose(mol.get_molecular_weight(), MASSES[6] + MASSES[16])
+
+
+def test_molecule_atom_codes_in_place_edit():
+    """Tests atom codes are recalculated when atoms are changed in place."""
+    for atoms in [['C', 'O'], np.array(['C', 'O'])]:
+        mol = Molecule(atoms=atoms, coordinates=np.array([[0, 0, 0], [1.2, 0, 0]]))
+        assert mol.codes.tolist() == [6, 8]
+        mol.atoms[0] = 'N'
+        assert mol.codes.tolist() == [7, 8]
+        assert np.isclose(mol.get_molecular_weight(), MASSES[7] + MASSES[8])
@@ -0,0 +1,86 @@
+"""
+--- Ångström ---
+Tests batched geometric descriptors for trajectories.
+"""
+from angstrom import Trajectory
+from angstrom.geometry import get_molecule_center, get_descriptors, center_of_mass, radius_of_gyration
+from angstrom.geometry import inertia_tensor, principal_axes, bounding_box
+from angstrom.elements import get_masses
+import numpy as np
+import pytest
+import shutil
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def reference_descriptors(atoms, coordinates):
+    """Calculate descriptors for a single frame with explicit loops."""
+    masses = get_masses(atoms)
+    center = get_molecule_center(atoms, coordinates)
+    tensor = np.zeros((3, 3))
+    rg = 0
+    for m, r in zip(masses, coordinates - center):
+        tensor += m * (np.dot(r, r) * np.eye(3) - np.outer(r, r))
+        rg += m * np.dot(r, r)
+    return center, np.sqrt(rg / masses.sum()), tensor
+
+
+def test_descriptors_match_single_frame_calculations():
+    """Tests batched descriptors against per frame calculations with different chunk sizes."""
+    benzene = Trajectory(read=benzene_traj_x)
+    rng = np.random.RandomState(4)
+    coordinates = benzene.coordinates + rng.uniform(-0.3, 0.3, benzene.coordinates.shape)
+    masses = get_masses(benzene.topology)
+    for chunk in [None, 1, 3]:
+        descriptors = get_descriptors(coordinates, masses=masses, chunk=chunk)
+        for f, frame_coors in enumerate(coordinates):
+            center, rg, tensor = reference_descriptors(benzene.topology, frame_coors)
+            assert np.allclose(descriptors['center'][f], center)
+            assert np.isclose(descriptors['radius_of_gyration'][f], rg)
+            assert np.allclose(descriptors['inertia_tensor'][f], tensor)
+            moments, axes = descriptors['principal_moments'][f], descriptors['principal_axes'][f]
+            assert np.allclose(np.dot(tensor, axes.T), axes.T * moments)
+            assert np.allclose(descriptors['bounding_box'][f], [frame_coors.min(axis=0), frame_coors.max(axis=0)])
+    # Single frame and single descriptor functions
+    assert np.allclose(center_of_mass(coordinates[0], masses), descriptors['center'][0])
+    assert np.isclose(radius_of_gyration(coordinates[0], masses), descriptors['radius_of_gyration'][0])
+    assert np.allclose(inertia_tensor(coordinates, masses), descriptors['inertia_tensor'])
+    assert np.allclose(principal_axes(coordinates, masses)[0], descriptors['principal_moments'])
+    assert np.allclose(bounding_box(coordinates), descriptors['bounding_box'])
+
+
+def test_trajectory_descriptors_memmap(tmpdir):
+    """Tests trajectory descriptors for a memory-mapped binary trajectory."""
+    benzene = Trajectory(read=benzene_traj_x)
+    traj_file = os.path.join(tmpdir, 'benzene.atraj')
+    benzene.write(traj_file, dtype='float64')
+    benzene_mmap = Trajectory(read=traj_file)
+    assert isinstance(benzene_mmap.coordinates, np.memmap)
+    descriptors = benzene_mmap.get_descriptors()
+    assert np.allclose(descriptors['center'], benzene.get_center())
+    assert np.allclose(benzene_mmap.get_center(mass=False), benzene.get_center(mass=False))
+
+
+def test_trajectory_descriptors_lazy_and_mixed_atoms(tmpdir, monkeypatch):
+    """Tests trajectory descriptors for lazily read trajectories and changing atoms."""
+    traj_file = os.path.join(str(tmpdir), 'benzene-traj-x.xyz')
+    shutil.copy(benzene_traj_x, traj_file)
+    benzene = Trajectory(read=benzene_traj_x)
+    benzene_lazy = Trajectory(read=traj_file, lazy=True)
+    assert benzene_lazy.topology is None
+    descriptors = benzene.get_descriptors()
+    # Lazily read coordinates are read chunk by chunk (never loaded as a whole)
+    lazy_frames = type(benzene_lazy.coordinates)
+    monkeypatch.setattr(lazy_frames, '__array__', lambda *args, **kwargs: pytest.fail('loaded all frames'))
+    lazy_descriptors = benzene_lazy.get_descriptors(chunk=7)
+    monkeypatch.undo()
+    for name in descriptors:
+        assert np.allclose(lazy_descriptors[name], descriptors[name])
+    atoms = np.array(benzene.atoms)
+    atoms[1, 0] = 'N'
+    mixed = Trajectory(atoms=atoms, coordinates=benzene.coordinates)
+    assert mixed.topology is None
+    assert np.allclose(mixed.get_descriptors(mass=False)['center'], benzene.get_center(mass=False))
+    with pytest.raises(Exception):
+        mixed.get_descriptors()
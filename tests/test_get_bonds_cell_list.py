@@ -0,0 +1,32 @@
+"""
+--- Ångström ---
+Tests estimating molecular bonds with the linked-cell neighbor search.
+"""
+from angstrom import Molecule
+from angstrom.molecule.bonds import get_bonds
+import numpy as np
+import os
+
+
+piyzaz444_xyz = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'PIYZAZ_444.xyz')
+
+
+def test_cell_list_and_sort_methods_should_return_same_bonds_for_mof_supercell():
+    piyzaz = Molecule(read=piyzaz444_xyz)
+    bonds = get_bonds(piyzaz.atoms, piyzaz.coordinates, method='cell_list')
+    assert len(bonds) > 0
+    assert bonds == get_bonds(piyzaz.atoms, piyzaz.coordinates, method='sort')
+
+
+def test_cell_list_and_sort_methods_should_return_same_bonds_for_random_atoms():
+    np.random.seed(42)
+    atoms = np.random.choice(['H', 'C', 'O', 'Zn'], size=500)
+    coordinates = np.random.rand(500, 3) * 15
+    bonds = get_bonds(atoms, coordinates, method='cell_list')
+    assert bonds == get_bonds(atoms, coordinates, method='sort')
+    assert bonds == sorted(bonds)
+    assert all([i < j for i, j in bonds])
+
+
+def test_single_atom_should_have_no_bonds():
+    assert get_bonds(['C'], [[0, 0, 0]]) == []
@@ -0,0 +1,55 @@
+"""
+--- Ångström ---
+Tests estimating molecular bonds with periodic boundary conditions.
+"""
+from angstrom import Molecule
+from angstrom.molecule import Cell
+from angstrom.molecule.bonds import get_periodic_bonds
+import numpy as np
+import pytest
+import os
+
+
+piyzaz111_xyz = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'PIYZAZ_111.xyz')
+piyzaz_cell_parameters = [8.9950, 8.9950, 8.9950, 60, 60, 60]
+
+
+def test_bond_across_cell_face_should_have_image_offset():
+    cell = Cell([10, 10, 10, 90, 90, 90])
+    bonds, images = get_periodic_bonds(['C', 'C'], [[0.2, 5, 5], [9.5, 5, 5]], cell)
+    assert bonds == [(0, 1)]
+    assert np.allclose(images, [[-1, 0, 0]])
+
+
+def test_atoms_outside_cell_should_use_given_coordinates_for_image_offset():
+    cell = Cell([10, 10, 10, 90, 90, 90])
+    bonds, images = get_periodic_bonds(['C', 'C'], [[0.2, 5, 5], [19.5, 5, 5]], cell)
+    assert bonds == [(0, 1)]
+    assert np.allclose(images, [[-2, 0, 0]])
+
+
+def test_piyzaz_periodic_bonds_should_match_supercell_bonds():
+    piyzaz = Molecule(read=piyzaz111_xyz)
+    piyzaz.set_cell(piyzaz_cell_parameters)
+    piyzaz.get_bonds(periodic=True)
+    n_atoms = len(piyzaz.atoms)
+    # Bonds of the central cell in a 3x3x3 supercell (cross-boundary bonds are counted twice)
+    supercell = piyzaz.replicate([3, 3, 3])
+    supercell.get_bonds()
+    center_bonds = [b for b in supercell.bonds if b[0] // n_atoms == 13 or b[1] // n_atoms == 13]
+    inner_bonds = [b for b in center_bonds if b[0] // n_atoms == 13 and b[1] // n_atoms == 13]
+    assert len(piyzaz.bonds) == len(inner_bonds) + (len(center_bonds) - len(inner_bonds)) // 2
+    for (i, j), image in zip(piyzaz.bonds, piyzaz.bond_images):
+        distance = np.linalg.norm(piyzaz.coordinates[j] + np.dot(image, piyzaz.cell.vectors) - piyzaz.coordinates[i])
+        assert 0.16 <= distance <= 3.0
+
+
+def test_periodic_bonding_requires_cell_and_resets_images():
+    mol = Molecule(atoms=['C', 'C'], coordinates=np.array([[0.2, 5, 5], [9.5, 5, 5]]))
+    with pytest.raises(Exception, match='unit cell'):
+        mol.get_bonds(periodic=True)
+    mol.set_cell([10, 10, 10, 90, 90, 90])
+    mol.get_bonds(periodic=True)
+    assert mol.bonds == [(0, 1)] and hasattr(mol, 'bond_images')
+    mol.get_bonds()
+    assert mol.bonds == [] and not hasattr(mol, 'bond_images')
@@ -27,3 +27,17 @@ def test_read_xyz_benzene_molecule():
     for atom, ref_atom in zip(benzene.atoms, benzene_atoms):
         assert atom == ref_atom
     assert np.allclose(benzene.coordinates, benzene_coors)
+
+
+def test_read_xyz_irregular_columns(tmpdir):
+    """Tests reading xyz file with extra columns and blank lines (line by line fallback)"""
+    xyz_file = os.path.join(tmpdir, 'benzene_charges.xyz')
+    with open(xyz_file, 'w') as f:
+        f.write('12\nbenzene with charges\n')
+        for atom, coor in zip(benzene_atoms, benzene_coors):
+            f.write('%s  %.4f\t%.4f %.4f -0.115\n' % (atom, *coor))
+        f.write('\n\n')
+    benzene = Molecule(read=xyz_file)
+    assert benzene.header == 'benzene with charges'
+    assert list(benzene.atoms) == benzene_atoms
+    assert np.allclose(benzene.coordinates, benzene_coors)
@@ -0,0 +1,130 @@
+"""
+--- Ångström ---
+Tests reading pdb and cif files and the molecule file format registry.
+"""
+from angstrom import Molecule
+from angstrom.molecule.formats import register_reader, register_writer, READERS, WRITERS
+from angstrom.molecule.write import write_molecule
+import numpy as np
+import os
+import pytest
+
+
+tests_dir = os.path.abspath(os.path.dirname(__file__))
+benzene_bonds_pdb = os.path.join(tests_dir, 'benzene_bonds.pdb')
+c60_pdb = os.path.join(tests_dir, 'C60.pdb')
+piyzaz_cif = os.path.join(tests_dir, 'piyzaz.cif')
+benzene_xyz = os.path.join(tests_dir, 'benzene.xyz')
+
+
+def test_read_pdb_benzene_with_bonds():
+    """Tests reading pdb file with CONECT records."""
+    benzene = Molecule(read=benzene_bonds_pdb)
+    benzene_ref = Molecule(read=benzene_xyz)
+    benzene_ref.get_bonds()
+    assert benzene.header == 'benzene'
+    assert list(benzene.atoms) == list(benzene_ref.atoms)
+    assert np.allclose(benzene.coordinates, benzene_ref.coordinates, atol=1e-3)
+    assert benzene.bonds == benzene_ref.bonds
+
+
+def test_read_pdb_c60():
+    """Tests reading pdb file written by Open Babel."""
+    c60 = Molecule(read=c60_pdb)
+    assert len(c60.atoms) == 60
+    assert set(c60.atoms) == {'C'}
+    assert len(c60.bonds) == 90
+
+
+def test_pdb_round_trip_with_cell_and_hybrid36_bonds(tmpdir):
+    """Tests reading a pdb file with CRYST1 record and hybrid-36 serial numbers."""
+    n_atoms = 100010
+    atoms = np.array(['C', 'H'] * (n_atoms // 2))
+    coordinates = np.random.RandomState(6).uniform(-99, 99, (n_atoms, 3))
+    bonds = [(0, 1), (99998, 100005), (100000, 100009)]
+    pdb_file = os.path.join(tmpdir, 'large.pdb')
+    write_molecule(pdb_file, atoms, coordinates, bonds=bonds)
+    with open(pdb_file, 'r') as f:
+        lines = f.readlines()
+    lines.insert(1, 'CRYST1   10.000   20.000   30.000  90.00  90.00 120.00 P 1           1\n')
+    with open(pdb_file, 'w') as f:
+        f.writelines(lines)
+    mol = Molecule(read=pdb_file)
+    assert np.allclose(mol.coordinates, coordinates, atol=1e-3)
+    assert mol.bonds == bonds
+    assert mol.cell.to_list() == pytest.approx([10, 20, 30, 90, 90, 120])
+
+
+def test_read_cif_piyzaz(tmpdir):
+    """Tests reading P1 cif file and writing it back."""
+    piyzaz = Molecule(read=piyzaz_cif)
+    assert piyzaz.header == 'piyzaz'
+    assert len(piyzaz.atoms) == 10
+    assert piyzaz.cell.to_list() == pytest.approx([8.995, 8.995, 8.995, 60, 60, 60])
+    assert np.allclose(piyzaz.coordinates[0], [6.746250, 6.491582, 4.590242], atol=1e-3)
+    test_file = os.path.join(tmpdir, 'piyzaz.cif')
+    piyzaz.write(test_file, cell=piyzaz.cell.to_list(), header='piyzaz')
+    piyzaz_new = Molecule(read=test_file)
+    assert np.allclose(piyzaz_new.coordinates, piyzaz.coordinates, atol=1e-3)
+    assert list(piyzaz_new.atoms) == list(piyzaz.atoms)
+
+
+def test_format_registry(tmpdir):
+    """Tests registering a new file format and unsupported formats."""
+    def write_csv(fileobj, atoms, coordinates, header='angstrom'):
+        fileobj.write('%s\n' % header)
+        for atom, coor in zip(atoms, coordinates):
+            fileobj.write('%s,%f,%f,%f\n' % (atom, *coor))
+
+    def read_csv(filename):
+        with open(filename, 'r') as f:
+            lines = f.read().splitlines()
+        rows = [line.split(',') for line in lines[1:]]
+        return dict(atoms=np.array([r[0] for r in rows]), coordinates=np.array([r[1:] for r in rows], dtype=float),
+                    header=lines[0])
+
+    register_writer('csv', write_csv, options=['header'])
+    register_reader('csv', read_csv)
+    try:
+        benzene = Molecule(read=benzene_xyz)
+        csv_file = os.path.join(tmpdir, 'benzene.csv')
+        benzene.write(csv_file, header='benzene csv', bonds=True)
+        benzene_csv = Molecule(read=csv_file)
+        assert benzene_csv.header == 'benzene csv'
+        assert np.allclose(benzene_csv.coordinates, benzene.coordinates)
+    finally:
+        del READERS['csv'], WRITERS['csv']
+    with pytest.raises(Exception):
+        Molecule(read=csv_file)
+    with pytest.raises(Exception):
+        benzene.write(os.path.join(tmpdir, 'benzene.abc'))
+
+
+def test_read_pdb_conect_with_missing_serial(tmpdir):
+    pdb_file = os.path.join(str(tmpdir), 'missing.pdb')
+    with open(pdb_file, 'w') as f:
+        f.write('HETATM    1  C   MOL     1       0.000   0.000   0.000  1.00  0.00           C\n'
+                'HETATM    2  O   MOL     1       1.200   0.000   0.000  1.00  0.00           O\n'
+                'CONECT    1    2    7\n'
+                'CONECT    9    1\n'
+                'END\n')
+    with pytest.warns(RuntimeWarning, match='7, 9'):
+        mol = Molecule(read=pdb_file)
+    assert mol.bonds == [(0, 1)]
+
+
+def test_read_cif_cartesian_without_cell_and_charged_symbols(tmpdir):
+    cif_file = os.path.join(str(tmpdir), 'cartesian.cif')
+    with open(cif_file, 'w') as f:
+        f.write('data_zno\nloop_\n_atom_site_label\n_atom_site_type_symbol\n'
+                '_atom_site_Cartn_x\n_atom_site_Cartn_y\n_atom_site_Cartn_z\n'
+                'Zn1 Zn2+ 0.0 0.0 0.0\nO1 O2- 1.9 0.0 0.0\nFe1 Fe3+ 0.0 2.0 0.0\n')
+    mol = Molecule(read=cif_file)
+    assert list(mol.atoms) == ['Zn', 'O', 'Fe']
+    assert np.allclose(mol.coordinates[1], [1.9, 0, 0])
+    assert getattr(mol, 'cell', None) is None
+    with open(cif_file, 'w') as f:
+        f.write('data_zno\n_cell_length_a 5\nloop_\n_atom_site_label\n'
+                '_atom_site_fract_x\n_atom_site_fract_y\n_atom_site_fract_z\nZn1 0.0 0.0 0.0\n')
+    with pytest.raises(Exception, match='_cell_length_b'):
+        Molecule(read=cif_file)
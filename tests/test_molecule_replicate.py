@@ -87,3 +87,16 @@ def test_piyzaz_replication_4_4_4_without_centering():
     assert piyzaz444.cell.alpha == piyzaz.cell.alpha
     assert piyzaz444.cell.beta == piyzaz.cell.beta
     assert piyzaz444.cell.gamma == piyzaz.cell.gamma
+
+
+def test_supercell_image_indices():
+    """Tests image index of each atom in the supercell."""
+    piyzaz = Molecule(read=piyzaz111_xyz)
+    piyzaz.set_cell(piyzaz_cell_parameters)
+    n_atoms = len(piyzaz.atoms)
+    supercell, atoms, coordinates, images = piyzaz.cell.supercell(piyzaz.atoms, piyzaz.coordinates, [2, 3, 1], images=True)
+    assert len(images) == len(atoms) == len(coordinates) == 6 * n_atoms
+    assert np.allclose(piyzaz.cell.translation_indices[images[-1]], [1, 2, 0])
+    for img in range(6):
+        translation = piyzaz.cell.translation_vectors[img]
+        assert np.allclose(coordinates[images == img], piyzaz.coordinates + translation)
@@ -2,8 +2,12 @@
 --- Ångström ---
 Tests Molecule rotation.
 """
-from angstrom import Molecule
+from angstrom import Molecule, Trajectory
 import numpy as np
+import os
+
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
 
 
 def test_diatomic_dummy_molecule_rotation_around_global_axis():
@@ -26,3 +30,17 @@ def test_diatomic_dummy_molecule_rotation_around_molecule_axis():
     assert np.allclose(mol.coordinates, [[1, 1, 0], [0, 0, 0]])
     mol.rotate(([0, 0, 0], [0, 0, 1]), np.pi, center=True)
     assert np.allclose(mol.coordinates, [[0, 0, 0], [1, 1, 0]])
+
+
+def test_rotation_does_not_modify_trajectory_or_input_coordinates():
+    """ Test rotating a trajectory frame or a molecule does not change the shared coordinates """
+    for lazy in [False, True]:
+        traj = Trajectory(read=benzene_traj_x, lazy=lazy)
+        coordinates = np.array(traj.coordinates)
+        traj[0].rotate(([0, 0, 0], [0, 0, 1]), np.pi / 2)
+        assert np.allclose(traj.coordinates, coordinates)
+        assert np.allclose(traj[0].coordinates, coordinates[0])
+    coordinates = np.array([[1.0, 0, 0], [0, 1, 0]])
+    mol = Molecule(atoms=['C'] * 2, coordinates=coordinates)
+    mol.rotate(([0, 0, 0], [0, 0, 1]), np.pi / 2)
+    assert np.allclose(coordinates, [[1, 0, 0], [0, 1, 0]])
@@ -3,6 +3,7 @@
 Tests writing molecule object.
 """
 from angstrom import Molecule
+from angstrom.molecule.write import write_molecule, hybrid36
 import filecmp
 import os
 import pytest
@@ -44,3 +45,31 @@ def test_write_pdb_benzene_molecule_with_bonds():
     benzene.write(test_file, bonds=True, header='benzene')
     assert filecmp.cmp(benzene_bonds_pdb, test_file)
     os.remove(test_file)
+
+
+def test_write_pdb_conect_records(tmpdir):
+    """Tests CONECT records are split for atoms with more than 4 neighbors and keep the bond order."""
+    atoms = ['C', 'H', 'H', 'H', 'H', 'H', 'O']
+    coordinates = [[0, 0, 0]] * 7
+    bonds = [(0, 3), (1, 0), (0, 2), (0, 4), (0, 5), (0, 6)]
+    test_file = os.path.join(tmpdir, 'conect.pdb')
+    write_molecule(test_file, atoms, coordinates, bonds=bonds)
+    with open(test_file, 'r') as f:
+        conect = [line.strip('\n') for line in f if line.startswith('CONECT')]
+    assert conect == ['CONECT    1    4    2    3    5',
+                      'CONECT    1    6    7',
+                      'CONECT    2    1',
+                      'CONECT    3    1',
+                      'CONECT    4    1',
+                      'CONECT    5    1',
+                      'CONECT    6    1',
+                      'CONECT    7    1']
+
+
+def test_hybrid36_serial_numbers():
+    """Tests hybrid-36 encoding of pdb serial numbers."""
+    assert hybrid36(1) == '    1'
+    assert hybrid36(99999) == '99999'
+    assert hybrid36(100000) == 'A0000'
+    assert hybrid36(100035) == 'A000Z'
+    assert hybrid36(100000 + 26 * 36 ** 4) == 'a0000'
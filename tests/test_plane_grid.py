@@ -25,3 +25,13 @@ def test_grids_from_planes_with_different_size_match_given_correct_size_and_spac
     # The grid spacing for the first and second planes are 5 and 1, respectively
     assert np.allclose(plane.grid(1, 1), plane_yz.grid(5, 5))
     assert np.allclose(plane.grid(1, .2), plane_yz.grid(5, 1))
+
+
+def test_grid_point_order():
+    plane = Plane([1, 0, 0], [0, 2, 0], [0, 1, 3])
+    size, space = 2, 0.5
+    ref = []
+    for m in np.arange(0, size + space, space):
+        for n in np.arange(0, size + space, space):
+            ref.append((size - n) * plane.p1 + (n - m) * plane.p2 + m * plane.p3)
+    assert np.allclose(plane.grid(size, space), ref)
@@ -28,3 +28,22 @@ def test_yz_and_zy_plane_reflection():
     for p in range(-3, 4):
         assert np.allclose(yz_plane.reflect([p, 0, 0]), [-p, 0, 0])
         assert np.allclose(zy_plane.reflect([p, 0, 0]), [-p, 0, 0])
+
+
+def test_reflect_coordinate_blocks():
+    """Tests reflecting (N, 3) and (F, N, 3) blocks matches reflecting each point."""
+    plane = Plane([0, 0, 1], [1, 2, 0], [3, -1, 2])
+    points = np.random.RandomState(3).uniform(-5, 5, (4, 6, 3))
+    ref = np.array([[plane.reflect(p) for p in frame] for frame in points])
+    assert np.allclose(plane.reflect(points), ref)
+    assert np.allclose(plane.reflect(points[0]), ref[0])
+    assert np.allclose(plane.reflect(ref), points)
+    plane.reflect(points, out=points)
+    assert np.allclose(points, ref)
+
+
+def test_plane_from_args():
+    xy_plane = Plane('xy')
+    assert Plane.from_args(xy_plane) is xy_plane
+    for plane in [Plane.from_args('xy'), Plane.from_args(([0, 0, 0], [1, 0, 0], [1, 1, 0]))]:
+        assert np.allclose(plane.reflect([1, 2, 3]), [1, 2, -3])
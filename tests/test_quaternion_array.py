@@ -0,0 +1,67 @@
+"""
+--- Ångström ---
+Tests batched QuaternionArray operations.
+"""
+from angstrom.geometry import Quaternion, QuaternionArray
+import numpy as np
+import pytest
+
+
+def test_quaternion_array_multiplication_should_match_quaternion():
+    q1 = QuaternionArray([[1, 2, 3, 4], [0.5, -1, 2, 0.1]])
+    q2 = QuaternionArray([[2, 3, 4, 5], [1, 0, 0.3, -2]])
+    q3 = q1 * q2
+    for i in range(len(q1)):
+        q = q1[i] * q2[i]
+        assert np.allclose(q3.array[i], [q.w, q.x, q.y, q.z])
+    q = (q1 / q2)[0]
+    q_ref = Quaternion([1, 2, 3, 4]) / Quaternion([2, 3, 4, 5])
+    assert np.allclose([q.w, q.x, q.y, q.z], [q_ref.w, q_ref.x, q_ref.y, q_ref.z])
+
+
+def test_quaternion_array_inverse_and_normalization():
+    q = QuaternionArray(np.random.normal(size=(10, 4)))
+    identity = q * q.inv()
+    assert np.allclose(identity.array, np.tile([1, 0, 0, 0], (10, 1)))
+    assert np.allclose(q.normalize().norm(), 1)
+
+
+def test_quaternion_array_matrix_conversion_round_trip():
+    q = QuaternionArray(np.random.normal(size=(50, 4))).normalize()
+    q.array[q.w < 0] *= -1
+    matrices = q.to_matrix()
+    assert np.allclose(np.einsum('nij,nkj->nik', matrices, matrices), np.eye(3))
+    assert np.allclose(QuaternionArray.from_matrix(matrices).array, q.array)
+
+
+def test_quaternion_array_rotation_should_match_quaternion_rotation():
+    Q = Quaternion([0, 1, 1, 1])
+    angles = np.random.normal(size=5)
+    q = QuaternionArray.from_axis_angle([0, 0, 1], angles)
+    rotated = q.rotate([[1.0, 2.0, 3.0]])
+    for i, angle in enumerate(angles):
+        expected = Q.rotation([1, 2, 3], 'z', angle).np()
+        assert np.allclose(rotated[i, 0], expected)
+
+
+def test_quaternion_array_pairwise_rotation():
+    angles = np.random.normal(size=3)
+    q = QuaternionArray.from_axis_angle([0, 0, 1], angles)
+    points = np.random.normal(size=(3, 3))
+    all_rotated = q.rotate(points)
+    assert all_rotated.shape == (3, 3, 3)
+    pairwise = q.rotate(points, pairwise=True)
+    assert pairwise.shape == (3, 3)
+    for i in range(3):
+        assert np.allclose(pairwise[i], all_rotated[i, i])
+    with pytest.raises(Exception):
+        q.rotate(points[:2], pairwise=True)
+
+
+def test_quaternion_array_slerp():
+    q1 = QuaternionArray.from_axis_angle([0, 0, 1], [0.0])
+    q2 = QuaternionArray.from_axis_angle([0, 0, 1], [np.pi / 2])
+    t = np.linspace(0, 1, 5)
+    q = q1.slerp(q2, t)
+    assert len(q) == 5
+    assert np.allclose(q.array, QuaternionArray.from_axis_angle([0, 0, 1], t * np.pi / 2).array)
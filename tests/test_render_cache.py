@@ -0,0 +1,59 @@
+"""
+--- Ångström ---
+Tests content-addressed render cache.
+"""
+from angstrom.visualize.cache import RenderCache
+from angstrom.visualize.blender import Blender
+import numpy as np
+import time
+import os
+
+
+atoms = ['C', 'O']
+coordinates = np.array([[0, 0, 0], [1.2, 0, 0]])
+bonds = [(0, 1)]
+
+
+def test_render_cache_key(tmpdir):
+    """Tests render cache key changes with molecule and relevant render settings only."""
+    cache = RenderCache(os.path.join(str(tmpdir), 'cache'))
+    blend = Blender()
+    key = cache.key(atoms, coordinates, bonds, blend.config)
+    assert key == cache.key(atoms, coordinates.tolist(), [[0, 1]], blend.config)
+    assert key != cache.key(['C', 'S'], coordinates, bonds, blend.config)
+    assert key != cache.key(atoms, coordinates + 1e-6, bonds, blend.config)
+    assert key != cache.key(atoms, coordinates, None, blend.config)
+    # File paths and verbosity are ignored
+    blend.config['pdb']['filepath'], blend.config['img_file'], blend.config['verbose'] = 'a.pdb', 'a.png', True
+    assert key == cache.key(atoms, coordinates, bonds, blend.config)
+    blend.configure(resolution=(100, 100))
+    assert key != cache.key(atoms, coordinates, bonds, blend.config)
+
+
+def test_render_cache_lru_eviction(tmpdir):
+    """Tests cached images are copied back and least recently used images are evicted."""
+    cache = RenderCache(os.path.join(str(tmpdir), 'cache'), max_size=25)
+    images = []
+    for i in range(3):
+        images.append(os.path.join(str(tmpdir), '%i.png' % i))
+        with open(images[-1], 'w') as img:
+            img.write('%i' % i * 10)
+    keys = [cache.key(atoms, coordinates + i, bonds) for i in range(3)]
+    cache.put(keys[0], images[0])
+    cache.put(keys[1], images[1])
+    assert cache.size() == 20
+    past = time.time() - 100
+    os.utime(cache.path(keys[0], images[0]), (past, past))
+    os.utime(cache.path(keys[1], images[1]), (past - 10, past - 10))
+    # Access image 1 so that image 0 becomes least recently used
+    copy_file = os.path.join(str(tmpdir), 'copy.png')
+    assert cache.get(keys[1], copy_file)
+    with open(copy_file, 'r') as img:
+        assert img.read() == '1' * 10
+    cache.put(keys[2], images[2])
+    assert cache.size() == 20
+    assert not cache.get(keys[0], copy_file)
+    assert cache.get(keys[1], copy_file) and cache.get(keys[2], copy_file)
+    assert not cache.get(keys[1], os.path.join(str(tmpdir), 'copy.svg'))
+    cache.clear()
+    assert cache.size() == 0
@@ -0,0 +1,120 @@
+"""
+--- Ångström ---
+Tests rendering trajectory frames with a stub Blender executable.
+"""
+from angstrom import Trajectory
+from angstrom.visualize.blender import Blender
+from angstrom.visualize.render import render_frames, render_image
+from angstrom.visualize.cache import RenderCache
+import numpy as np
+import pytest
+import stat
+import sys
+import os
+
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+# Stub Blender writes the x coordinate of the first atom of each frame as the image
+STUB_BLENDER = """#!%s
+import pickle, sys
+import numpy as np
+config = pickle.load(open(sys.argv[-1], 'rb'))
+if '%s' == 'fail':
+    sys.exit(1)
+if '%s' == 'silent':
+    sys.exit(0)
+with open(sys.argv[0] + '.log', 'a') as log:
+    log.write('run\\n')
+if config['frames']:
+    for coordinates, img_file in zip(np.load(config['frames']), config['images']):
+        open(img_file, 'w').write('%%.3f' %% coordinates[0, 0])
+else:
+    atom = [line for line in open(config['pdb']['filepath']) if line.startswith('HETATM')][0]
+    open(config['img_file'], 'w').write('%%.3f' %% float(atom[30:38]))
+"""
+
+
+def stub_blender(directory, mode='ok'):
+    """Returns Blender renderer using a stub executable (mode: ok | fail | silent -> no image is written)."""
+    executable = os.path.join(directory, 'blender-%s' % mode)
+    with open(executable, 'w') as stub:
+        stub.write(STUB_BLENDER % (sys.executable, mode, mode))
+    os.chmod(executable, os.stat(executable).st_mode | stat.S_IEXEC)
+    blend = Blender()
+    blend.configure(executable=executable)
+    return blend
+
+
+def read_images(images):
+    return [float(open(img).read()) for img in images]
+
+
+def test_render_frames_in_order(tmpdir):
+    """Tests frames are rendered in order in batch and per frame mode with multiple workers."""
+    traj = Trajectory(read=benzene_traj_x)[:10]
+    images = [os.path.join(str(tmpdir), '%i.png' % i) for i in range(len(traj))]
+    for batch in [True, False]:
+        render_frames(traj, images, stub_blender(str(tmpdir)), batch=batch, workers=3)
+        assert np.allclose(read_images(images), traj.coordinates[:, 0, 0], atol=1e-3)
+        for img in images:
+            os.remove(img)
+
+
+def test_failed_render_raises_exception(tmpdir):
+    """Tests a failed Blender subprocess raises an exception."""
+    traj = Trajectory(read=benzene_traj_x)[:4]
+    images = [os.path.join(str(tmpdir), '%i.png' % i) for i in range(len(traj))]
+    for batch in [True, False]:
+        with pytest.raises(Exception):
+            render_frames(traj, images, stub_blender(str(tmpdir), mode='fail'), batch=batch, workers=2)
+
+
+def count_runs(renderer):
+    """Returns number of successful stub Blender runs."""
+    log_file = renderer.config['executable'] + '.log'
+    return len(open(log_file).readlines()) if os.path.exists(log_file) else 0
+
+
+def test_render_frames_cache(tmpdir):
+    """Tests cached frames are not rendered and only changed frames are rendered again."""
+    traj = Trajectory(read=benzene_traj_x)[:6]
+    cache = RenderCache(os.path.join(str(tmpdir), 'cache'))
+    images = [os.path.join(str(tmpdir), '%i.png' % i) for i in range(len(traj))]
+    blend = stub_blender(str(tmpdir))
+    render_frames(traj, images, blend, batch=False, workers=2, cache=cache)
+    assert count_runs(blend) == 6
+    render_frames(traj, images, blend, batch=False, workers=2, cache=cache)
+    assert count_runs(blend) == 6
+    assert np.allclose(read_images(images), traj.coordinates[:, 0, 0], atol=1e-3)
+    traj.coordinates[2] += 1
+    render_frames(traj, images, blend, batch=True, workers=2, cache=cache)
+    assert count_runs(blend) == 7
+    assert np.allclose(read_images(images), traj.coordinates[:, 0, 0], atol=1e-3)
+
+
+def test_failed_render_is_not_cached(tmpdir):
+    """Tests an old image is not cached when rendering fails."""
+    traj = Trajectory(read=benzene_traj_x)
+    cache = RenderCache(os.path.join(str(tmpdir), 'cache'))
+    img_file = os.path.join(str(tmpdir), 'benzene.png')
+    open(img_file, 'w').write('old image')
+    with pytest.raises(Exception):
+        render_image(traj[0], img_file, stub_blender(str(tmpdir), mode='fail'), cache=cache)
+    assert cache.size() == 0
+    images = [img_file] + [os.path.join(str(tmpdir), '%i.png' % i) for i in range(1, 3)]
+    open(img_file, 'w').write('old image')
+    with pytest.raises(Exception):
+        render_frames(traj[:3], images, stub_blender(str(tmpdir), mode='fail'), cache=cache)
+    assert cache.size() == 0
+    # Renderer exits without error but does not write the image
+    open(img_file, 'w').write('old image')
+    render_image(traj[0], img_file, stub_blender(str(tmpdir), mode='silent'), cache=cache)
+    open(images[0], 'w').write('old image')
+    render_frames(traj[:3], images, stub_blender(str(tmpdir), mode='silent'), cache=cache)
+    assert cache.size() == 0
+    blend = stub_blender(str(tmpdir))
+    render_image(traj[0], img_file, blend, cache=cache)
+    render_image(traj[0], img_file, blend, cache=cache)
+    assert count_runs(blend) == 1 and cache.size() > 0
+    assert np.isclose(read_images([img_file])[0], traj.coordinates[0, 0, 0], atol=1e-3)
@@ -3,6 +3,7 @@
 Tests appending molecule to trajectory.
 """
 import os
+import numpy as np
 from angstrom import Trajectory, Molecule
 
 
@@ -21,3 +22,34 @@ def test_trajectory_append_molecule():
     assert benzene_traj.atoms.shape[1] == len(benzene_mol)
     assert benzene_traj.coordinates.shape[0] == n_frames + 1
     assert benzene_traj.coordinates.shape[1] == len(benzene_mol)
+
+
+def test_trajectory_append_to_empty_trajectory_and_growth():
+    """Tests appending molecules to an empty trajectory using buffers."""
+    benzene_mol = Molecule(read=benzene_xyz)
+    traj = Trajectory()
+    for i in range(20):
+        benzene_mol.translate([1, 0, 0])
+        traj.append(benzene_mol)
+    assert len(traj) == 20
+    assert traj.coordinates.shape == (20, 12, 3)
+    assert traj.atoms.shape == (20, 12)
+    assert np.allclose(traj.coordinates[19] - traj.coordinates[0], [19, 0, 0])
+    # Earlier frames are not affected by appending
+    first_frames = traj.coordinates
+    traj.append(benzene_mol)
+    assert len(first_frames) == 20
+    assert np.allclose(traj.coordinates[:20], first_frames)
+
+
+def test_trajectory_slicing_should_return_views():
+    """Tests slicing trajectory without copying frames."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_slice = benzene_traj[2:10:2]
+    assert np.shares_memory(benzene_slice.coordinates, benzene_traj.coordinates)
+    assert len(benzene_slice.headers) == 4
+    # Appending to a slice should not modify the original trajectory
+    benzene_slice.append(Molecule(read=benzene_xyz))
+    assert len(benzene_slice) == 5
+    assert len(benzene_traj) == 50
+    assert not np.shares_memory(benzene_slice.coordinates, benzene_traj.coordinates)
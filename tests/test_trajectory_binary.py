@@ -0,0 +1,55 @@
+"""
+--- Ångström ---
+Tests binary trajectory format.
+"""
+from angstrom import Trajectory
+from angstrom.trajectory import xyz_to_binary, binary_to_xyz
+from angstrom.trajectory.binary import read_binary_traj
+import numpy as np
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_binary_trajectory_round_trip(tmpdir):
+    """Tests converting xyz trajectory to binary and back."""
+    binary_file = os.path.join(str(tmpdir), 'benzene.atraj')
+    xyz_file = os.path.join(str(tmpdir), 'benzene.xyz')
+    xyz_to_binary(benzene_traj_x, binary_file, dtype='float64')
+    binary_to_xyz(binary_file, xyz_file)
+    benzene_traj, converted_traj = Trajectory(read=benzene_traj_x), Trajectory(read=xyz_file)
+    assert np.allclose(benzene_traj.coordinates, converted_traj.coordinates)
+    assert np.all(benzene_traj.atoms == converted_traj.atoms)
+    assert list(benzene_traj.headers) == list(converted_traj.headers)
+
+
+def test_binary_trajectory_memory_map(tmpdir):
+    """Tests reading binary trajectory with memory-mapped coordinates."""
+    binary_file = os.path.join(str(tmpdir), 'benzene-traj-x.atraj')
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_traj.write(binary_file)
+    traj = read_binary_traj(binary_file)
+    assert isinstance(traj['coordinates'], np.memmap)
+    assert traj['coordinates'].dtype == np.float32
+    assert len(traj['index']) == 50
+    binary_traj = Trajectory(read=binary_file)
+    assert binary_traj.name == 'benzene-traj-x'
+    assert len(binary_traj) == 50
+    assert np.shape(binary_traj.atoms) == (50, 12)
+    assert np.allclose(binary_traj.coordinates, benzene_traj.coordinates, atol=1e-5)
+    assert np.allclose(binary_traj[7].coordinates, benzene_traj[7].coordinates, atol=1e-5)
+    assert list(binary_traj.headers) == list(benzene_traj.headers)
+
+
+def test_binary_trajectory_in_place_edit(tmpdir):
+    """Tests modifying frames of a memory-mapped binary trajectory does not change the file."""
+    binary_file = os.path.join(str(tmpdir), 'benzene-traj-x.atraj')
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_traj.write(binary_file)
+    binary_traj = Trajectory(read=binary_file)
+    frame = binary_traj[3]
+    frame.translate([1, 2, 3])
+    assert np.allclose(frame.coordinates, benzene_traj.coordinates[3] + [1, 2, 3], atol=1e-5)
+    frame.center()
+    assert np.allclose(frame.get_center(), [0, 0, 0], atol=1e-5)
+    assert np.allclose(Trajectory(read=binary_file).coordinates, benzene_traj.coordinates, atol=1e-5)
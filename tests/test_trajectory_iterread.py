@@ -0,0 +1,36 @@
+"""
+--- Ångström ---
+Tests streaming frames of xyz trajectory.
+"""
+from angstrom import Trajectory, Molecule
+import numpy as np
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_iterread_molecules_should_match_trajectory():
+    """Tests streaming trajectory frames as Molecule objects."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    n_frames = 0
+    for frame_idx, mol in enumerate(Trajectory.iterread(benzene_traj_x)):
+        assert isinstance(mol, Molecule)
+        assert np.allclose(mol.coordinates, benzene_traj.coordinates[frame_idx])
+        assert list(mol.atoms) == list(benzene_traj.atoms[frame_idx])
+        assert np.allclose(mol.get_center(), benzene_traj[frame_idx].get_center())
+        n_frames += 1
+    assert n_frames == len(benzene_traj)
+
+
+def test_iterread_chunks_with_stride_start_and_stop():
+    """Tests streaming trajectory frames in chunks."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    chunks = [c.copy() for c in Trajectory.iterread(benzene_traj_x, chunk=4, stride=3, start=2, stop=40)]
+    assert [len(c) for c in chunks] == [4, 4, 4, 1]
+    assert np.allclose(np.concatenate(chunks), benzene_traj.coordinates[2:40:3])
+
+
+def test_iterread_should_reuse_buffer():
+    """Tests streaming trajectory frames uses a single buffer."""
+    buffers = set(id(c.base if c.base is not None else c) for c in Trajectory.iterread(benzene_traj_x, chunk=7))
+    assert len(buffers) == 1
@@ -0,0 +1,44 @@
+"""
+--- Ångström ---
+Tests lazy reading of xyz trajectory.
+"""
+from angstrom import Trajectory, Molecule
+import numpy as np
+import shutil
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_lazy_trajectory_should_match_trajectory(tmpdir):
+    """Tests lazy reading xyz formatted trajectory and the saved frame index."""
+    traj_file = os.path.join(str(tmpdir), 'benzene-traj-x.xyz')
+    shutil.copy(benzene_traj_x, traj_file)
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    lazy_traj = Trajectory(read=traj_file, lazy=True)
+    assert os.path.exists(traj_file + '.idx')
+    assert len(lazy_traj) == len(benzene_traj) == 50
+    assert np.shape(lazy_traj.coordinates) == (50, 12, 3)
+    assert lazy_traj.headers[3] == benzene_traj.headers[3]
+    for frame_idx, frame in enumerate(lazy_traj):
+        assert isinstance(frame, Molecule)
+        assert np.allclose(frame.coordinates, benzene_traj.coordinates[frame_idx])
+        assert list(frame.atoms) == list(benzene_traj.atoms[frame_idx])
+    assert np.allclose(lazy_traj[-1].coordinates, benzene_traj.coordinates[-1])
+    assert np.allclose(lazy_traj.get_center(), benzene_traj.get_center())
+    # Reading again uses the saved index
+    assert len(Trajectory(read=traj_file, lazy=True)) == 50
+
+
+def test_lazy_trajectory_slicing(tmpdir):
+    """Tests slicing lazily read trajectory."""
+    traj_file = os.path.join(str(tmpdir), 'benzene-traj-x.xyz')
+    shutil.copy(benzene_traj_x, traj_file)
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    lazy_traj = Trajectory(read=traj_file, lazy=True)
+    lazy_slice = lazy_traj[5:40:7]
+    assert isinstance(lazy_slice, Trajectory)
+    assert lazy_slice.reader is not None
+    assert len(lazy_slice) == len(range(5, 40, 7))
+    assert np.allclose(lazy_slice.coordinates[:], benzene_traj.coordinates[5:40:7])
+    assert lazy_traj[10:5] == []
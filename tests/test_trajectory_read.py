@@ -28,3 +28,16 @@ def test_read_xyz_benzene_trajectory():
         assert len(frame.coordinates) == 12
         for atom, ref_atom in zip(frame.atoms, benzene_atoms):
             assert atom == ref_atom
+
+
+def test_read_xyz_trajectory_matches_frame_by_frame_parsing():
+    """Tests bulk parsing of xyz trajectory against parsing each line separately"""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    with open(benzene_traj_x, 'r') as f:
+        lines = f.readlines()
+    for frame in [0, 17, 49]:
+        start = frame * 14
+        assert benzene_traj.headers[frame] == lines[start + 1].strip()
+        for i, line in enumerate(lines[start + 2:start + 14]):
+            assert benzene_traj.atoms[frame][i] == line.split()[0]
+            assert np.allclose(benzene_traj.coordinates[frame][i], [float(j) for j in line.split()[1:4]])
@@ -0,0 +1,38 @@
+"""
+--- Ångström ---
+Tests Trajectory reflection.
+"""
+from angstrom import Trajectory
+from angstrom.geometry import Plane
+import numpy as np
+import os
+
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+
+
+def test_trajectory_reflection_matches_molecule_reflection():
+    traj = Trajectory(read=benzene_traj_x)
+    ref = []
+    for mol in traj:
+        mol.reflect('yz', translate=2)
+        ref.append(mol.coordinates)
+    coordinates = traj.coordinates
+    traj.reflect('yz', translate=2)
+    assert traj.coordinates is coordinates
+    assert np.allclose(traj.coordinates, ref)
+    plane = Plane([0, 0, 0], [1, 1, 0], [0, 1, 1])
+    traj.reflect(plane)
+    traj.reflect([[0, 0, 0], [1, 1, 0], [0, 1, 1]])
+    assert np.allclose(traj.coordinates, ref)
+
+
+def test_memory_mapped_trajectory_reflection(tmpdir):
+    traj = Trajectory(read=benzene_traj_x)
+    traj_file = os.path.join(str(tmpdir), 'benzene.atraj')
+    traj.write(traj_file, dtype='float64')
+    traj_mmap = Trajectory(read=traj_file)
+    traj_mmap.reflect('xy')
+    traj.reflect('xy')
+    assert np.allclose(traj_mmap.coordinates, traj.coordinates)
+    assert np.allclose(Trajectory(read=traj_file).coordinates[:, :, :2], traj.coordinates[:, :, :2])
@@ -0,0 +1,51 @@
+"""
+--- Ångström ---
+Tests shared topology of a Trajectory.
+"""
+from angstrom import Trajectory, Molecule
+import numpy as np
+import pytest
+import os
+
+benzene_traj_x = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene-traj-x.xyz')
+benzene_xyz = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'benzene.xyz')
+
+
+def test_constant_composition_should_use_shared_topology():
+    """Tests storing atoms once for a trajectory with constant composition."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    assert benzene_traj.topology.shape == (12,)
+    assert benzene_traj.atoms.shape == (50, 12)
+    assert np.all(benzene_traj.atoms[7] == benzene_traj.topology)
+    frame = benzene_traj[3]
+    # Frames get a read-only view of the shared topology
+    assert np.shares_memory(frame.atoms, benzene_traj.topology)
+    assert np.shares_memory(frame.coordinates, benzene_traj.coordinates)
+    with pytest.raises(ValueError):
+        frame.atoms[0] = 'N'
+    assert benzene_traj.topology[0] == 'C'
+    frame.atoms = ['N'] + list(frame.atoms[1:])
+    assert frame.codes[0] == 7 and benzene_traj.topology[0] == 'C'
+
+
+def test_shared_bonds_should_be_assigned_to_frames():
+    """Tests sharing bonds between trajectory frames."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    benzene_traj.get_bonds()
+    assert len(benzene_traj.bonds) == 12
+    assert benzene_traj[10].bonds == benzene_traj.bonds
+    assert benzene_traj[10:20][0].bonds == benzene_traj.bonds
+
+
+def test_varying_composition_should_store_atoms_per_frame():
+    """Tests storing atoms for each frame when composition changes."""
+    benzene_traj = Trajectory(read=benzene_traj_x)
+    mol = Molecule(read=benzene_xyz)
+    mol.atoms = np.array(mol.atoms)
+    mol.atoms[0] = 'N'
+    benzene_traj.append(mol)
+    assert benzene_traj.topology is None
+    assert benzene_traj.atoms.shape == (51, 12)
+    assert benzene_traj.atoms[50][0] == 'N'
+    assert benzene_traj.atoms[49][0] == 'C'
+    assert benzene_traj[50].atoms[0] == 'N'
@@ -0,0 +1,68 @@
+"""
+--- Ångström ---
+Tests virtual (lazy) supercell of a molecule object.
+"""
+from angstrom import Molecule
+from angstrom.molecule import VirtualSupercell
+import numpy as np
+import os
+
+
+piyzaz111_xyz = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'PIYZAZ_111.xyz')
+piyzaz_cell_parameters = [8.9950, 8.9950, 8.9950, 60, 60, 60]
+
+
+def get_piyzaz():
+    piyzaz = Molecule(read=piyzaz111_xyz)
+    piyzaz.set_cell(piyzaz_cell_parameters)
+    return piyzaz
+
+
+def test_virtual_supercell_images_match_replicate():
+    """Tests virtual supercell image coordinates against the replicated molecule."""
+    piyzaz = get_piyzaz()
+    for center in [True, False]:
+        piyzaz231 = piyzaz.replicate([2, 3, 1], center=center)
+        virtual = piyzaz.replicate([2, 3, 1], center=center, virtual=True)
+        assert isinstance(virtual, VirtualSupercell)
+        assert len(virtual) == len(piyzaz231.atoms)
+        n_atoms = len(piyzaz.atoms)
+        for image in range(virtual.n_images):
+            image_mol = virtual[image]
+            assert np.allclose(image_mol.coordinates, piyzaz231.coordinates[image * n_atoms:(image + 1) * n_atoms])
+        sliced = virtual[2:5]
+        assert np.allclose(sliced.coordinates, piyzaz231.coordinates[2 * n_atoms:5 * n_atoms])
+        assert np.all(sliced.atoms == piyzaz231.atoms[2 * n_atoms:5 * n_atoms])
+        supermol = virtual.to_molecule()
+        assert np.allclose(supermol.coordinates, piyzaz231.coordinates)
+        assert supermol.cell.a == piyzaz231.cell.a
+
+
+def test_virtual_supercell_streamed_write(tmpdir):
+    """Tests streamed writing of a virtual supercell gives the same file as the replicated molecule."""
+    piyzaz = get_piyzaz()
+    piyzaz222 = piyzaz.replicate([2, 2, 2])
+    virtual = piyzaz.replicate([2, 2, 2], virtual=True)
+    for extension in ['xyz', 'pdb', 'cif']:
+        ref_file = os.path.join(tmpdir, 'ref.%s' % extension)
+        virtual_file = os.path.join(tmpdir, 'virtual.%s' % extension)
+        piyzaz222.write(ref_file, cell=piyzaz222.cell.to_list())
+        virtual.write(virtual_file)
+        with open(ref_file, 'r') as f_ref, open(virtual_file, 'r') as f_virtual:
+            assert f_ref.read() == f_virtual.read()
+
+
+def test_virtual_supercell_bonds():
+    """Tests virtual supercell bonds from unit cell periodic bonds against the replicated molecule."""
+    piyzaz = get_piyzaz()
+    piyzaz222 = piyzaz.replicate([2, 2, 2], center=False)
+    piyzaz222.get_bonds()
+    virtual = piyzaz.replicate([2, 2, 2], center=False, virtual=True)
+    virtual.get_bonds()
+    assert virtual.bonds == piyzaz222.bonds
+
+    # Periodic supercell bonds are the same as periodic bonds calculated for the supercell
+    virtual.get_bonds(periodic=True)
+    piyzaz222.get_bonds(periodic=True)
+    assert virtual.bonds == piyzaz222.bonds
+    assert np.all(virtual.bond_images == piyzaz222.bond_images)